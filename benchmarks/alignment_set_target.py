@@ -0,0 +1,47 @@
+r"""
+Compare the throughput of ``set_target`` on 2D :map:`AlignmentSimilarity` and
+:map:`AlignmentAffine` transforms with re-estimating the alignment from
+scratch on every update (the implementation before the source statistics
+were cached).
+
+Run from the root of the repository, with menpo installed (for instance
+with ``pip install -e .``)::
+
+    python benchmarks/alignment_set_target.py
+"""
+from timeit import repeat
+
+import numpy as np
+
+from menpo.shape import PointCloud
+from menpo.transform import AlignmentSimilarity, AlignmentAffine
+from menpo.transform.homogeneous.similarity import procrustes_alignment
+
+
+def affine_alignment(source, target):
+    # The implementation of AlignmentAffine before the projector was cached
+    a = source.h_points()
+    b = target.h_points()
+    return np.linalg.solve(np.dot(a, a.T), np.dot(a, b.T)).T
+
+
+def best_time(f, n_runs):
+    return min(repeat(f, number=n_runs, repeat=5)) / n_runs
+
+
+if __name__ == '__main__':
+    print('{:>10} {:>14} {:>14} {:>14} {:>14}'.format(
+        'n_points', 'procrustes', 'similarity', 'affine solve', 'affine'))
+    for n_points in [10, 68, 100, 1000, 10000]:
+        source = PointCloud(np.random.rand(n_points, 2))
+        target = PointCloud(np.random.rand(n_points, 2))
+        similarity = AlignmentSimilarity(source, target)
+        affine = AlignmentAffine(source, target)
+        n_runs = max(10, 100000 // n_points)
+        times = [
+            best_time(lambda: procrustes_alignment(source, target), n_runs),
+            best_time(lambda: similarity.set_target(target), n_runs),
+            best_time(lambda: affine_alignment(source, target), n_runs),
+            best_time(lambda: affine.set_target(target), n_runs)]
+        print('{:>10} '.format(n_points) +
+              ' '.join('{:>11.2f} us'.format(t * 1e6) for t in times))
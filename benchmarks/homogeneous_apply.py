@@ -0,0 +1,45 @@
+r"""
+Compare applying an affine transform through the general homogeneous path
+(append a column of ones, multiply by the full ``h_matrix`` and divide by the
+homogeneous coordinate) with the affine fast path, with and without an
+``out`` buffer.
+
+Run from the root of the repository, with menpo installed (for instance
+with ``pip install -e .``)::
+
+    python benchmarks/homogeneous_apply.py
+"""
+from timeit import repeat
+
+import numpy as np
+
+from menpo.transform import Affine
+
+
+def homogeneous_apply(x, h_matrix):
+    # The implementation of Homogeneous._apply before the affine fast path
+    h_x = np.hstack([x, np.ones([x.shape[0], 1])])
+    h_y = h_x.dot(h_matrix.T)
+    return (h_y / h_y[:, -1][:, None])[:, :-1]
+
+
+def best_time(f, n_runs):
+    return min(repeat(f, number=n_runs, repeat=5)) / n_runs
+
+
+if __name__ == '__main__':
+    transform = Affine.init_from_2d_shear(10, 5).compose_before(
+        Affine(np.array([[2., 0, 3], [0, 1.5, -1], [0, 0, 1]])))
+    h_matrix = transform.h_matrix
+    print('{:>10} {:>14} {:>14} {:>14}'.format('n_points', 'homogeneous',
+                                               'affine', 'affine out='))
+    for n_points in [10, 100, 1000, 10000, 100000, 1000000]:
+        x = np.random.rand(n_points, 2)
+        out = np.empty_like(x)
+        n_runs = max(1, 100000 // n_points)
+        times = [
+            best_time(lambda: homogeneous_apply(x, h_matrix), n_runs),
+            best_time(lambda: transform.apply(x), n_runs),
+            best_time(lambda: transform.apply(x, out=out), n_runs)]
+        print('{:>10} '.format(n_points) +
+              ' '.join('{:>11.2f} us'.format(t * 1e6) for t in times))
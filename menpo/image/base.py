@@ -12,7 +12,7 @@ from menpo.shape import PointCloud, bounding_box
 from menpo.landmark import Landmarkable
 from menpo.transform import (Translation, NonUniformScale, Rotation,
                              AlignmentUniformScale, Affine, scale_about_centre,
-                             transform_about_centre)
+                             transform_about_centre, TransformChain)
 from menpo.visualize.base import ImageViewer, LandmarkableViewable, Viewable
 
 from .interpolation import scipy_interpolation, cython_interpolation
@@ -169,6 +169,148 @@ def denormalize_pixels_range(pixels, out_dtype):
     return (pixels * max_range).astype(out_dtype)
 
 
+# Integer values are only counted (rather than sorted) when each channel
+# spans at most this many values, so the counts stay small whatever the dtype
+_MAX_COUNTED_SPAN = 2 ** 16
+
+
+def _integer_range(values):
+    r"""
+    The smallest value and the number of distinct values that could be present
+    (the span) of integer values.
+
+    Parameters
+    ----------
+    values : ``(n_channels, n_samples)`` `ndarray`
+        The integer values.
+
+    Returns
+    -------
+    v_min : `int`
+        The smallest value across all of the channels.
+    span : `int`
+        ``v_max - v_min + 1``, computed without overflow.
+    """
+    v_min = int(values.min())
+    return v_min, int(values.max()) - v_min + 1
+
+
+def _integer_channel_counts(values, v_min, span):
+    r"""
+    Count the occurrences of every integer value of each channel with a single
+    :func:`numpy.bincount`.
+
+    Parameters
+    ----------
+    values : ``(n_channels, n_samples)`` `ndarray`
+        The integer values to count.
+    v_min : `int`
+        The smallest value across all of the channels.
+    span : `int`
+        The number of values from the smallest to the largest value.
+
+    Returns
+    -------
+    counts : ``(n_channels, span)`` `ndarray`
+        The number of occurrences of the value ``v_min + i`` in each channel.
+    """
+    n_channels = values.shape[0]
+    # Subtract the minimum in the original dtype (it cannot overflow), so the
+    # offsets never promote the values to float
+    shifted = (values - values.dtype.type(v_min)).astype(np.int64)
+    # Offset each channel so that all channels are counted in one pass
+    offsets = (np.arange(n_channels, dtype=np.int64) * span)[:, None]
+    counts = np.bincount((shifted + offsets).ravel(),
+                         minlength=n_channels * span)
+    return counts.reshape(n_channels, span)
+
+
+def _unique_integer_histogram(values, v_min, span):
+    r"""
+    Compute, for each channel, the histogram of integer values whose bin edges
+    are the unique values of that channel. The result is identical to calling
+    ``np.histogram(x, bins=np.unique(x))`` per channel, but is computed by
+    counting rather than sorting.
+
+    Parameters
+    ----------
+    values : ``(n_channels, n_samples)`` `ndarray`
+        The integer values to bin.
+    v_min : `int`
+        The smallest value across all of the channels.
+    span : `int`
+        The number of values from the smallest to the largest value.
+
+    Returns
+    -------
+    hist : `list` of `ndarray`
+        The histogram of each channel.
+    bin_edges : `list` of `ndarray`
+        The bin edges of each channel.
+    """
+    counts = _integer_channel_counts(values, v_min, span)
+    hist, bin_edges = [], []
+    for c in counts:
+        present = np.flatnonzero(c)
+        h = c[present]
+        # The final bin of a histogram is closed, so it counts the two largest
+        # unique values.
+        if h.size > 1:
+            h[-2] += h[-1]
+        hist.append(h[:-1])
+        # add in the original dtype, as large 64 bit values lose precision
+        # as floats
+        bin_edges.append(present.astype(values.dtype) +
+                         values.dtype.type(v_min))
+    return hist, bin_edges
+
+
+def _uniform_integer_histogram(values, n_bins, v_min, span):
+    r"""
+    Compute, for each channel, the histogram of integer values in ``n_bins``
+    equal width bins spanning the range of that channel. The result is
+    identical to calling ``np.histogram(x, bins=n_bins)`` per channel, but
+    only the distinct values (rather than every sample) are assigned to bins.
+
+    Parameters
+    ----------
+    values : ``(n_channels, n_samples)`` `ndarray`
+        The integer values to bin.
+    n_bins : `int`
+        The number of bins.
+    v_min : `int`
+        The smallest value across all of the channels.
+    span : `int`
+        The number of values from the smallest to the largest value.
+
+    Returns
+    -------
+    hist : `list` of `ndarray`
+        The histogram of each channel.
+    bin_edges : `list` of `ndarray`
+        The bin edges of each channel.
+    """
+    counts = _integer_channel_counts(values, v_min, span)
+    grid = np.arange(counts.shape[1], dtype=np.float) + v_min
+    hist, bin_edges = [], []
+    for c in counts:
+        present = np.flatnonzero(c)
+        first, last = grid[present[0]], grid[present[-1]]
+        if first == last:
+            first, last = first - 0.5, last + 0.5
+        edges = np.linspace(first, last, n_bins + 1)
+        # Assign each distinct value to a bin exactly as np.histogram does
+        v = grid[present]
+        indices = ((v - first) * (n_bins / (last - first))).astype(np.intp)
+        indices[indices == n_bins] -= 1
+        indices[v < edges[indices]] -= 1
+        indices[(v >= edges[indices + 1]) & (indices != n_bins - 1)] += 1
+        h = np.bincount(indices, weights=c[present], minlength=n_bins)
+        hist.append(h.astype(np.intp))
+        bin_edges.append(edges)
+    return hist, bin_edges
+
+
 def channels_to_back(pixels):
     r"""
     Roll the channels from the front to the back for an image. If the image
@@ -684,6 +826,12 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
         r"""
         Histogram binning of the values of this image.
 
+        Images with integer pixels of a narrow range (e.g. any `uint8` image)
+        are binned by counting the occurrences of each value across all
+        channels at once, so neither ``bins='unique'`` nor an integer number
+        of bins requires a sort. Wider ranges are binned with
+        `numpy.histogram`.
+
         Parameters
         ----------
         keep_channels : `bool`, optional
@@ -734,20 +882,32 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
                              "sequence of scalars.")
         # compute histogram
         vec = self.as_vector(keep_channels=keep_channels)
-        if len(vec.shape) == 1 or vec.shape[0] == 1:
+        single_channel = len(vec.shape) == 1 or vec.shape[0] == 1
+        vec = vec.reshape(-1, vec.shape[-1])
+        countable = False
+        if (isinstance(bins, int) and vec.size > 0 and
+                np.issubdtype(vec.dtype, np.integer)):
+            v_min, span = _integer_range(vec)
+            countable = span <= _MAX_COUNTED_SPAN
+        if countable:
+            # Integer pixels (e.g. uint8) can be counted rather than sorted
             if bins == 0:
-                bins = np.unique(vec)
-            hist, bin_edges = np.histogram(vec, bins=bins)
+                hist, bin_edges = _unique_integer_histogram(vec, v_min, span)
+            else:
+                hist, bin_edges = _uniform_integer_histogram(vec, bins, v_min,
+                                                             span)
         else:
             hist = []
             bin_edges = []
             num_bins = bins
             for ch in range(vec.shape[0]):
-                if bins == 0:
+                if isinstance(bins, int) and bins == 0:
                     num_bins = np.unique(vec[ch, :])
                 h_tmp, c_tmp = np.histogram(vec[ch, :], bins=num_bins)
                 hist.append(h_tmp)
                 bin_edges.append(c_tmp)
+        if single_channel:
+            return hist[0], bin_edges[0]
         return hist, bin_edges
 
     def _view_2d(self, figure_id=None, new_figure=False, channels=None,
@@ -1804,17 +1964,21 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
             `return_transform` is ``True``.
         """
         template_shape = np.array(template_shape, dtype=np.int)
-        if (isinstance(transform, Affine) and order in range(4) and
+        sampling_transform = transform
+        if isinstance(transform, TransformChain):
+            # a chain of affine transforms can still take the fast path
+            sampling_transform = transform.collapse()
+        if (isinstance(sampling_transform, Affine) and order in range(4) and
             self.n_dims == 2):
 
             # we are going to be able to go fast.
 
-            if isinstance(transform, Translation) and order == 0:
+            if isinstance(sampling_transform, Translation) and order == 0:
                 # an integer translation (e.g. a crop) If this lies entirely
                 # in the bounds then we can just do a copy. We need to match
                 # the behavior of cython_interpolation exactly, which means
                 # matching its rounding behavior too:
-                t = transform.translation_component.copy()
+                t = sampling_transform.translation_component.copy()
                 pos_t = t > 0.0
                 t[pos_t] += 0.5
                 t[~pos_t] -= 0.5
@@ -1831,12 +1995,12 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
             # we couldn't do the crop, but skimage has an optimised Cython
             # interpolation for 2D affine warps - let's use that
             sampled = cython_interpolation(self.pixels, template_shape,
-                                           transform, order=order,
+                                           sampling_transform, order=order,
                                            mode=mode, cval=cval)
         else:
             template_points = indices_for_image_of_shape(template_shape)
-            points_to_sample = transform.apply(template_points,
-                                               batch_size=batch_size)
+            points_to_sample = sampling_transform.apply(template_points,
+                                                        batch_size=batch_size)
             sampled = self.sample(points_to_sample,
                                   order=order, mode=mode, cval=cval)
 
@@ -2885,7 +3049,8 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
         'pillow' backend is very fast, but not very flexible. The `matplotlib`
         backend should be feature compatible with other Menpo rendering methods,
         but is much slower due to the overhead of creating a figure to render
-        into.
+        into. The 'numpy' backend draws anti-aliased lines and markers directly
+        into the pixels and always returns an RGB image.
 
         Parameters
         ----------
@@ -2914,7 +3079,7 @@ class Image(Vectorizable, Landmarkable, Viewable, LandmarkableViewable):
             A Matplotlib style colour or a backend dependant colour.
         marker_edge_width : `int`, optional
             The width of the marker edge. Not all backends support this.
-        backend : {'matplotlib', 'pillow'}, optional
+        backend : {'matplotlib', 'pillow', 'numpy'}, optional
             The backend to use.
 
         Returns
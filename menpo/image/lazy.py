@@ -0,0 +1,143 @@
+import numpy as np
+
+from .base import Image
+
+
+class LazyImage(Image):
+    r"""
+    A proxy for an :map:`Image` whose pixels have not yet been loaded. Only
+    the header information (the shape and number of channels) is stored, so
+    querying properties such as :attr:`shape`, :attr:`n_channels` or
+    :attr:`landmarks` is cheap. The pixels are only loaded on the first
+    access to :attr:`pixels` (directly or through any method that uses them),
+    at which point this object becomes the :map:`Image` (or subclass) returned
+    by the loader. Any landmarks or path attached to the proxy are kept.
+    Therefore, ``isinstance(image, LazyImage)`` is ``True`` only until the
+    pixels have been loaded.
+
+    Parameters
+    ----------
+    loader : `callable`
+        A callable that returns the full :map:`Image` (or subclass). It is
+        called with no arguments unless arguments are given to :meth:`load`.
+    shape : `tuple`
+        The shape of the image that the loader will return (without the
+        channel axis).
+    n_channels : `int`
+        The number of channels of the image that the loader will return.
+    """
+
+    def __init__(self, loader, shape, n_channels):
+        # Skip Image.__init__ as there are no pixels to set
+        super(Image, self).__init__()
+        self._loader = loader
+        self._lazy_shape = tuple(shape)
+        self._lazy_n_channels = n_channels
+
+    def load(self, **kwargs):
+        r"""
+        Load the pixels now. Afterwards, this object is the :map:`Image` (or
+        subclass) returned by the loader, so it is also returned for
+        convenience.
+
+        Parameters
+        ----------
+        \**kwargs : `dict`, optional
+            Passed through to the loader.
+
+        Returns
+        -------
+        image : :map:`Image` or subclass
+            This object, now loaded.
+        """
+        self._load(**kwargs)
+        return self
+
+    def _load(self, **kwargs):
+        image = self._loader(**kwargs)
+        state = dict(image.__dict__)
+        # Keep any state attached to the proxy before it was loaded
+        if self._landmarks is not None:
+            state['_landmarks'] = self._landmarks
+        if 'path' in self.__dict__:
+            state['path'] = self.__dict__['path']
+        self.__dict__.clear()
+        self.__dict__.update(state)
+        self.__class__ = image.__class__
+
+    @property
+    def pixels(self):
+        r"""
+        The pixels of the image. Accessing them loads the image.
+
+        :type: ``(n_channels, M, N, ...)`` `ndarray`
+        """
+        self._load()
+        return self.pixels
+
+    @pixels.setter
+    def pixels(self, value):
+        self._load()
+        self.pixels = value
+
+    @property
+    def width(self):
+        r"""
+        The width of the image.
+
+        This is the width according to image semantics, and is thus the size
+        of the **last** dimension.
+
+        :type: `int`
+        """
+        return self.shape[-1]
+
+    @property
+    def height(self):
+        r"""
+        The height of the image.
+
+        This is the height according to image semantics, and is thus the size
+        of the **second to last** dimension.
+
+        :type: `int`
+        """
+        return self.shape[-2]
+
+    @property
+    def shape(self):
+        r"""
+        The shape of the image
+        (with ``n_channel`` values at each point).
+
+        :type: `tuple`
+        """
+        return self._lazy_shape
+
+    @property
+    def n_channels(self):
+        """
+        The number of channels on each pixel in the image.
+
+        :type: `int`
+        """
+        return self._lazy_n_channels
+
+    @property
+    def n_pixels(self):
+        r"""
+        Total number of pixels in the image ``(prod(shape),)``
+
+        :type: `int`
+        """
+        return int(np.prod(self.shape))
+
+    @property
+    def n_elements(self):
+        r"""
+        Total number of data points in the image
+        ``(prod(shape), n_channels)``
+
+        :type: `int`
+        """
+        return self.n_pixels * self.n_channels
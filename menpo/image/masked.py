@@ -2,15 +2,12 @@ from __future__ import division
 from warnings import warn
 import numpy as np
 
-binary_erosion = None  # expensive, from scipy.ndimage
-binary_dilation = None  # expensive, from scipy.ndimage
-
 from menpo.base import MenpoDeprecationWarning, copy_landmarks_and_path
 from menpo.transform import Translation
 from menpo.visualize.base import ImageViewer
 
 from .base import Image
-from .boolean import BooleanImage
+from .boolean import BooleanImage, _erode_mask, _dilate_mask
 
 
 class OutOfMaskSampleError(ValueError):
@@ -1227,11 +1224,8 @@ class MaskedImage(Image):
             boundary have been set to a particular value.
         """
         copy = self.copy()
-        global binary_erosion
-        if binary_erosion is None:
-            from scipy.ndimage import binary_erosion  # expensive
-        # Erode the edge of the mask in by one pixel
-        eroded_mask = binary_erosion(copy.mask.mask, iterations=n_pixels)
+        # Erode the edge of the mask in by n pixels
+        eroded_mask = _erode_mask(copy.mask.mask, n_pixels=n_pixels)
 
         # replace the eroded mask with the diff between the two
         # masks. This is only true in the region we want to nullify.
@@ -1257,14 +1251,10 @@ class MaskedImage(Image):
             The copy of the masked image in which the mask has been shrunk
             by n pixels along its boundary.
         """
-        global binary_erosion
-        if binary_erosion is None:
-            from scipy.ndimage import binary_erosion  # expensive
-        # Erode the edge of the mask in by one pixel
-        eroded_mask = binary_erosion(self.mask.mask, iterations=n_pixels)
-
         image = self.copy()
-        image.mask = BooleanImage(eroded_mask)
+        # Erode the edge of the mask in by n pixels, writing straight into
+        # the copied mask rather than building a new BooleanImage
+        image.mask.pixels[0] = _erode_mask(self.mask.mask, n_pixels=n_pixels)
         return image
 
     def dilate(self, n_pixels=1):
@@ -1284,14 +1274,10 @@ class MaskedImage(Image):
             The copy of the masked image in which the mask has been expanded
             by n pixels along its boundary.
         """
-        global binary_dilation
-        if binary_dilation is None:
-            from scipy.ndimage import binary_dilation  # expensive
-        # Erode the edge of the mask in by one pixel
-        dilated_mask = binary_dilation(self.mask.mask, iterations=n_pixels)
-
         image = self.copy()
-        image.mask = BooleanImage(dilated_mask)
+        # Dilate the edge of the mask out by n pixels, writing straight into
+        # the copied mask rather than building a new BooleanImage
+        image.mask.pixels[0] = _dilate_mask(self.mask.mask, n_pixels=n_pixels)
         return image
 
     def rasterize_landmarks(self, group=None, render_lines=True, line_style='-',
@@ -1314,7 +1300,8 @@ class MaskedImage(Image):
         'pillow' backend is very fast, but not very flexible. The `matplotlib`
         backend should be feature compatible with other Menpo rendering methods,
         but is much slower due to the overhead of creating a figure to render
-        into.
+        into. The 'numpy' backend draws anti-aliased lines and markers directly
+        into the pixels and always returns an RGB image.
 
         Images will always be rendered masked with a black background.
         If an unmasked image is required, please use :meth:`as_unmasked`.
@@ -1346,7 +1333,7 @@ class MaskedImage(Image):
             A Matplotlib style colour or a backend dependant colour.
         marker_edge_width : `int`, optional
             The width of the marker edge. Not all backends support this.
-        backend : {'matplotlib', 'pillow'}, optional
+        backend : {'matplotlib', 'pillow', 'numpy'}, optional
             The backend to use.
 
         Returns
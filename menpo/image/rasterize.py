@@ -3,6 +3,7 @@ import numpy as np
 
 from menpo.shape import TriMesh
 from menpo.image import Image
+from menpo.image.base import denormalize_pixels_range
 from menpo.compatibility import basestring
 
 
@@ -88,8 +89,17 @@ def _rasterize_matplotlib(image, pclouds, render_lines=True, line_style='-',
     return Image.init_from_channels_at_back(pixels_buffer[..., :3])
 
 
+# The single letter Matplotlib colours - resolved without importing Matplotlib
+_BASIC_COLOURS = {'b': (0.0, 0.0, 1.0), 'g': (0.0, 0.5, 0.0),
+                  'r': (1.0, 0.0, 0.0), 'c': (0.0, 0.75, 0.75),
+                  'm': (0.75, 0.0, 0.75), 'y': (0.75, 0.75, 0.0),
+                  'k': (0.0, 0.0, 0.0), 'w': (1.0, 1.0, 1.0)}
+
+
 def _parse_colour(x):
-    if isinstance(x, basestring):
+    if isinstance(x, basestring) and x in _BASIC_COLOURS:
+        x = _BASIC_COLOURS[x]
+    elif isinstance(x, basestring):
         from matplotlib.colors import ColorConverter
         c = ColorConverter()
         x = c.to_rgb(x)
@@ -160,8 +170,183 @@ def _rasterize_pillow(image, pclouds, render_lines=True, line_style='-',
         return Image(pixels)
 
 
+def _segment_distances(pixels, starts, ends):
+    r"""
+    The euclidean distance of each pixel to its corresponding line segment.
+    ``pixels`` is ``(n, k, 2)`` and ``starts`` and ``ends`` are ``(n, 2)``.
+    """
+    d = ends - starts
+    sq_len = np.sum(d ** 2, axis=-1)
+    # Degenerate segments are treated as a single point
+    sq_len[sq_len == 0] = 1
+    rel = pixels - starts[:, None, :]
+    t = np.clip(np.einsum('nkd,nd->nk', rel, d) / sq_len[:, None], 0, 1)
+    return np.sqrt(np.sum((rel - t[..., None] * d[:, None, :]) ** 2, axis=-1))
+
+
+def _window_offsets(radius):
+    r = int(np.ceil(radius))
+    return np.indices((2 * r + 1, 2 * r + 1)).reshape(2, -1).T - r
+
+
+def _accumulate_coverage(alpha, frame_shape, frames, pixels, coverage):
+    r"""
+    Max-accumulate the anti-aliased ``coverage`` of the integer ``pixels`` of
+    each of the ``frames`` into the flat ``alpha`` buffer. Returns the flat
+    indices that were touched.
+    """
+    h, w = frame_shape
+    valid = ((coverage > 0) & (pixels[..., 0] >= 0) & (pixels[..., 0] < h) &
+             (pixels[..., 1] >= 0) & (pixels[..., 1] < w))
+    frames = np.broadcast_to(frames[:, None], valid.shape)[valid]
+    pixels = pixels[valid]
+    flat = (frames * h + pixels[:, 0]) * w + pixels[:, 1]
+    np.maximum.at(alpha, flat, coverage[valid])
+    return np.unique(flat)
+
+
+def _line_coverage(alpha, frame_shape, points, edges, width):
+    n_frames = points.shape[0]
+    starts = points[:, edges[:, 0]].reshape(-1, 2)
+    ends = points[:, edges[:, 1]].reshape(-1, 2)
+    frames = np.repeat(np.arange(n_frames), edges.shape[0])
+
+    # Walk each segment at (at most) unit steps and consider the window of
+    # pixels around every step - so only pixels near the line are visited
+    n_steps = np.ceil(np.sqrt(np.sum((ends - starts) ** 2, axis=-1)))
+    n_steps = n_steps.astype(np.int) + 1
+    segment = np.repeat(np.arange(starts.shape[0]), n_steps)
+    first_step = np.cumsum(n_steps) - n_steps
+    t = ((np.arange(segment.shape[0]) - first_step[segment]) /
+         np.maximum(n_steps[segment] - 1, 1).astype(np.float))
+    steps = starts[segment] + t[:, None] * (ends - starts)[segment]
+
+    radius = width / 2.0
+    window = (np.round(steps).astype(np.int)[:, None, :] +
+              _window_offsets(radius + 1.5)[None])
+    dist = _segment_distances(window.astype(np.float), starts[segment],
+                              ends[segment])
+    coverage = np.clip(radius + 0.5 - dist, 0, 1)
+    return _accumulate_coverage(alpha, frame_shape, frames[segment], window,
+                                coverage)
+
+
+def _marker_coverage(alpha, frame_shape, points, marker_style, radius):
+    n_frames, n_points = points.shape[:2]
+    centres = points.reshape(-1, 2)
+    frames = np.repeat(np.arange(n_frames), n_points)
+
+    window = (np.round(centres).astype(np.int)[:, None, :] +
+              _window_offsets(radius + 1)[None])
+    rel = np.abs(window - centres[:, None, :])
+    if marker_style == 's':
+        dist = np.max(rel, axis=-1)
+    else:
+        dist = np.sqrt(np.sum(rel ** 2, axis=-1))
+    # Pixels whose centres lie within the radius are fully covered, matching
+    # the extent of the markers drawn by the Pillow backend
+    coverage = np.clip(radius + 1 - dist, 0, 1)
+    return _accumulate_coverage(alpha, frame_shape, frames, window, coverage)
+
+
+def _blend(pixels, alpha, touched, colour):
+    r"""
+    Alpha blend the uint8 ``colour`` into the ``touched`` flat indices of the
+    ``(n_frames, 3, height * width)`` uint8 pixels and reset the ``alpha``
+    buffer. Only the touched pixels are ever converted to floating point.
+    """
+    frames, flat = np.divmod(touched, pixels.shape[-1])
+    a = alpha[touched][:, None]
+    values = pixels[frames, :, flat].astype(np.float)
+    values += a * (colour[None, :] - values)
+    pixels[frames, :, flat] = np.round(values)
+    alpha[touched] = 0
+
+
+def _rasterize_numpy_frames(pixels, pclouds, render_lines=True,
+                            line_style='-', line_colour='b', line_width=1,
+                            render_markers=True, marker_style='o',
+                            marker_size=1, marker_face_colour='b',
+                            marker_edge_colour='b', marker_edge_width=1):
+    r"""
+    Rasterize directly into a ``(n_frames, 3, height, width)`` uint8 pixel
+    buffer. Each element of ``pclouds`` is a list of one pointcloud per frame
+    (all of which must have the same number of points). The pixels buffer is
+    modified in place.
+    """
+    if any(x != '-' for x in line_style):
+        raise ValueError("The numpy rasterizer only supports the '-' "
+                         "line style.")
+    if any(x not in {'o', '.', 's'} for x in marker_style):
+        raise ValueError("The numpy rasterizer only supports the 'o', '.' "
+                         "and 's' marker styles.")
+
+    frame_shape = pixels.shape[2:]
+    flat_pixels = pixels.reshape(pixels.shape[:2] + (-1,))
+    alpha = np.zeros(flat_pixels.shape[0] * flat_pixels.shape[2])
+    for k, frame_pclouds in enumerate(pclouds):
+        p = frame_pclouds[0]
+        if isinstance(p, TriMesh):
+            p = p.as_pointgraph()
+        try:
+            points = np.stack([f.points for f in frame_pclouds])
+        except ValueError:
+            raise ValueError('All the frames must have the same number of '
+                             'points in each landmark group.')
+
+        if (render_lines[k] and line_width[k] > 0 and
+                hasattr(p, 'edges') and p.edges.size > 0):
+            touched = _line_coverage(alpha, frame_shape, points, p.edges,
+                                     line_width[k])
+            _blend(flat_pixels, alpha, touched,
+                   np.array(_parse_colour(line_colour[k])))
+
+        if render_markers[k] and marker_size[k] > 0:
+            face_radius = marker_size[k]
+            if marker_edge_width[k] > 0:
+                touched = _marker_coverage(alpha, frame_shape, points,
+                                           marker_style[k], marker_size[k])
+                _blend(flat_pixels, alpha, touched,
+                       np.array(_parse_colour(marker_edge_colour[k])))
+                face_radius -= marker_edge_width[k]
+            if face_radius > 0:
+                touched = _marker_coverage(alpha, frame_shape, points,
+                                           marker_style[k], face_radius)
+                _blend(flat_pixels, alpha, touched,
+                       np.array(_parse_colour(marker_face_colour[k])))
+    return pixels
+
+
+def _frames_to_buffer(images):
+    r"""
+    Stack the pixels of the images into a single uint8
+    ``(n_frames, 3, height, width)`` buffer. Greyscale images are replicated
+    into three channels.
+    """
+    buffer = np.empty((len(images), 3) + images[0].shape, dtype=np.uint8)
+    for i, image in enumerate(images):
+        buffer[i] = denormalize_pixels_range(image.pixels, np.uint8)
+    return buffer
+
+
+def _rasterize_numpy(image, pclouds, render_lines=True, line_style='-',
+                     line_colour='b', line_width=1, render_markers=True,
+                     marker_style='o', marker_size=1, marker_face_colour='b',
+                     marker_edge_colour='b', marker_edge_width=1):
+    pixels = _frames_to_buffer([image])
+    _rasterize_numpy_frames(
+        pixels, [[p] for p in pclouds], render_lines=render_lines,
+        line_style=line_style, line_colour=line_colour, line_width=line_width,
+        render_markers=render_markers, marker_style=marker_style,
+        marker_size=marker_size, marker_face_colour=marker_face_colour,
+        marker_edge_colour=marker_edge_colour,
+        marker_edge_width=marker_edge_width)
+    return Image(pixels[0], copy=False)
+
+
 _RASTERIZE_BACKENDS = {'matplotlib': _rasterize_matplotlib,
-                       'pillow': _rasterize_pillow}
+                       'pillow': _rasterize_pillow,
+                       'numpy': _rasterize_numpy}
 
 
 def rasterize_landmarks_2d(image, group=None, render_lines=True, line_style='-',
@@ -184,7 +369,10 @@ def rasterize_landmarks_2d(image, group=None, render_lines=True, line_style='-',
     backend is very fast, but not very flexible. The `matplotlib` backend
     should be feature compatible with other Menpo rendering methods, but
     is much slower due to the overhead of creating a figure to render
-    into.
+    into. The 'numpy' backend draws anti-aliased lines and markers directly
+    into the pixels without any conversion to another image library, and
+    always returns an RGB image. To rasterize many frames at once see
+    :func:`rasterize_landmarks_2d_batch`.
 
     Parameters
     ----------
@@ -214,7 +402,7 @@ def rasterize_landmarks_2d(image, group=None, render_lines=True, line_style='-',
         A Matplotlib style colour or a backend dependant colour.
     marker_edge_width : `int`, optional
         The width of the marker edge. Not all backends support this.
-    backend : {'matplotlib', 'pillow'}, optional
+    backend : {'matplotlib', 'pillow', 'numpy'}, optional
         The backend to use.
 
     Returns
@@ -243,34 +431,130 @@ def rasterize_landmarks_2d(image, group=None, render_lines=True, line_style='-',
 
         # Validate all the parameters for multiple landmark groups being
         # passed in
-        n_pclouds = len(landmarks)
-        render_lines = check_param(n_pclouds, bool, 'render_lines',
-                                   render_lines)
-        line_style = check_param(n_pclouds, basestring, 'line_style',
-                                 line_style)
-        line_colour = check_param(n_pclouds, (basestring, tuple), 'line_colour',
-                                  line_colour)
-        line_width = check_param(n_pclouds, int, 'line_width', line_width)
-        render_markers = check_param(n_pclouds, bool, 'render_markers',
-                                     render_markers)
-        marker_style = check_param(n_pclouds, basestring, 'marker_style',
-                                   marker_style)
-        marker_size = check_param(n_pclouds, int, 'marker_size', marker_size)
-        marker_face_colour = check_param(n_pclouds, (basestring, tuple),
-                                         'marker_face_colour',
-                                         marker_face_colour)
-        marker_edge_colour = check_param(n_pclouds, (basestring, tuple),
-                                         'marker_edge_colour',
-                                         marker_edge_colour)
-        marker_edge_width = check_param(n_pclouds, int, 'marker_edge_width',
-                                        marker_edge_width)
-
-        return _RASTERIZE_BACKENDS[backend](
-            image, landmarks, render_lines=render_lines, line_style=line_style,
+        params = _check_rasterize_params(
+            len(landmarks), render_lines=render_lines, line_style=line_style,
             line_colour=line_colour, line_width=line_width,
             render_markers=render_markers, marker_style=marker_style,
             marker_size=marker_size, marker_face_colour=marker_face_colour,
             marker_edge_colour=marker_edge_colour,
             marker_edge_width=marker_edge_width)
+        return _RASTERIZE_BACKENDS[backend](image, landmarks, **params)
     else:
         raise ValueError('Unsupported backend: {}'.format(backend))
+
+
+def rasterize_landmarks_2d_batch(images, group=None, render_lines=True,
+                                 line_style='-', line_colour='b', line_width=1,
+                                 render_markers=True, marker_style='o',
+                                 marker_size=1, marker_face_colour='b',
+                                 marker_edge_colour='b', marker_edge_width=1):
+    r"""
+    Rasterize 2D landmarks onto a batch of images in one pass, for example
+    the frames of a video. This uses the same pure numpy rasterizer as the
+    ``'numpy'`` backend of :func:`rasterize_landmarks_2d`, but all the frames
+    are drawn together so the per-frame Python overhead is removed.
+
+    All of the images must have the same shape and every landmark group must
+    have the same number of points in every image. The edges of each group
+    are taken from the first image.
+
+    Parameters
+    ----------
+    images : `list` of :map:`Image` or subclass
+        The images to render onto.
+    group : `str` or `list` of `str`, optional
+        The landmark group key, or a list of keys.
+    render_lines : `bool`, optional
+        If ``True``, and the provided landmark group is a :map:`PointGraph`,
+        the edges are rendered.
+    line_style : `str`, optional
+        The style of the edge line. Only ``'-'`` is supported.
+    line_colour : `str` or `tuple`, optional
+        A Matplotlib style colour or an RGB tuple.
+    line_width : `int`, optional
+        The width of the line to rasterize.
+    render_markers : `bool`, optional
+        If ``True``, render markers at the coordinates of each landmark.
+    marker_style : {``'o'``, ``'.'``, ``'s'``}, optional
+        The marker style.
+    marker_size : `int`, optional
+        The radius of the marker in pixels.
+    marker_face_colour : `str`, optional
+        A Matplotlib style colour or an RGB tuple.
+    marker_edge_colour : `str`, optional
+        A Matplotlib style colour or an RGB tuple.
+    marker_edge_width : `int`, optional
+        The width of the marker edge.
+
+    Returns
+    -------
+    rasterized_images : `list` of :map:`Image`
+        The RGB images with the landmarks rasterized directly into the
+        pixels. The pixels of the images returned are of uint8 type.
+
+    Raises
+    ------
+    ValueError
+        Only 2D images are supported.
+    ValueError
+        Only RGB (3-channel) or Greyscale (1-channel) images are supported.
+    ValueError
+        All the images must have the same shape.
+    """
+    if len(images) == 0:
+        return []
+    for image in images:
+        if image.n_channels != 1 and image.n_channels != 3:
+            raise ValueError('Only RGB or Greyscale images can be rasterized')
+        if image.n_dims != 2:
+            raise ValueError('Only 2D images can be rasterized.')
+        if image.shape != images[0].shape:
+            raise ValueError('All the images must have the same shape to be '
+                             'rasterized as a batch.')
+
+    groups = group if isinstance(group, list) else [group]
+    landmarks = [[image.landmarks[g] for image in images] for g in groups]
+    params = _check_rasterize_params(
+        len(landmarks), render_lines=render_lines, line_style=line_style,
+        line_colour=line_colour, line_width=line_width,
+        render_markers=render_markers, marker_style=marker_style,
+        marker_size=marker_size, marker_face_colour=marker_face_colour,
+        marker_edge_colour=marker_edge_colour,
+        marker_edge_width=marker_edge_width)
+
+    pixels = _rasterize_numpy_frames(_frames_to_buffer(images), landmarks,
+                                     **params)
+    return [Image(frame, copy=False) for frame in pixels]
+
+
+def _check_rasterize_params(n_pclouds, render_lines=True, line_style='-',
+                            line_colour='b', line_width=1, render_markers=True,
+                            marker_style='o', marker_size=1,
+                            marker_face_colour='b', marker_edge_colour='b',
+                            marker_edge_width=1):
+    r"""
+    Validate all the rasterization parameters for ``n_pclouds`` landmark
+    groups, returning a dictionary of per group lists of parameters.
+    """
+    return {
+        'render_lines': check_param(n_pclouds, bool, 'render_lines',
+                                    render_lines),
+        'line_style': check_param(n_pclouds, basestring, 'line_style',
+                                  line_style),
+        'line_colour': check_param(n_pclouds, (basestring, tuple),
+                                   'line_colour', line_colour),
+        'line_width': check_param(n_pclouds, int, 'line_width', line_width),
+        'render_markers': check_param(n_pclouds, bool, 'render_markers',
+                                      render_markers),
+        'marker_style': check_param(n_pclouds, basestring, 'marker_style',
+                                    marker_style),
+        'marker_size': check_param(n_pclouds, int, 'marker_size',
+                                   marker_size),
+        'marker_face_colour': check_param(n_pclouds, (basestring, tuple),
+                                          'marker_face_colour',
+                                          marker_face_colour),
+        'marker_edge_colour': check_param(n_pclouds, (basestring, tuple),
+                                          'marker_edge_colour',
+                                          marker_edge_colour),
+        'marker_edge_width': check_param(n_pclouds, int, 'marker_edge_width',
+                                         marker_edge_width)}
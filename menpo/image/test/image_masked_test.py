@@ -157,3 +157,28 @@ def test_init_from_rolled_channels_masked():
     assert im.height == 50
     assert im.width == 60
     assert im.mask.n_true() == 36
+
+
+def test_boolean_erode_dilate_match_binary_morphology():
+    from scipy.ndimage import binary_erosion, binary_dilation
+    rng = np.random.RandomState(0)
+    mask = rng.rand(30, 40) > 0.2
+    mask_img = BooleanImage(mask)
+    for n_pixels in [1, 2, 5]:
+        assert np.all(mask_img.erode(n_pixels=n_pixels).mask ==
+                      binary_erosion(mask, iterations=n_pixels))
+        assert np.all(mask_img.dilate(n_pixels=n_pixels).mask ==
+                      binary_dilation(mask, iterations=n_pixels))
+
+
+def test_boolean_dilate_all_false():
+    mask_img = BooleanImage.init_blank((10, 10), fill=False)
+    assert mask_img.dilate(n_pixels=3).n_true() == 0
+
+
+def test_boolean_bounds_true():
+    mask = np.zeros((10, 12), dtype=np.bool)
+    mask[2:5, 3:9] = True
+    mins, maxes = BooleanImage(mask).bounds_true()
+    assert_allclose(mins, [2, 3])
+    assert_allclose(maxes, [4, 8])
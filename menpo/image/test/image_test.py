@@ -817,3 +817,63 @@ def test_rescale_to_diagonal():
     rescaled = image.rescale_to_diagonal(5)
     assert rescaled.shape == (4, 3)
     assert rescaled.n_channels == 2
+
+
+def test_as_histogram_uint8_unique_matches_numpy():
+    pixels = np.random.randint(3, 200, size=(3, 20, 30)).astype(np.uint8)
+    hist, bin_edges = Image(pixels).as_histogram()
+    assert len(hist) == 3
+    for ch in range(3):
+        h, e = np.histogram(pixels[ch].ravel(),
+                            bins=np.unique(pixels[ch].ravel()))
+        assert_equal(hist[ch], h)
+        assert_equal(bin_edges[ch], e)
+        assert bin_edges[ch].dtype == e.dtype
+
+
+def test_as_histogram_uint8_bins_matches_numpy():
+    pixels = np.random.randint(0, 256, size=(3, 20, 30)).astype(np.uint8)
+    hist, bin_edges = Image(pixels).as_histogram(keep_channels=False, bins=10)
+    h, e = np.histogram(pixels.ravel(), bins=10)
+    assert_equal(hist, h)
+    assert_allclose(bin_edges, e)
+
+
+def test_as_histogram_uint8_constant():
+    image = Image(np.full((1, 5, 5), 7, dtype=np.uint8))
+    hist, bin_edges = image.as_histogram(bins=4)
+    h, e = np.histogram(image.pixels.ravel(), bins=4)
+    assert_equal(hist, h)
+    assert_allclose(bin_edges, e)
+
+
+def test_as_histogram_int64_wide_range_matches_numpy():
+    pixels = np.array([[[0, 2 ** 31 - 1], [5, 0]]], dtype=np.int64)
+    hist, bin_edges = Image(pixels).as_histogram()
+    h, e = np.histogram(pixels.ravel(), bins=np.unique(pixels))
+    assert_equal(hist, h)
+    assert_equal(bin_edges, e)
+    hist, bin_edges = Image(pixels).as_histogram(bins=3)
+    h, e = np.histogram(pixels.ravel(), bins=3)
+    assert_equal(hist, h)
+    assert_allclose(bin_edges, e)
+
+
+def test_as_histogram_uint64_wide_range_matches_numpy():
+    pixels = np.array([[[0, 2 ** 63], [2 ** 63 + 7, 3]]], dtype=np.uint64)
+    hist, bin_edges = Image(pixels).as_histogram()
+    h, e = np.histogram(pixels.ravel(), bins=np.unique(pixels))
+    assert_equal(hist, h)
+    assert_equal(bin_edges, e)
+
+
+def test_as_histogram_uint64_narrow_large_values_matches_numpy():
+    pixels = (np.arange(12, dtype=np.uint64).reshape([2, 2, 3]) +
+              np.uint64(2 ** 63))
+    hist, bin_edges = Image(pixels).as_histogram()
+    for ch in range(2):
+        h, e = np.histogram(pixels[ch].ravel(),
+                            bins=np.unique(pixels[ch].ravel()))
+        assert_equal(hist[ch], h)
+        assert_equal(bin_edges[ch], e)
+        assert bin_edges[ch].dtype == np.uint64
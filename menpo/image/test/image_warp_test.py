@@ -344,3 +344,16 @@ def test_maskedimage_retain_shape():
     rotated_img = image.rotate_ccw_about_centre(theta=77, retain_shape=True)
     assert(image.shape == rotated_img.shape)
     assert(type(rotated_img) == MaskedImage)
+
+
+def test_warp_to_shape_transform_chain():
+    from menpo.transform import Translation, TransformChain
+    chain = TransformChain([UniformScale(0.5, 2), Translation([10, 20])])
+    collapsed = chain.collapse()
+    warped_chain, tr = gray_image.warp_to_shape((50, 50), chain,
+                                                warp_landmarks=False,
+                                                return_transform=True)
+    warped = gray_image.warp_to_shape((50, 50), collapsed,
+                                      warp_landmarks=False)
+    assert tr is chain
+    assert_allclose(warped_chain.pixels, warped.pixels)
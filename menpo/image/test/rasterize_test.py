@@ -4,7 +4,8 @@ import unittest
 from numpy.testing import assert_allclose
 from menpo.shape import PointCloud, PointUndirectedGraph
 from menpo.image import Image
-from menpo.image.rasterize import rasterize_landmarks_2d
+from menpo.image.rasterize import (rasterize_landmarks_2d,
+                                   rasterize_landmarks_2d_batch)
 
 
 centre = PointCloud([[4.5, 4.5]])
@@ -70,3 +71,49 @@ def test_rasterize_pillow_basic_line():
     assert_allclose(new_im.pixels[0, 1:4, 3:6], 255)
     assert_allclose(new_im.pixels[0, 7:-1, 3:6], 255)
     assert_allclose(new_im.pixels[2, 4:7, 4], 255)
+
+
+def test_rasterize_numpy_basic():
+    im = Image.init_blank([11, 11], fill=0, n_channels=1)
+    im.landmarks['test'] = centre
+    new_im = rasterize_landmarks_2d(im, group='test', render_lines=False,
+                                    marker_style='s', marker_face_colour='r',
+                                    marker_size=1, marker_edge_width=0,
+                                    backend='numpy')
+    assert new_im.n_channels == 3
+    assert new_im.shape == (11, 11)
+    assert new_im.pixels.dtype == np.uint8
+    assert_allclose(new_im.pixels[0, 4:6, 4:6], 255)
+    assert_allclose(new_im.pixels[1:], 0)
+
+
+def test_rasterize_numpy_basic_line():
+    im = Image.init_blank([11, 11], fill=0, n_channels=3)
+    im.landmarks['test'] = line
+    new_im = rasterize_landmarks_2d(im, group='test', render_lines=True,
+                                    line_width=1, line_colour='b',
+                                    render_markers=False, backend='numpy')
+    assert new_im.n_channels == 3
+    # The line lies between two columns so is split across both of them
+    assert_allclose(new_im.pixels[2, 3:8, 4:6], 128)
+    assert_allclose(new_im.pixels[:2], 0)
+    assert_allclose(new_im.pixels[2, :, :4], 0)
+
+
+def test_rasterize_numpy_batch():
+    images = []
+    for offset in range(3):
+        im = Image.init_blank([11, 11], fill=0, n_channels=3)
+        im.landmarks['test'] = PointCloud([[4. + offset, 4.]])
+        images.append(im)
+    new_ims = rasterize_landmarks_2d_batch(images, group='test',
+                                           marker_style='s',
+                                           marker_face_colour='r',
+                                           marker_size=1, marker_edge_width=0)
+    assert len(new_ims) == 3
+    for offset, (im, new_im) in enumerate(zip(images, new_ims)):
+        single = rasterize_landmarks_2d(im, group='test', marker_style='s',
+                                        marker_face_colour='r', marker_size=1,
+                                        marker_edge_width=0, backend='numpy')
+        assert_allclose(new_im.pixels, single.pixels)
+        assert_allclose(new_im.pixels[0, 3 + offset:6 + offset, 3:6], 255)
@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 import random
 
+import numpy as np
+
 from menpo.base import (menpo_src_dir_path, LazyList, partial_doc,
                         MenpoDeprecationWarning)
 from menpo.compatibility import basestring
@@ -218,7 +220,7 @@ def same_name_video(path, frame_number,
 
 
 def import_image(filepath, landmark_resolver=same_name, normalize=None,
-                 normalise=None):
+                 normalise=None, lazy=False, scale=None, max_shape=None):
     r"""Single image (and associated landmarks) importer.
 
     If an image file is found at `filepath`, returns an :map:`Image` or
@@ -248,6 +250,24 @@ def import_image(filepath, landmark_resolver=same_name, normalize=None,
         useful to save on memory usage if you only wish to view or crop images.
     normalise: `bool`, optional
         Deprecated version of normalize. Please use the normalize arg.
+    lazy : `bool`, optional
+        If ``True``, only the header of each image (its shape and number of
+        channels) is read and a :map:`LazyImage` is returned, with any
+        landmarks attached. The pixels are decoded on first access. This makes
+        filtering or gathering statistics over large datasets cheap. Only
+        images imported via Pillow support this, others are imported as usual.
+    scale : `float` or ``None``, optional
+        If not ``None``, the image is rescaled by this factor on import. The
+        result is equivalent to calling :meth:`Image.rescale` on the imported
+        image (landmarks included), but JPEG images are decoded directly at a
+        reduced resolution first, saving decoding time and peak memory.
+        Cannot be combined with ``max_shape`` or ``lazy``.
+    max_shape : ``(height, width)`` `tuple` or ``None``, optional
+        If not ``None``, images larger than this shape are uniformly
+        downscaled on import so that they fit inside it, exactly as for
+        ``scale``. Cannot be combined with ``scale`` or ``lazy``. Neither
+        ``scale`` nor ``max_shape`` is supported for files that are imported
+        as a :map:`LazyList` of frames (e.g. GIFs), a `ValueError` is raised.
 
     Returns
     -------
@@ -255,11 +275,13 @@ def import_image(filepath, landmark_resolver=same_name, normalize=None,
         An instantiated :map:`Image` or subclass thereof or a list of images.
     """
     normalize = _parse_deprecated_normalise(normalise, normalize)
-    kwargs = {'normalize': normalize}
+    kwargs, attach_func = _image_importer_kwargs(normalize, lazy=lazy,
+                                                 scale=scale,
+                                                 max_shape=max_shape)
     return _import(filepath, image_types,
                    landmark_ext_map=image_landmark_types,
                    landmark_resolver=landmark_resolver,
-                   landmark_attach_func=_import_object_attach_landmarks,
+                   landmark_attach_func=attach_func,
                    importer_kwargs=kwargs)
 
 
@@ -444,7 +466,8 @@ def import_pickles(pattern, max_pickles=None, shuffle=False,
 
 def import_images(pattern, max_images=None, shuffle=False,
                   landmark_resolver=same_name, normalize=None,
-                  normalise=None, as_generator=False, verbose=False):
+                  normalise=None, as_generator=False, verbose=False,
+                  lazy=False, scale=None, max_shape=None):
     r"""Multiple image (and associated landmarks) importer.
 
     For each image found creates an importer than returns a :map:`Image` or
@@ -494,6 +517,24 @@ def import_images(pattern, max_images=None, shuffle=False,
     verbose : `bool`, optional
         If ``True`` progress of the importing will be dynamically reported with
         a progress bar.
+    lazy : `bool`, optional
+        If ``True``, only the header of each image (its shape and number of
+        channels) is read and a :map:`LazyImage` is returned, with any
+        landmarks attached. The pixels are decoded on first access. This makes
+        filtering or gathering statistics over large datasets cheap. Only
+        images imported via Pillow support this, others are imported as usual.
+    scale : `float` or ``None``, optional
+        If not ``None``, the image is rescaled by this factor on import. The
+        result is equivalent to calling :meth:`Image.rescale` on the imported
+        image (landmarks included), but JPEG images are decoded directly at a
+        reduced resolution first, saving decoding time and peak memory.
+        Cannot be combined with ``max_shape`` or ``lazy``.
+    max_shape : ``(height, width)`` `tuple` or ``None``, optional
+        If not ``None``, images larger than this shape are uniformly
+        downscaled on import so that they fit inside it, exactly as for
+        ``scale``. Cannot be combined with ``scale`` or ``lazy``. Neither
+        ``scale`` nor ``max_shape`` is supported for files that are imported
+        as a :map:`LazyList` of frames (e.g. GIFs), a `ValueError` is raised.
 
     Returns
     -------
@@ -514,16 +555,31 @@ def import_images(pattern, max_images=None, shuffle=False,
     >>> images =  menpo.io.import_images('./massive_image_db/*')  # Returns immediately
     >>> images = images.map(rescale_20p)  # Returns immediately
     >>> images[0]  # Get the first image, resize, lazily loaded
+
+    Keep only the images larger than 1000 pixels wide, without decoding the
+    ones that are discarded:
+
+    >>> images = menpo.io.import_images('./massive_image_db/*', lazy=True)
+    >>> images = [i for i in images if i.width > 1000]
+
+    Import images downscaled to fit in 1000x1000 pixels. JPEG images are
+    decoded at a reduced resolution, which is much faster than decoding them
+    fully and then calling :meth:`Image.rescale`:
+
+    >>> images = menpo.io.import_images('./massive_image_db/*',
+    >>>                                 max_shape=(1000, 1000))
     """
     normalize = _parse_deprecated_normalise(normalise, normalize)
 
-    kwargs = {'normalize': normalize}
+    kwargs, attach_func = _image_importer_kwargs(normalize, lazy=lazy,
+                                                 scale=scale,
+                                                 max_shape=max_shape)
     return _import_glob_lazy_list(
         pattern, image_types,
         max_assets=max_images, shuffle=shuffle,
         landmark_resolver=landmark_resolver,
         landmark_ext_map=image_landmark_types,
-        landmark_attach_func=_import_object_attach_landmarks,
+        landmark_attach_func=attach_func,
         as_generator=as_generator,
         verbose=verbose,
         importer_kwargs=kwargs
@@ -772,6 +828,87 @@ def _import_lazylist_attach_landmarks(built_objects, landmark_resolver,
             built_objects[k] = new_ll
 
 
+def _image_importer_kwargs(normalize, lazy=False, scale=None,
+                           max_shape=None):
+    r"""
+    The importer kwargs and landmark attach function to use for importing
+    images with the given options.
+    """
+    if scale is not None and max_shape is not None:
+        raise ValueError('Only one of scale and max_shape can be provided.')
+    rescale = scale is not None or max_shape is not None
+    if lazy and rescale:
+        raise ValueError('Lazy importing cannot be combined with rescaling '
+                         'on import.')
+    kwargs = {'normalize': normalize}
+    if lazy or rescale:
+        # When rescaling only the header is read at first, so that the
+        # decoding resolution can be chosen once the image shape is known
+        kwargs['lazy'] = True
+    if rescale:
+        attach_func = partial(_import_object_attach_landmarks_and_rescale,
+                              scale=scale, max_shape=max_shape)
+    else:
+        attach_func = _import_object_attach_landmarks
+    return kwargs, attach_func
+
+
+def _rescale_on_import(image, scale=None, max_shape=None):
+    r"""
+    Rescale a just imported image (and its landmarks) by ``scale`` or to fit
+    within ``max_shape``. A :map:`LazyImage` is decoded at the smallest
+    resolution its importer supports that is still at least the final shape.
+    """
+    from menpo.image import LazyImage
+    from menpo.image.base import round_image_shape
+    from menpo.transform import NonUniformScale
+
+    shape = np.array(image.shape, dtype=np.float)
+    if scale is None:
+        scale = min(1.0, np.min(np.asarray(max_shape) / shape))
+    if scale <= 0:
+        raise ValueError('Scales must be positive floats.')
+    if scale == 1:
+        return image.load() if isinstance(image, LazyImage) else image
+
+    # Exactly the shape that Image.rescale produces
+    final_shape = round_image_shape(shape * scale, 'ceil')
+    if isinstance(image, LazyImage):
+        image.load(draft_shape=final_shape)
+    if image.shape == tuple(shape.astype(np.int)):
+        # Decoded at full resolution, just rescale as usual
+        return image.rescale(scale)
+
+    # Decoded at a reduced resolution, so finish the resize. The landmarks are
+    # still in the coordinates of the full resolution image, so are mapped
+    # exactly as Image.rescale would have done.
+    rescaled = image.resize(final_shape)
+    landmark_scale = NonUniformScale((scale * shape - 1) / (shape - 1))
+    for group in image.landmarks.group_labels:
+        rescaled.landmarks[group] = landmark_scale.apply(image.landmarks[group])
+    return rescaled
+
+
+def _import_object_attach_landmarks_and_rescale(built_objects,
+                                                landmark_resolver,
+                                                landmark_ext_map=None,
+                                                scale=None, max_shape=None):
+    from menpo.image import Image
+    for x in built_objects:
+        if not isinstance(x, Image):
+            raise ValueError('Rescaling on import (scale or max_shape) is only '
+                             'supported for files imported as a single image, '
+                             'not as a {} (e.g. animated GIFs).'.format(
+                                 type(x).__name__))
+    # Landmarks are attached before decoding so that they are imported
+    # relative to the full resolution image
+    _import_object_attach_landmarks(built_objects, landmark_resolver,
+                                    landmark_ext_map=landmark_ext_map)
+    for k, x in enumerate(built_objects):
+        built_objects[k] = _rescale_on_import(x, scale=scale,
+                                              max_shape=max_shape)
+
+
 def _import(filepath, extensions_map, landmark_resolver=same_name,
             landmark_ext_map=None, landmark_attach_func=None,
             asset=None, importer_kwargs=None):
@@ -831,7 +968,9 @@ def _import(filepath, extensions_map, landmark_resolver=same_name,
             except AttributeError:
                 pass  # that's fine! Probably a dict/list from PickleImporter.
 
-    if landmark_attach_func is not None and landmark_resolver is not None:
+    # The attach functions skip importing landmarks themselves if there is no
+    # landmark_resolver, but may still need to post-process the objects
+    if landmark_attach_func is not None:
         landmark_attach_func(built_objects, landmark_resolver,
                              landmark_ext_map=landmark_ext_map)
 
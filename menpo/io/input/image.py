@@ -4,7 +4,7 @@ import numpy as np
 from pathlib import Path
 
 from menpo.base import LazyList
-from menpo.image import Image, MaskedImage, BooleanImage
+from menpo.image import Image, MaskedImage, BooleanImage, LazyImage
 from menpo.image.base import normalize_pixels_range, channels_to_front
 
 
@@ -17,7 +17,60 @@ def _pil_to_numpy(pil_image, normalize, convert=None):
         return p
 
 
-def pillow_importer(filepath, asset=None, normalize=True, **kwargs):
+def _pillow_n_channels(mode, normalize):
+    r"""
+    The number of channels that :func:`pillow_importer` produces for a PIL
+    image of the given mode.
+    """
+    if mode == 'RGBA':
+        # Normalized RGBA images have their alpha turned in to a mask
+        return 3 if normalize else 4
+    elif mode in ['RGB', 'P']:
+        return 3
+    elif mode in ['L', 'I', '1', 'F']:
+        return 1
+    else:
+        raise ValueError('Unexpected mode for PIL: {}'.format(mode))
+
+
+def pillow_lazy_importer(filepath, asset=None, normalize=True, **kwargs):
+    r"""
+    Imports only the header of an image using PIL/pillow, returning a
+    :map:`LazyImage`. PIL opens files lazily, so only the dimensions and mode
+    of the image are read. The pixels are decoded with :func:`pillow_importer`
+    on the first access to them.
+
+    Parameters
+    ----------
+    filepath : `Path`
+        Absolute filepath of image
+    asset : `object`, optional
+        An optional asset that may help with loading. This is unused for this
+        implementation.
+    normalize : `bool`, optional
+        If ``True``, normalize between 0.0 and 1.0 and convert to float. If
+        ``False`` just pass whatever PIL imports back (see
+        :func:`pillow_importer`).
+    \**kwargs : `dict`, optional
+        Any other keyword arguments.
+
+    Returns
+    -------
+    image : :map:`LazyImage`
+        The lazily imported image.
+    """
+    import PIL.Image as PILImage
+    if isinstance(filepath, Path):
+        filepath = str(filepath)
+    with PILImage.open(filepath) as pil_image:
+        mode = pil_image.mode
+        width, height = pil_image.size
+    return LazyImage(partial(pillow_importer, filepath, normalize=normalize),
+                     (height, width), _pillow_n_channels(mode, normalize))
+
+
+def pillow_importer(filepath, asset=None, normalize=True, lazy=False,
+                    draft_shape=None, **kwargs):
     r"""
     Imports an image using PIL/pillow.
 
@@ -44,6 +97,15 @@ def pillow_importer(filepath, asset=None, normalize=True, **kwargs):
         If ``True``, normalize between 0.0 and 1.0 and convert to float. If
         ``False`` just pass whatever PIL imports back (according
         to types rules outlined in constructor).
+    lazy : `bool`, optional
+        If ``True``, only the header of the image is read and a
+        :map:`LazyImage` is returned (see :func:`pillow_lazy_importer`).
+    draft_shape : ``(height, width)`` `tuple` or ``None``, optional
+        If not ``None``, formats that support decoding at a reduced
+        resolution (JPEG) are decoded at the largest power-of-two reduction
+        whose shape is at least ``draft_shape``. The returned image is
+        therefore *not* exactly ``draft_shape``, it should be resized
+        afterwards. Other formats are decoded at full resolution.
     \**kwargs : `dict`, optional
         Any other keyword arguments.
 
@@ -52,11 +114,17 @@ def pillow_importer(filepath, asset=None, normalize=True, **kwargs):
     image : :map:`Image` or subclass
         The imported image.
     """
+    if lazy:
+        return pillow_lazy_importer(filepath, asset=asset, normalize=normalize)
     import PIL.Image as PILImage
     if isinstance(filepath, Path):
         filepath = str(filepath)
     pil_image = PILImage.open(filepath)
     mode = pil_image.mode
+    if draft_shape is not None:
+        # Only configures the decoder - JPEG uses DCT scaling to decode at
+        # 1/2, 1/4 or 1/8 of the size. A no-op for other formats.
+        pil_image.draft(mode, (int(draft_shape[1]), int(draft_shape[0])))
     if mode == 'RGBA':
         # If normalize is False, then we return the alpha as an extra
         # channel, which can be useful if the alpha channel has semantic
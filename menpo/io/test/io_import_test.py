@@ -1,6 +1,7 @@
 import sys
 import warnings
 import numpy as np
+from numpy.testing import assert_allclose
 from mock import patch, MagicMock
 from nose.tools import raises
 from PIL import Image as PILImage
@@ -141,6 +142,76 @@ def test_import_image_no_norm():
     assert im.pixels.dtype == np.uint8
 
 
+def test_import_image_lazy():
+    from menpo.image import Image, LazyImage
+    img_path = mio.data_dir_path() / 'breakingbad.jpg'
+    im = mio.import_image(img_path, lazy=True)
+    assert isinstance(im, LazyImage)
+    assert im.shape == (1080, 1920)
+    assert im.n_channels == 3
+    assert im.landmarks['PTS'].n_points == 68
+    assert isinstance(im, LazyImage)
+    # Accessing the pixels loads the image and keeps the landmarks
+    assert im.pixels.shape == (3, 1080, 1920)
+    assert type(im) == Image
+    assert im.landmarks['PTS'].n_points == 68
+    assert im.path == img_path
+
+
+def test_import_images_lazy():
+    from menpo.image import LazyImage
+    imgs = list(mio.import_images(mio.data_dir_path(), lazy=True))
+    assert all(isinstance(i, LazyImage) for i in imgs)
+    imgs_channels = {i.path.stem: i.n_channels for i in imgs}
+    assert imgs_channels['einstein'] == 1
+    assert imgs_channels['takeo'] == 3
+
+
+def test_import_image_scale():
+    img_path = mio.data_dir_path() / 'breakingbad.jpg'
+    expected = mio.import_image(img_path).rescale(0.25)
+    im = mio.import_image(img_path, scale=0.25)
+    assert im.shape == expected.shape == (270, 480)
+    assert_allclose(im.landmarks['PTS'].points,
+                    expected.landmarks['PTS'].points)
+    assert im.path == img_path
+
+
+def test_import_image_max_shape():
+    img_path = mio.data_dir_path() / 'breakingbad.jpg'
+    im = mio.import_image(img_path, max_shape=(540, 1000))
+    assert im.shape == (540, 960)
+    # Images already within max_shape are untouched
+    im = mio.import_image(img_path, max_shape=(2000, 2000))
+    assert im.shape == (1080, 1920)
+
+
+def test_import_image_scale_png():
+    img_path = mio.data_dir_path() / 'lenna.png'
+    expected = mio.import_image(img_path).rescale(0.5)
+    im = mio.import_image(img_path, scale=0.5)
+    assert_allclose(im.pixels, expected.pixels)
+    assert_allclose(im.landmarks['LJSON'].points,
+                    expected.landmarks['LJSON'].points)
+
+
+def test_import_images_scale():
+    imgs = list(mio.import_images(mio.data_dir_path(), max_shape=(100, 100)))
+    assert all(max(i.shape) <= 100 for i in imgs)
+
+
+@raises(ValueError)
+def test_import_image_scale_lazy_raises():
+    mio.import_image(mio.data_dir_path() / 'einstein.jpg', lazy=True,
+                     scale=0.5)
+
+
+@raises(ValueError)
+def test_import_image_scale_max_shape_raises():
+    mio.import_image(mio.data_dir_path() / 'einstein.jpg', scale=0.5,
+                     max_shape=(10, 10))
+
+
 def test_import_landmark_file():
     lm_path = mio.data_dir_path() / 'einstein.pts'
     mio.import_landmark_file(lm_path)
@@ -382,6 +453,18 @@ def test_importing_ffmpeg_GIF_normalize(is_file, video_infos_ffprobe, pipe):
     assert im.pixels.dtype == np.float
 
 
+@raises(ValueError)
+@patch('subprocess.Popen')
+@patch('menpo.io.input.video.video_infos_ffprobe')
+@patch('menpo.io.input.base.Path.is_file')
+def test_importing_ffmpeg_GIF_scale_raises(is_file, video_infos_ffprobe, pipe):
+    video_infos_ffprobe.return_value = {'duration': 2, 'width': 100,
+                                        'height': 150, 'n_frames': 10, 'fps': 5}
+    is_file.return_value = True
+
+    mio.import_image('fake_image_being_mocked.gif', max_shape=(50, 50))
+
+
 @patch('subprocess.Popen')
 @patch('menpo.io.input.video.video_infos_ffprobe')
 @patch('menpo.io.input.base.Path.is_file')
@@ -92,8 +92,10 @@ def as_matrix(vectorizables, length=None, return_template=False, verbose=False):
 
     Parameters
     ----------
-    vectorizables : `list` or generator if :map:`Vectorizable` objects
-        A list or generator of objects that supports the vectorizable interface
+    vectorizables : `list` or generator if :map:`Vectorizable` objects or :map:`PointCloudBatch`
+        A list or generator of objects that supports the vectorizable interface.
+        A :map:`PointCloudBatch` is converted directly, without iterating
+        over its point clouds (and `length` is ignored).
     length : `int`, optional
         Length of the vectorizable list. Useful if you are passing a generator
         with a known length.
@@ -117,6 +119,19 @@ def as_matrix(vectorizables, length=None, return_template=False, verbose=False):
     ValueError
         ``vectorizables`` terminates in fewer than ``length`` iterations
     """
+    from menpo.shape import PointCloudBatch  # avoid circular import
+    if isinstance(vectorizables, PointCloudBatch):
+        # the batch is already one contiguous array - copy it, as callers are
+        # free to modify the data matrix in place
+        data = vectorizables.as_vector().copy()
+        if verbose:
+            print('Allocated data matrix of size {} '
+                  '({} samples)'.format(bytes_str(data.nbytes), data.shape[0]))
+        if return_template:
+            return data, vectorizables[0].copy()
+        else:
+            return data
+
     # get the first element as the template and use it to configure the
     # data matrix
     if length is None:
@@ -1,5 +1,7 @@
 from .pointcloud import PointCloud, bounding_box, bounding_cuboid
-from .mesh import TriMesh, ColouredTriMesh, TexturedTriMesh
+from .batch import PointCloudBatch
+from .mesh import (TriMesh, ColouredTriMesh, TexturedTriMesh,
+                   TriMeshTopology, HeatGeodesics)
 from .groupops import mean_pointcloud
 from .graph import (UndirectedGraph, DirectedGraph, Tree, PointUndirectedGraph,
                     PointDirectedGraph, PointTree)
@@ -0,0 +1,288 @@
+from warnings import warn
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from menpo.base import Copyable
+from .pointcloud import PointCloud
+
+
+class PointCloudBatch(Copyable):
+    r"""
+    A batch of ``N`` point clouds with the same number of points and
+    dimensionality, stored as a single C-contiguous
+    ``(N, n_points, n_dims)`` `ndarray`.
+
+    This is a far more compact representation of a large set of shapes than
+    a `list` of :map:`PointCloud`, and all operations (:meth:`centre`,
+    :meth:`bounds`, :meth:`norm`, :meth:`transform`, :meth:`as_vector`, ...)
+    are performed on the whole batch at once. Indexing the batch with an
+    integer returns a :map:`PointCloud` that is a view onto the batch (no
+    points are copied). Indexing with a slice returns a batch.
+
+    Parameters
+    ----------
+    points : ``(N, n_points, n_dims)`` `ndarray`
+        The array representing the points of every point cloud.
+    copy : `bool`, optional
+        If ``False``, the points will not be copied on assignment. Note that
+        we still demand that the array is C-contiguous - if it isn't, a copy
+        will be generated anyway.
+
+    Raises
+    ------
+    ValueError
+        If ``points`` is not a 3D array.
+    """
+    def __init__(self, points, copy=True):
+        if not copy:
+            if not points.flags.c_contiguous:
+                warn('The copy flag was NOT honoured. A copy HAS been made. '
+                     'Please ensure the data you pass is C-contiguous.')
+                points = np.array(points, copy=True, order='C')
+        else:
+            points = np.array(points, copy=True, order='C')
+        if points.ndim != 3:
+            raise ValueError('points must be a (N, n_points, n_dims) array.')
+        self.points = points
+
+    @classmethod
+    def init_from_pointclouds(cls, pointclouds):
+        r"""
+        Stacks a `list` of :map:`PointCloud` into a batch. The point clouds
+        must all have the same number of points and dimensionality.
+
+        Parameters
+        ----------
+        pointclouds : `list` of :map:`PointCloud`
+            The point clouds to stack.
+
+        Returns
+        -------
+        batch : :map:`PointCloudBatch`
+            The batch of point clouds.
+        """
+        return cls(np.array([pc.points for pc in pointclouds]), copy=False)
+
+    @property
+    def n_pointclouds(self):
+        r"""
+        The number of point clouds in the batch.
+
+        :type: `int`
+        """
+        return self.points.shape[0]
+
+    @property
+    def n_points(self):
+        r"""
+        The number of points in each point cloud.
+
+        :type: `int`
+        """
+        return self.points.shape[1]
+
+    @property
+    def n_dims(self):
+        r"""
+        The number of dimensions of the point clouds.
+
+        :type: `int`
+        """
+        return self.points.shape[2]
+
+    @property
+    def n_parameters(self):
+        r"""
+        The length of the vector of each point cloud.
+
+        :type: `int`
+        """
+        return self.n_points * self.n_dims
+
+    def __len__(self):
+        return self.n_pointclouds
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or not np.isscalar(index):
+            return PointCloudBatch(np.ascontiguousarray(self.points[index]),
+                                   copy=False)
+        return PointCloud(self.points[index], copy=False)
+
+    def __iter__(self):
+        for i in range(self.n_pointclouds):
+            yield self[i]
+
+    def __str__(self):
+        return '{}: n_pointclouds: {}, n_points: {}, n_dims: {}'.format(
+            type(self).__name__, self.n_pointclouds, self.n_points,
+            self.n_dims)
+
+    def centre(self):
+        r"""
+        The mean of the points of each point cloud (centre of mass).
+
+        Returns
+        -------
+        centres : ``(N, n_dims)`` `ndarray`
+            The centre of each point cloud.
+        """
+        return self.points.mean(axis=1)
+
+    def centre_of_bounds(self):
+        r"""
+        The centre of the absolute bounds of each point cloud.
+
+        Returns
+        -------
+        centres : ``(N, n_dims)`` `ndarray`
+            The centre of the bounds of each point cloud.
+        """
+        min_b, max_b = self.bounds()
+        return (min_b + max_b) / 2.0
+
+    def bounds(self, boundary=0):
+        r"""
+        The minimum to maximum extent of each point cloud. An optional
+        boundary argument can be provided to expand the bounds by a constant
+        margin.
+
+        Parameters
+        ----------
+        boundary : `float`
+            A optional padding distance that is added to the bounds.
+
+        Returns
+        -------
+        min_b : ``(N, n_dims)`` `ndarray`
+            The minimum extent of each point cloud along each dimension.
+        max_b : ``(N, n_dims)`` `ndarray`
+            The maximum extent of each point cloud along each dimension.
+        """
+        min_b = self.points.min(axis=1) - boundary
+        max_b = self.points.max(axis=1) + boundary
+        return min_b, max_b
+
+    def range(self, boundary=0):
+        r"""
+        The range of the extent of each point cloud.
+
+        Parameters
+        ----------
+        boundary : `float`
+            A optional padding distance that is used to extend the bounds
+            from which the range is computed.
+
+        Returns
+        -------
+        range : ``(N, n_dims)`` `ndarray`
+            The range of each point cloud's extent in each dimension.
+        """
+        min_b, max_b = self.bounds(boundary)
+        return max_b - min_b
+
+    def norm(self):
+        r"""
+        The Frobenius norm of each point cloud, taken around its centre (see
+        :meth:`PointCloud.norm`).
+
+        Returns
+        -------
+        norms : ``(N,)`` `ndarray`
+            The norm of each point cloud.
+        """
+        centred = self.points - self.centre()[:, None, :]
+        return np.sqrt(np.einsum('nij,nij->n', centred, centred))
+
+    def distance_to(self, pointcloud, **kwargs):
+        r"""
+        Returns the distance matrices between each point cloud of the batch
+        and another point cloud. By default the Euclidean distance is
+        calculated - see `scipy.spatial.distance.cdist` for valid kwargs to
+        change the metric and other properties.
+
+        Parameters
+        ----------
+        pointcloud : :map:`PointCloud`
+            The point cloud to compute distances to. This must be of the same
+            dimension as the batch.
+
+        Returns
+        -------
+        distance_matrices : ``(N, n_points, pointcloud.n_points)`` `ndarray`
+            ``distance_matrices[n, i, j]`` is the distance between the i'th
+            point of the n'th point cloud and the j'th point of `pointcloud`.
+        """
+        if self.n_dims != pointcloud.n_dims:
+            raise ValueError("The batch and the PointCloud must be of the "
+                             "same dimensionality.")
+        distances = cdist(self.points.reshape([-1, self.n_dims]),
+                          pointcloud.points, **kwargs)
+        return distances.reshape([self.n_pointclouds, self.n_points, -1])
+
+    def transform(self, transform):
+        r"""
+        Returns a new batch with every point cloud transformed.
+
+        Parameters
+        ----------
+        transform : :map:`Transform` or :map:`HomogeneousBatch`
+            A single transform is applied to every point cloud. A
+            :map:`HomogeneousBatch` of ``N`` transforms applies each
+            transform to the corresponding point cloud.
+
+        Returns
+        -------
+        transformed : :map:`PointCloudBatch`
+            The transformed batch.
+        """
+        from menpo.transform import HomogeneousBatch
+        if isinstance(transform, HomogeneousBatch):
+            points = transform.apply(self.points)
+        else:
+            points = transform.apply(
+                self.points.reshape([-1, self.n_dims])).reshape(
+                self.points.shape)
+        return PointCloudBatch(points, copy=False)
+
+    def mean(self):
+        r"""
+        The mean point cloud of the batch.
+
+        Returns
+        -------
+        mean : :map:`PointCloud`
+            The mean point cloud.
+        """
+        return PointCloud(self.points.mean(axis=0), copy=False)
+
+    def as_vector(self):
+        r"""
+        The vectorized form of every point cloud, as a view onto the batch
+        (each row is the same as :meth:`PointCloud.as_vector`).
+
+        Returns
+        -------
+        vectors : ``(N, n_points * n_dims)`` `ndarray`
+            The flattened points of each point cloud.
+        """
+        return self.points.reshape([self.n_pointclouds, -1])
+
+    def from_vector(self, vectors):
+        r"""
+        Build a new batch with the same number of points and dimensionality
+        from vectors.
+
+        Parameters
+        ----------
+        vectors : ``(N, n_points * n_dims)`` `ndarray`
+            The flattened points of each point cloud, as returned by
+            :meth:`as_vector`.
+
+        Returns
+        -------
+        batch : :map:`PointCloudBatch`
+            A new batch of point clouds.
+        """
+        return PointCloudBatch(vectors.reshape([vectors.shape[0], -1,
+                                                self.n_dims]))
@@ -1,8 +1,19 @@
+from collections import OrderedDict
+
 import numpy as np
 from scipy.sparse import csgraph, csr_matrix, triu
 
 from . import PointCloud
 
+# The read-only adjacency matrices built by _shared_adjacency_matrix, each
+# with the cache of its derived results (see Graph._cache). A matrix is shared
+# by every graph built from the same edges (for instance all the 68 point
+# faces), so its validity checks and traversals are computed once.
+_SHARED_ADJACENCY = OrderedDict()  # key -> (adjacency_matrix, cache)
+_SHARED_ADJACENCY_BY_ID = {}  # id(adjacency_matrix) -> (adjacency_matrix, cache)
+_SHARED_ADJACENCY_MAX_ENTRIES = 128
+_SHARED_ADJACENCY_MAX_EDGES = 10000
+
 
 class Graph(object):
     r"""
@@ -131,6 +142,9 @@ class Graph(object):
                                                  [2, 0, 4, 2, 4, 3])),
                                       shape=(6, 6))
     """
+    # (adjacency_matrix, dict) of the cached traversal results, see _cache
+    _graph_cache = None
+
     def __init__(self, adjacency_matrix, copy=True, skip_checks=False):
         # check if adjacency_matrix is numpy.ndarray or scipy.sparse.csr_matrix
         if isinstance(adjacency_matrix, np.ndarray):
@@ -141,6 +155,12 @@ class Graph(object):
             raise ValueError('adjacency_matrix must be either a numpy.ndarray'
                              'or a scipy.sparse.csr_matrix.')
 
+        # store adjacency_matrix. The copy of a shared (read-only) adjacency
+        # matrix is private and writeable
+        if copy:
+            adjacency_matrix = adjacency_matrix.copy()
+        self.adjacency_matrix = adjacency_matrix
+
         if not skip_checks:
             # check that adjacency_matrix has expected shape
             if adjacency_matrix.shape[0] == 0:
@@ -152,16 +172,10 @@ class Graph(object):
                                                   adjacency_matrix.shape[1]))
 
             # check if adjacency matrix of undirected graph is symmetric
-            if not self._directed and not _is_symmetric(adjacency_matrix):
+            if not self._directed and not self._is_symmetric():
                 raise ValueError('The adjacency matrix of an undirected graph '
                                  'must be symmetric.')
 
-        # store adjacency_matrix
-        if copy:
-            self.adjacency_matrix = adjacency_matrix.copy()
-        else:
-            self.adjacency_matrix = adjacency_matrix
-
     @classmethod
     def init_from_edges(cls, edges, n_vertices, skip_checks=False):
         r"""
@@ -179,6 +193,14 @@ class Graph(object):
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following undirected graph ::
@@ -246,7 +268,8 @@ class Graph(object):
             graph = UndirectedGraph.init_from_edges(edges, n_vertices=6)
 
         """
-        adjacency_matrix = _convert_edges_to_adjacency_matrix(edges, n_vertices)
+        adjacency_matrix = _shared_adjacency_matrix(edges, n_vertices,
+                                                    symmetric=False)
         return cls(adjacency_matrix, copy=False, skip_checks=skip_checks)
 
     @property
@@ -258,6 +281,75 @@ class Graph(object):
         """
         return range(self.adjacency_matrix.shape[0])
 
+    def _cache(self):
+        r"""
+        The cache of the results derived from the adjacency matrix (structure,
+        predecessors, depths, ...). It is emptied whenever the
+        ``adjacency_matrix`` is replaced. Note that modifying the adjacency
+        matrix in place does **not** invalidate the cache.
+
+        Returns
+        -------
+        cache : `dict`
+            The cached results of the current adjacency matrix.
+        """
+        cache = self._graph_cache
+        if cache is None or cache[0] is not self.adjacency_matrix:
+            cache = _SHARED_ADJACENCY_BY_ID.get(id(self.adjacency_matrix))
+            if cache is None or cache[0] is not self.adjacency_matrix:
+                cache = (self.adjacency_matrix, {})
+            self._graph_cache = cache
+        return cache[1]
+
+    def _is_symmetric(self):
+        r"""
+        Whether the adjacency matrix is symmetric.
+
+        Returns
+        -------
+        is_symmetric : `bool`
+            ``True`` if the adjacency matrix is symmetric.
+        """
+        cache = self._cache()
+        if 'is_symmetric' not in cache:
+            cache['is_symmetric'] = _is_symmetric(self.adjacency_matrix)
+        return cache['is_symmetric']
+
+    def _structure(self):
+        r"""
+        The boolean adjacency matrix in canonical CSR format (sorted indices
+        and no explicit zeros), so that the neighbours (children) of vertex
+        ``v`` are ``indices[indptr[v]:indptr[v + 1]]``.
+
+        Returns
+        -------
+        structure : ``(n_vertices, n_vertices)`` `csr_matrix`
+            The structure of the adjacency matrix.
+        """
+        cache = self._cache()
+        if 'structure' not in cache:
+            structure = csr_matrix(self.adjacency_matrix != 0)
+            structure.sort_indices()
+            cache['structure'] = structure
+        return cache['structure']
+
+    def _transposed_structure(self):
+        r"""
+        The transpose of :meth:`_structure` in canonical CSR format, so that
+        the parents of vertex ``v`` are ``indices[indptr[v]:indptr[v + 1]]``.
+
+        Returns
+        -------
+        structure : ``(n_vertices, n_vertices)`` `csr_matrix`
+            The structure of the transposed adjacency matrix.
+        """
+        cache = self._cache()
+        if 'transposed_structure' not in cache:
+            structure = self._structure().transpose().tocsr()
+            structure.sort_indices()
+            cache['transposed_structure'] = structure
+        return cache['transposed_structure']
+
     @property
     def n_vertices(self):
         r"""
@@ -297,7 +389,11 @@ class Graph(object):
             A `list` of the isolated vertices. If there aren't any, it returns
             an empty `list`.
         """
-        return _isolated_vertices(self.adjacency_matrix)
+        cache = self._cache()
+        if 'isolated_vertices' not in cache:
+            cache['isolated_vertices'] = _isolated_vertices(
+                self.adjacency_matrix)
+        return list(cache['isolated_vertices'])
 
     def has_isolated_vertices(self):
         r"""
@@ -322,18 +418,7 @@ class Graph(object):
         adjacency_list : `list` of `list` of length ``n_vertices``
             The adjacency list of the graph.
         """
-        # initialize list with empty lists
-        adjacency_list = [[] for _ in range(self.n_vertices)]
-
-        # get rows/columns of edges
-        rows, cols = self.adjacency_matrix.nonzero()
-
-        # store them accordingly
-        for i in range(rows.shape[0]):
-            from_v = rows[i]
-            to_v = cols[i]
-            adjacency_list[from_v].append(to_v)
-        return adjacency_list
+        return _csr_rows_to_lists(self._structure())
 
     def is_edge(self, vertex_1, vertex_2, skip_checks=False):
         r"""
@@ -447,12 +532,26 @@ class Graph(object):
             return [path]
         if start > self.n_vertices - 1 or start < 0:
             return []
+        adjacency_list = self.get_adjacency_list()
+        on_path = set(path)
         paths = []
-        for v in list(self.adjacency_matrix[start, :].nonzero()[1]):
-            if v not in path:
-                newpaths = self.find_all_paths(v, end, path)
-                for newpath in newpaths:
-                    paths.append(newpath)
+        # iterative depth-first search, so that long paths cannot exceed the
+        # recursion limit. stack[-1] iterates over the neighbours of path[-1]
+        stack = [iter(adjacency_list[start])]
+        while stack:
+            for v in stack[-1]:
+                if v in on_path:
+                    continue
+                if v == end:
+                    paths.append(path + [v])
+                    continue
+                path.append(v)
+                on_path.add(v)
+                stack.append(iter(adjacency_list[v]))
+                break
+            else:
+                stack.pop()
+                on_path.discard(path.pop())
         return paths
 
     def n_paths(self, start, end):
@@ -561,12 +660,13 @@ class Graph(object):
             self._check_vertex(start)
             self._check_vertex(end)
 
-        # find distances and predecessors of all shortest paths
-        (distances, predecessors) = self.find_all_shortest_paths(
-            algorithm=algorithm, unweighted=unweighted)
+        # find distances and predecessors of the shortest paths from start
+        distances, predecessors = csgraph.shortest_path(
+            self.adjacency_matrix, directed=self._directed, method=algorithm,
+            unweighted=unweighted, return_predecessors=True, indices=start)
 
         # retrieve shortest path and its distance
-        if predecessors[start, end] < 0:
+        if predecessors[end] < 0:
             path = []
             distance = np.inf
         else:
@@ -574,9 +674,9 @@ class Graph(object):
             distance = 0
             i = None
             while i != start:
-                i = predecessors[start, path[-1]]
+                i = predecessors[path[-1]]
                 path.append(i)
-                distance += distances[start, path[-1]]
+                distance += distances[path[-1]]
             path.reverse()
         return path, distance
 
@@ -589,7 +689,11 @@ class Graph(object):
         has_cycles : `bool`
             ``True`` if the graph has cycles.
         """
-        return _has_cycles(self.get_adjacency_list(), self._directed)
+        cache = self._cache()
+        if 'has_cycles' not in cache:
+            cache['has_cycles'] = _has_cycles(self._structure(),
+                                              self._directed)
+        return cache['has_cycles']
 
     def is_tree(self):
         r"""
@@ -600,7 +704,11 @@ class Graph(object):
         is_true : `bool`
             If the graph is a tree.
         """
-        return not self.has_cycles() and self.n_edges == self.n_vertices - 1
+        cache = self._cache()
+        if 'is_tree' not in cache:
+            cache['is_tree'] = (not self.has_cycles() and
+                                self.n_edges == self.n_vertices - 1)
+        return cache['is_tree']
 
     def _check_vertex(self, vertex):
         r"""
@@ -741,6 +849,14 @@ class UndirectedGraph(Graph):
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following undirected graph ::
@@ -786,8 +902,8 @@ class UndirectedGraph(Graph):
             graph = UndirectedGraph.init_from_edges(edges, n_vertices=6)
 
         """
-        adjacency_matrix = _convert_edges_to_symmetric_adjacency_matrix(
-            edges, n_vertices)
+        adjacency_matrix = _shared_adjacency_matrix(edges, n_vertices,
+                                                    symmetric=True)
         return cls(adjacency_matrix, copy=False, skip_checks=skip_checks)
 
     @property
@@ -818,7 +934,7 @@ class UndirectedGraph(Graph):
         # check given vertex
         if not skip_checks:
             self._check_vertex(vertex)
-        return list(self.adjacency_matrix[vertex, :].nonzero()[1])
+        return _csr_row(self._structure(), vertex)
 
     def n_neighbours(self, vertex, skip_checks=False):
         r"""
@@ -1007,7 +1123,7 @@ class DirectedGraph(Graph):
         """
         if not skip_checks:
             self._check_vertex(vertex)
-        return list(self.adjacency_matrix[vertex, :].nonzero()[1])
+        return _csr_row(self._structure(), vertex)
 
     def n_children(self, vertex, skip_checks=False):
         r"""
@@ -1055,7 +1171,7 @@ class DirectedGraph(Graph):
         """
         if not skip_checks:
             self._check_vertex(vertex)
-        return list(self.adjacency_matrix[:, vertex].nonzero()[0])
+        return _csr_row(self._transposed_structure(), vertex)
 
     def n_parents(self, vertex, skip_checks=False):
         r"""
@@ -1178,18 +1294,13 @@ class Tree(DirectedGraph):
             # check if root_vertex is valid
             self._check_vertex(root_vertex)
             # check if the tree is properly defined given the root
-            if not np.allclose(
-                    csgraph.breadth_first_tree(self.adjacency_matrix,
-                                               root_vertex,
-                                               directed=True).nonzero(),
-                    self.adjacency_matrix.nonzero()):
+            if not self._is_valid_root(root_vertex):
                 raise ValueError('The combination of adjacency matrix and root '
                                  'vertex is not valid. BFS returns a different '
                                  'tree.')
 
-        # store root and predecessors list
+        # store root
         self.root_vertex = root_vertex
-        self.predecessors_list = self._get_predecessors_list()
 
     @classmethod
     def init_from_edges(cls, edges, n_vertices, root_vertex, copy=True,
@@ -1209,11 +1320,19 @@ class Tree(DirectedGraph):
         root_vertex : `int`
             That vertex that will be set as root.
         copy : `bool`, optional
-            If ``False``, the ``adjacency_matrix`` will not be copied on
-            assignment.
+            Ignored, the ``adjacency_matrix`` built from the edges is never
+            copied, see the Notes.
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following tree ::
@@ -1239,11 +1358,37 @@ class Tree(DirectedGraph):
                               [4, 7], [5, 8]])
             tree = PointTree.init_from_edges(points, edges, root_vertex=0)
         """
-        adjacency_matrix = _convert_edges_to_adjacency_matrix(edges, n_vertices)
-        return cls(adjacency_matrix, root_vertex=root_vertex, copy=copy,
+        adjacency_matrix = _shared_adjacency_matrix(edges, n_vertices,
+                                                    symmetric=False)
+        return cls(adjacency_matrix, root_vertex=root_vertex, copy=False,
                    skip_checks=skip_checks)
 
-    def _get_predecessors_list(self):
+    def _is_valid_root(self, root_vertex):
+        r"""
+        Whether a breadth-first search from ``root_vertex`` returns the tree
+        of the adjacency matrix.
+
+        Parameters
+        ----------
+        root_vertex : `int`
+            The vertex to check as root.
+
+        Returns
+        -------
+        is_valid_root : `bool`
+            ``True`` if the tree is properly defined given the root.
+        """
+        cache = self._cache()
+        key = ('is_valid_root', root_vertex)
+        if key not in cache:
+            cache[key] = np.allclose(
+                csgraph.breadth_first_tree(self.adjacency_matrix, root_vertex,
+                                           directed=True).nonzero(),
+                self.adjacency_matrix.nonzero())
+        return cache[key]
+
+    @property
+    def predecessors_list(self):
         r"""
         Returns the predecessors list of the tree, i.e. a `list` of length
         ``n_vertices`` that stores the parent for each vertex. The value of the
@@ -1251,18 +1396,48 @@ class Tree(DirectedGraph):
 
         :type: `list` of length ``n_vertices``
         """
-        # initialize list with None
-        predecessors_list = [None] * self.n_vertices
+        cache = self._cache()
+        if 'predecessors_list' not in cache:
+            cache['predecessors_list'] = [None if p < 0 else p for p in
+                                          self._predecessors().tolist()]
+        return cache['predecessors_list']
+
+    def _predecessors(self):
+        r"""
+        The parent of each vertex (``-1`` for the root).
 
-        # get rows/columns of edges
-        parents, children = self.adjacency_matrix.nonzero()
+        Returns
+        -------
+        predecessors : ``(n_vertices,)`` `ndarray`
+            The parent of each vertex.
+        """
+        cache = self._cache()
+        if 'predecessors' not in cache:
+            parents, children = self._structure().nonzero()
+            predecessors = np.full(self.n_vertices, -1, dtype=np.int64)
+            predecessors[children] = parents
+            cache['predecessors'] = predecessors
+        return cache['predecessors']
+
+    def _depths(self):
+        r"""
+        The depth of each vertex, found with a single breadth-first search
+        from the root (``-1`` for the vertices that cannot be reached from the
+        root).
 
-        # store them accordingly
-        for i in range(children.shape[0]):
-            parent = parents[i]
-            child = children[i]
-            predecessors_list[child] = parent
-        return predecessors_list
+        Returns
+        -------
+        depths : ``(n_vertices,)`` `ndarray`
+            The depth of each vertex.
+        """
+        cache = self._cache()
+        if 'depths' not in cache:
+            depths = csgraph.shortest_path(self._structure(), method='D',
+                                           directed=True, unweighted=True,
+                                           indices=self.root_vertex)
+            depths[np.isinf(depths)] = -1
+            cache['depths'] = depths.astype(np.int64)
+        return cache['depths']
 
     def depth_of_vertex(self, vertex, skip_checks=False):
         r"""
@@ -1287,13 +1462,7 @@ class Tree(DirectedGraph):
         """
         if not skip_checks:
             self._check_vertex(vertex)
-        parent = vertex
-        depth = 0
-        while not parent == self.root_vertex:
-            current = parent
-            parent = self.predecessors_list[current]
-            depth += 1
-        return depth
+        return int(self._depths()[vertex])
 
     @property
     def maximum_depth(self):
@@ -1302,8 +1471,7 @@ class Tree(DirectedGraph):
 
         :type: `int`
         """
-        all_depths = [self.depth_of_vertex(v) for v in range(self.n_vertices)]
-        return np.max(all_depths)
+        return int(self._depths().max())
 
     def vertices_at_depth(self, depth):
         r"""
@@ -1319,11 +1487,7 @@ class Tree(DirectedGraph):
         vertices : `list`
             The vertices that lie in the specified depth.
         """
-        ver = []
-        for v in range(self.n_vertices):
-            if self.depth_of_vertex(v) == depth:
-                ver.append(v)
-        return ver
+        return np.nonzero(self._depths() == depth)[0].tolist()
 
     def n_vertices_at_depth(self, depth):
         r"""
@@ -1339,11 +1503,7 @@ class Tree(DirectedGraph):
         n_vertices : `int`
             The number of vertices that lie in the specified depth.
         """
-        n_ver = 0
-        for v in range(self.n_vertices):
-            if self.depth_of_vertex(v) == depth:
-                n_ver += 1
-        return n_ver
+        return int(np.count_nonzero(self._depths() == depth))
 
     def is_leaf(self, vertex, skip_checks=False):
         r"""
@@ -1368,7 +1528,8 @@ class Tree(DirectedGraph):
         """
         if not skip_checks:
             self._check_vertex(vertex)
-        return len(self.children(vertex)) == 0
+        indptr = self._structure().indptr
+        return indptr[vertex + 1] == indptr[vertex]
 
     @property
     def leaves(self):
@@ -1377,11 +1538,7 @@ class Tree(DirectedGraph):
 
         :type: `list`
         """
-        leaves = []
-        for v in range(self.n_vertices):
-            if self.is_leaf(v):
-                leaves.append(v)
-        return leaves
+        return np.nonzero(np.diff(self._structure().indptr) == 0)[0].tolist()
 
     @property
     def n_leaves(self):
@@ -1415,7 +1572,8 @@ class Tree(DirectedGraph):
         """
         if not skip_checks:
             self._check_vertex(vertex)
-        return self.predecessors_list[vertex]
+        parent = self._predecessors()[vertex]
+        return None if parent < 0 else parent
 
     def __str__(self):
         return "Tree of depth {} with {} vertices and {} leaves.".format(
@@ -1554,6 +1712,8 @@ class PointGraph(Graph, PointCloud):
                                                  [2, 0, 4, 2, 4, 3])),
                                       shape=(6, 6))
     """
+    _cache_attributes = PointCloud._cache_attributes + ('_graph_cache',)
+
     def __init__(self, points, adjacency_matrix, copy=True, skip_checks=False):
         if not skip_checks:
             # check the number of points
@@ -1562,6 +1722,36 @@ class PointGraph(Graph, PointCloud):
                        skip_checks=skip_checks)
         PointCloud.__init__(self, points, copy=copy)
 
+    def copy(self):
+        r"""
+        Generate an efficient copy of this graph. The points are copied. A
+        shared, read-only adjacency matrix (see :meth:`init_from_edges`) and
+        the cache of the results derived from it are shared with the copy,
+        any other adjacency matrix is copied.
+
+        Returns
+        -------
+        ``type(self)``
+            A copy of this object
+        """
+        new = self.__class__.__new__(self.__class__)
+        shared = _is_shared_adjacency_matrix(self.adjacency_matrix)
+        for k, v in self.__dict__.items():
+            if k in PointCloud._cache_attributes:
+                continue
+            if k == '_graph_cache':
+                if shared:
+                    new.__dict__[k] = v
+                continue
+            if k == 'adjacency_matrix' and shared:
+                new.__dict__[k] = v
+                continue
+            try:
+                new.__dict__[k] = v.copy()
+            except AttributeError:
+                new.__dict__[k] = v
+        return new
+
     @classmethod
     def init_from_edges(cls, points, edges, copy=True, skip_checks=False):
         r"""
@@ -1575,11 +1765,19 @@ class PointGraph(Graph, PointCloud):
             The `ndarray` of edges, i.e. all the pairs of vertices that are
             connected with an edge.
         copy : `bool`, optional
-            If ``False``, the ``adjacency_matrix`` will not be copied on
-            assignment.
+            If ``False``, the ``points`` will not be copied on assignment.
+            The ``adjacency_matrix`` is never copied, see the Notes.
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following undirected graph ::
@@ -1653,9 +1851,12 @@ class PointGraph(Graph, PointCloud):
             graph = PointUndirectedGraph.init_from_edges(points, edges)
 
         """
-        adjacency_matrix = _convert_edges_to_adjacency_matrix(edges,
-                                                              points.shape[0])
-        return cls(points, adjacency_matrix, copy=copy, skip_checks=skip_checks)
+        adjacency_matrix = _shared_adjacency_matrix(edges, points.shape[0],
+                                                    symmetric=False)
+        if copy:
+            points = points.copy()
+        return cls(points, adjacency_matrix, copy=False,
+                   skip_checks=skip_checks)
 
     @classmethod
     def init_2d_grid(cls, shape, spacing=None, adjacency_matrix=None,
@@ -2498,11 +2699,19 @@ class PointUndirectedGraph(PointGraph, UndirectedGraph):
             The `ndarray` of edges, i.e. all the pairs of vertices that are
             connected with an edge.
         copy : `bool`, optional
-            If ``False``, the ``adjacency_matrix`` will not be copied on
-            assignment.
+            If ``False``, the ``points`` will not be copied on assignment.
+            The ``adjacency_matrix`` is never copied, see the Notes.
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following undirected graph ::
@@ -2553,9 +2762,12 @@ class PointUndirectedGraph(PointGraph, UndirectedGraph):
             graph = PointUndirectedGraph.init_from_edges(points, edges)
 
         """
-        adjacency_matrix = _convert_edges_to_symmetric_adjacency_matrix(
-            edges, points.shape[0])
-        return cls(points, adjacency_matrix, copy=copy, skip_checks=skip_checks)
+        adjacency_matrix = _shared_adjacency_matrix(edges, points.shape[0],
+                                                    symmetric=True)
+        if copy:
+            points = points.copy()
+        return cls(points, adjacency_matrix, copy=False,
+                   skip_checks=skip_checks)
 
     def from_mask(self, mask):
         """
@@ -2957,11 +3169,19 @@ class PointTree(PointDirectedGraph, Tree):
         root_vertex : `int`
             That vertex that will be set as root.
         copy : `bool`, optional
-            If ``False``, the ``adjacency_matrix`` will not be copied on
-            assignment.
+            If ``False``, the ``points`` will not be copied on assignment.
+            The ``adjacency_matrix`` is never copied, see the Notes.
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
 
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``. To edit it,
+        build a new graph from ``graph.adjacency_matrix`` with ``copy=True``,
+        which takes a private, writeable copy.
         Examples
         --------
         The following tree ::
@@ -2987,10 +3207,12 @@ class PointTree(PointDirectedGraph, Tree):
                               [4, 7], [5, 8]])
             tree = PointTree.init_from_edges(points, edges, root_vertex=0)
         """
-        adjacency_matrix = _convert_edges_to_adjacency_matrix(edges,
-                                                              points.shape[0])
-        return cls(points, adjacency_matrix, root_vertex,
-                   copy=copy, skip_checks=skip_checks)
+        adjacency_matrix = _shared_adjacency_matrix(edges, points.shape[0],
+                                                    symmetric=False)
+        if copy:
+            points = points.copy()
+        return cls(points, adjacency_matrix, root_vertex, copy=False,
+                   skip_checks=skip_checks)
 
     @classmethod
     def init_2d_grid(cls, shape, spacing=None, adjacency_matrix=None,
@@ -3235,15 +3457,17 @@ def _check_n_points(points, adjacency_matrix):
                                         adjacency_matrix.shape[0]))
 
 
-def _has_cycles(adjacency_list, directed):
+def _has_cycles(adjacency_matrix, directed):
     r"""
-    Function that checks if the provided directed graph has cycles using a Depth
-    First Search (DFS).
+    Function that checks if the provided graph has cycles. A directed graph
+    has a cycle if any of its strongly connected components has more than
+    one vertex. An undirected graph has a cycle if it has more edges than a
+    forest with the same connected components.
 
     Parameters
     ----------
-    adjacency_list : `list` of `list` of length ``n_vertices``
-        The adjacency list of the graph.
+    adjacency_matrix : ``(n_vertices, n_vertices, )`` `csr_matrix`
+        The adjacency matrix of the graph, without explicit zeros.
     directed : `bool`
         Defines if the provided graph is directed or not.
 
@@ -3252,23 +3476,58 @@ def _has_cycles(adjacency_list, directed):
     has_cycles : `bool`
         Whether the graph has cycles.
     """
-    def dfs(node, entered, exited, tree_edges, back_edges):
-        if node not in entered:
-            entered.add(node)
-            for y in adjacency_list[node]:
-                if y not in entered:
-                    tree_edges[y] = node
-                elif (not directed and tree_edges.get(node, None) != y
-                      or directed and y not in exited):
-                    back_edges.setdefault(y, set()).add(node)
-                dfs(y, entered, exited, tree_edges, back_edges)
-            exited.add(node)
-        return tree_edges, back_edges
-    for x in range(len(adjacency_list)):
-        if dfs(x, entered=set(), exited=set(), tree_edges={}, back_edges={})[1]:
-            return True
+    # self loops are cycles
+    if adjacency_matrix.diagonal().any():
+        return True
+    n_vertices = adjacency_matrix.shape[0]
+    if directed:
+        n_components = csgraph.connected_components(
+            adjacency_matrix, directed=True, connection='strong',
+            return_labels=False)
+        return n_components < n_vertices
     else:
-        return False
+        n_components = csgraph.connected_components(
+            adjacency_matrix, directed=False, return_labels=False)
+        n_edges = triu(adjacency_matrix, k=1).nnz
+        return n_edges > n_vertices - n_components
+
+
+def _csr_row(matrix, row):
+    r"""
+    The column indices of the entries of a row of a CSR matrix.
+
+    Parameters
+    ----------
+    matrix : `csr_matrix`
+        The matrix.
+    row : `int`
+        The selected row.
+
+    Returns
+    -------
+    columns : `list`
+        The columns of the row's entries.
+    """
+    return matrix.indices[matrix.indptr[row]:matrix.indptr[row + 1]].tolist()
+
+
+def _csr_rows_to_lists(matrix):
+    r"""
+    The column indices of the entries of every row of a CSR matrix.
+
+    Parameters
+    ----------
+    matrix : `csr_matrix`
+        The matrix.
+
+    Returns
+    -------
+    columns : `list` of `list`
+        The columns of the entries of each row.
+    """
+    indices = matrix.indices.tolist()
+    indptr = matrix.indptr.tolist()
+    return [indices[i:j] for i, j in zip(indptr[:-1], indptr[1:])]
 
 
 def _mask_adjacency_matrix_and_points(mask, adjacency_matrix, points):
@@ -3302,12 +3561,75 @@ def _mask_adjacency_matrix_and_points(mask, adjacency_matrix, points):
 
 
 def _isolated_vertices(adjacency_matrix):
-    all_vertices = set(range(adjacency_matrix.shape[0]))
-    # find the set difference between {0, 1, ..., n_vertices} and the set
-    # of rows (columns) that have at least one non-zero element.
-    rows = all_vertices.difference(set(adjacency_matrix.nonzero()[0]))
-    cols = all_vertices.difference(set(adjacency_matrix.nonzero()[1]))
-    return list(rows.intersection(cols))
+    # the vertices that appear in no row nor column with a non-zero element
+    rows, cols = adjacency_matrix.nonzero()
+    connected = np.zeros(adjacency_matrix.shape[0], dtype=np.bool)
+    connected[rows] = True
+    connected[cols] = True
+    return np.nonzero(~connected)[0].tolist()
+
+
+def _shared_adjacency_matrix(edges, n_vertices, symmetric):
+    r"""
+    Converts an edges array to a read-only adjacency matrix that is shared by
+    every graph built from the same edges. The most recently used matrices
+    are kept, so that the shapes of a template (for instance all the 68 point
+    faces) share one adjacency matrix and the cache of its derived results.
+    Graphs with too many edges to be templates get their own (writeable)
+    matrix.
+
+    Parameters
+    ----------
+    edges : ``(n_edges, 2, )`` `ndarray` or ``None``
+        The `ndarray` of edges, i.e. all the pairs of vertices that are
+        connected with an edge.
+    n_vertices : `int`
+        The total number of vertices, assuming that the numbering of
+        vertices starts from ``0``.
+    symmetric : `bool`
+        If ``True``, the edges are undirected and the adjacency matrix is
+        symmetric.
+
+    Returns
+    -------
+    adjacency_matrix : ``(n_vertices, n_vertices, )`` `csr_matrix`
+        The adjacency matrix of the graph in which the rows represent source
+        vertices and columns represent destination vertices.
+    """
+    convert = (_convert_edges_to_symmetric_adjacency_matrix if symmetric
+               else _convert_edges_to_adjacency_matrix)
+    edges = np.zeros([0, 2], dtype=np.int64) if edges is None else \
+        np.asarray(edges, dtype=np.int64)
+    if edges.shape[0] > _SHARED_ADJACENCY_MAX_EDGES:
+        return convert(edges, n_vertices)
+    key = (symmetric, n_vertices, edges.shape, edges.tobytes())
+    entry = _SHARED_ADJACENCY.get(key)
+    if entry is None:
+        adjacency_matrix = convert(edges, n_vertices)
+        # canonical format, so scipy never needs to sort or sum in place
+        adjacency_matrix.sum_duplicates()
+        for a in (adjacency_matrix.data, adjacency_matrix.indices,
+                  adjacency_matrix.indptr):
+            a.flags.writeable = False
+        entry = (adjacency_matrix, {})
+        _SHARED_ADJACENCY[key] = entry
+        _SHARED_ADJACENCY_BY_ID[id(adjacency_matrix)] = entry
+        if len(_SHARED_ADJACENCY) > _SHARED_ADJACENCY_MAX_ENTRIES:
+            evicted = _SHARED_ADJACENCY.popitem(last=False)[1]
+            del _SHARED_ADJACENCY_BY_ID[id(evicted[0])]
+    else:
+        # most recently used last
+        _SHARED_ADJACENCY[key] = _SHARED_ADJACENCY.pop(key)
+    return entry[0]
+
+
+def _is_shared_adjacency_matrix(adjacency_matrix):
+    r"""
+    Whether an adjacency matrix was returned by
+    :func:`_shared_adjacency_matrix` (and so is read-only).
+    """
+    entry = _SHARED_ADJACENCY_BY_ID.get(id(adjacency_matrix))
+    return entry is not None and entry[0] is adjacency_matrix
 
 
 def _convert_edges_to_adjacency_matrix(edges, n_vertices):
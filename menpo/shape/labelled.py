@@ -3,12 +3,17 @@ from collections import OrderedDict
 
 import numpy as np
 
-from menpo.base import Copyable
 from menpo.shape import PointUndirectedGraph, PointCloud, TriMesh
 from menpo.shape.graph import (_convert_edges_to_symmetric_adjacency_matrix,
-                               PointGraph)
+                               _shared_adjacency_matrix, PointGraph)
 from menpo.visualize import viewwrapper
 
+# The label indices built by _shared_label_index, by their content. A label
+# index is shared by every graph with the same labels (for instance all the
+# outputs of a labeller), so its label selections are computed once.
+_SHARED_LABEL_INDEX = OrderedDict()
+_SHARED_LABEL_INDEX_MAX_ENTRIES = 128
+
 
 def indices_to_masks(labels_to_indices, n_points):
     r"""
@@ -37,6 +42,156 @@ def indices_to_masks(labels_to_indices, n_points):
     return masks
 
 
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+class _LabelIndex(object):
+    r"""
+    The immutable labels of a :map:`LabelledPointUndirectedGraph`: the sorted
+    point indices of each label. Labels may overlap (for instance an ``'all'``
+    label next to the parts of a face), so the points of a label are stored
+    as indices rather than as one label id per point.
+
+    A label index is shared (never copied) by copies of the graph and caches
+    the subgraphs of the label selections made with :meth:`select`.
+
+    Parameters
+    ----------
+    labels_to_indices : `OrderedDict` {`str` -> `int ndarray`}
+        The sorted, unique point indices of each label.
+    n_points : `int`
+        The number of points of the graph.
+    """
+    def __init__(self, labels_to_indices, n_points):
+        self.labels_to_indices = OrderedDict(
+            (l, _readonly(np.asarray(i, dtype=np.int64)))
+            for l, i in labels_to_indices.items())
+        self.n_points = n_points
+        self._labels_to_masks = None
+        self._selections = {}
+
+    def __getstate__(self):
+        return {'labels_to_indices': self.labels_to_indices,
+                'n_points': self.n_points}
+
+    def __setstate__(self, state):
+        self.__init__(state['labels_to_indices'], state['n_points'])
+
+    def masks(self):
+        r"""
+        The read-only boolean mask of each label.
+
+        Returns
+        -------
+        labels_to_masks : `OrderedDict` {`str` -> `bool ndarray`}
+            The mask of each label.
+        """
+        if self._labels_to_masks is None:
+            masks = OrderedDict()
+            for label, indices in self.labels_to_indices.items():
+                mask = np.zeros(self.n_points, dtype=np.bool)
+                mask[indices] = True
+                masks[label] = _readonly(mask)
+            self._labels_to_masks = masks
+        return self._labels_to_masks
+
+    def unlabelled_points(self):
+        r"""
+        The points that do not belong to any label.
+
+        Returns
+        -------
+        indices : ``(n_unlabelled,)`` `ndarray`
+            The indices of the unlabelled points.
+        """
+        labelled = np.zeros(self.n_points, dtype=np.bool)
+        for indices in self.labels_to_indices.values():
+            labelled[indices] = True
+        return np.flatnonzero(~labelled)
+
+    def select(self, labels, adjacency_matrix):
+        r"""
+        The subgraph of the points that belong to any of the given labels.
+        The selection is cached, so selecting the same labels again costs
+        nothing but the lookup.
+
+        Parameters
+        ----------
+        labels : `list` of `str`
+            The labels to keep.
+        adjacency_matrix : ``(n_points, n_points)`` `csr_matrix`
+            The adjacency matrix of the graph.
+
+        Returns
+        -------
+        indices : ``(n_kept,)`` `ndarray`
+            The sorted indices of the kept points.
+        label_index : `_LabelIndex`
+            The labels of the kept points, in the kept point numbering.
+        adjacency_matrix : ``(n_kept, n_kept)`` `csr_matrix`
+            The read-only adjacency matrix of the kept points.
+        """
+        key = tuple(labels)
+        selection = self._selections.get(key)
+        if selection is None:
+            kept = np.unique(np.concatenate(
+                [self.labels_to_indices[l] for l in labels] +
+                [np.zeros(0, dtype=np.int64)]))
+            label_index = _LabelIndex(
+                OrderedDict((l, np.searchsorted(kept, self.labels_to_indices[l]))
+                            for l in labels), kept.shape[0])
+            # [indices, label_index, adjacency_matrix, sub adjacency_matrix]
+            selection = [_readonly(kept), label_index, None, None]
+            self._selections[key] = selection
+        if selection[2] is not adjacency_matrix:
+            kept = selection[0]
+            sub_adjacency = adjacency_matrix[kept, :][:, kept].tocsr()
+            sub_adjacency.sum_duplicates()
+            for a in (sub_adjacency.data, sub_adjacency.indices,
+                      sub_adjacency.indptr):
+                _readonly(a)
+            selection[2:] = [adjacency_matrix, sub_adjacency]
+        return selection[0], selection[1], selection[3]
+
+
+def _shared_label_index(labels_to_indices, n_points):
+    r"""
+    A :class:`_LabelIndex` for the given labels that is shared by every graph
+    with the same labels. The most recently used label indices are kept.
+
+    Parameters
+    ----------
+    labels_to_indices : `OrderedDict` {`str` -> `int ndarray`}
+        The sorted, unique point indices of each label.
+    n_points : `int`
+        The number of points of the graph.
+
+    Returns
+    -------
+    label_index : `_LabelIndex`
+        The label index.
+    """
+    indices = [np.asarray(i, dtype=np.int64)
+               for i in labels_to_indices.values()]
+    key = (n_points, tuple(labels_to_indices.keys()),
+           tuple(i.shape[0] for i in indices),
+           np.concatenate(indices + [np.zeros(0, dtype=np.int64)]).tobytes())
+    try:
+        label_index = _SHARED_LABEL_INDEX.pop(key)
+    except TypeError:
+        # unhashable labels cannot be shared
+        return _LabelIndex(labels_to_indices, n_points)
+    except KeyError:
+        label_index = _LabelIndex(labels_to_indices, n_points)
+        if len(_SHARED_LABEL_INDEX) >= _SHARED_LABEL_INDEX_MAX_ENTRIES:
+            _SHARED_LABEL_INDEX.popitem(last=False)
+    # most recently used last
+    _SHARED_LABEL_INDEX[key] = label_index
+    return label_index
+
+
 class LabelledPointUndirectedGraph(PointUndirectedGraph):
     r"""
     A subclass of :map:`PointUndirectedGraph` that allows the attaching
@@ -60,9 +215,11 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         :Note: ``adjacency_matrix`` must be symmetric.
     labels_to_masks : `ordereddict` {`str` -> `bool ndarray`}
         For each label, the mask that specifies the indices in to the
-        points that belong to the label.
+        points that belong to the label. The labels are stored as the sorted
+        point indices of each label, which are immutable and shared by copies
+        of the graph.
     copy : `bool`, optional
-        If ``True``, a copy of the data is stored.
+        If ``True``, a copy of the points and adjacency matrix is stored.
 
     Raises
     ------
@@ -84,20 +241,42 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         if not labels_to_masks:
             raise ValueError('Labelled point graphs are designed to be '
                              'immutable. Empty label sets are not permitted.')
-        if np.vstack(labels_to_masks.values()).shape[1] != points.shape[0]:
+        if np.vstack(list(labels_to_masks.values())).shape[1] != \
+                points.shape[0]:
             raise ValueError('Each mask must have the same number of points '
                              'as the given points.')
         if not isinstance(labels_to_masks, OrderedDict):
             raise ValueError('Must provide an OrderedDict to maintain the '
                              'semantic meaning of the labels.')
 
+        self._label_index = _shared_label_index(
+            OrderedDict((l, np.flatnonzero(m))
+                        for l, m in labels_to_masks.items()),
+            points.shape[0])
         # Another sanity check
-        self._labels_to_masks = labels_to_masks
         self._verify_all_labels_masked()
 
-        if copy:
-            self._labels_to_masks = OrderedDict([(l, m.copy()) for l, m in
-                                                 labels_to_masks.items()])
+    @classmethod
+    def _init_from_label_index(cls, points, adjacency_matrix, label_index,
+                               copy=True):
+        r"""
+        Build a graph with an existing (valid) label index, skipping all the
+        checks.
+        """
+        new = cls.__new__(cls)
+        PointUndirectedGraph.__init__(new, points, adjacency_matrix,
+                                      copy=copy, skip_checks=True)
+        new._label_index = label_index
+        return new
+
+    @property
+    def _labels_to_masks(self):
+        r"""
+        The read-only mask of each label (in a new `OrderedDict`).
+
+        :type: `OrderedDict` {`str` -> `bool ndarray`}
+        """
+        return OrderedDict(self._label_index.masks())
 
     @classmethod
     def init_with_all_label(cls, points, adjacency_matrix, copy=True):
@@ -165,11 +344,11 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
             by a label.
         """
         adjacency = np.array(adjacency)
-        if adjacency.shape[0] != adjacency.shape[1] and adjacency.shape[1] == 2:
-            adjacency = _convert_edges_to_symmetric_adjacency_matrix(
-                adjacency, points.shape[0])
         labels_to_masks = indices_to_masks(labels_to_indices,
                                            points.shape[0])
+        if adjacency.shape[0] != adjacency.shape[1] and adjacency.shape[1] == 2:
+            return LabelledPointUndirectedGraph.init_from_edges(
+                points, adjacency, labels_to_masks, copy=copy)
         return LabelledPointUndirectedGraph(points, adjacency, labels_to_masks,
                                             copy=copy)
 
@@ -193,14 +372,23 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
             For each label, the mask that specifies the indices in to the
             points that belong to the label.
         copy : `bool`, optional
-            If ``False``, the `adjacency_matrix` will not be copied on
-            assignment.
+            If ``False``, the ``points`` will not be copied on assignment.
+            The ``adjacency_matrix`` is never copied, see the Notes.
         skip_checks : `bool`, optional
             If ``True``, no checks will be performed.
+
+        Notes
+        -----
+        Graphs built from the same edges share a single read-only
+        ``adjacency_matrix`` (unless there are too many edges to cache), along
+        with the results derived from it. Modifying it in place raises
+        ``ValueError: assignment destination is read-only``.
         """
-        adjacency_matrix = _convert_edges_to_symmetric_adjacency_matrix(
-            edges, points.shape[0])
-        return cls(points, adjacency_matrix, labels_to_masks, copy=copy,
+        adjacency_matrix = _shared_adjacency_matrix(edges, points.shape[0],
+                                                    symmetric=True)
+        if copy:
+            points = points.copy()
+        return cls(points, adjacency_matrix, labels_to_masks, copy=False,
                    skip_checks=skip_checks)
 
     def __setstate__(self, state_dict):
@@ -239,21 +427,27 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
                     type(_pointcloud)))
             state_dict['adjacency_matrix'] = adj_mat
 
+        if '_labels_to_masks' in state_dict:
+            # labels stored as masks before the label index
+            masks = state_dict.pop('_labels_to_masks')
+            n_points = state_dict['points'].shape[0]
+            state_dict['_label_index'] = _shared_label_index(
+                OrderedDict((l, np.flatnonzero(m)) for l, m in masks.items()),
+                n_points)
         self.__dict__.update(state_dict)
 
     def copy(self):
         r"""
         Generate an efficient copy of this :map:`LabelledPointUndirectedGraph`.
+        The (immutable) labels are shared with the copy, as is the adjacency
+        matrix if it is shared and read-only (see :meth:`init_from_edges`).
 
         Returns
         -------
         ``type(self)``
             A copy of this object
         """
-        new = Copyable.copy(self)
-        for k, v in new._labels_to_masks.items():
-            new._labels_to_masks[k] = v.copy()
-        return new
+        return PointUndirectedGraph.copy(self)
 
     def add_label(self, label, indices):
         """
@@ -276,7 +470,10 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         new = self.copy()
         mask = np.zeros(self.n_points, dtype=np.bool)
         mask[indices] = True
-        new._labels_to_masks[label] = mask
+        labels_to_indices = OrderedDict(self._label_index.labels_to_indices)
+        labels_to_indices[label] = np.flatnonzero(mask)
+        new._label_index = _shared_label_index(labels_to_indices,
+                                               self.n_points)
         return new
 
     def get_label(self, label):
@@ -295,8 +492,10 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
             The PointUndirectedGraph containing the subset of points that this
             label masks. Will be a subset of the entire group's points.
         """
-        mask = self._labels_to_masks[label]
-        return PointUndirectedGraph.from_mask(self, mask)
+        indices, _, adjacency_matrix = self._label_index.select(
+            [label], self.adjacency_matrix)
+        return PointUndirectedGraph(self.points[indices], adjacency_matrix,
+                                    copy=False, skip_checks=True)
 
     def remove_label(self, label):
         """
@@ -320,10 +519,10 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
             If deleting the label would leave some points unlabelled.
         """
         new = self.copy()
-        # Pop the value off, which is akin to deleting it (removes it from the
-        # underlying dict). However, we keep it around so we can check if
-        # removing it causes an unlabelled point
-        new._labels_to_masks.pop(label)
+        labels_to_indices = OrderedDict(self._label_index.labels_to_indices)
+        labels_to_indices.pop(label)
+        new._label_index = _shared_label_index(labels_to_indices,
+                                               self.n_points)
         new._verify_all_labels_masked()
         return new
 
@@ -336,7 +535,7 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         """
         # Convert to list so that we can index immediately, as keys()
         # is a view in Python 3
-        return list(self._labels_to_masks.keys())
+        return list(self._label_index.labels_to_indices.keys())
 
     @property
     def n_labels(self):
@@ -401,7 +600,7 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         # Make it easier to use by accepting a single string as well as a list
         if isinstance(labels, str):
             labels = [labels]
-        labels_to_keep = list(set(self.labels).difference(labels))
+        labels_to_keep = [l for l in self.labels if l not in labels]
         return self._new_group_with_only_labels(labels_to_keep)
 
     def _verify_all_labels_masked(self):
@@ -410,11 +609,9 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         If any one point is not covered by a label, then raise a
         ``ValueError``.
         """
-        # values is a generator in Python 3, so convert to list
-        labels_values = list(self._labels_to_masks.values())
-        unlabelled_points = np.sum(labels_values, axis=0) == 0
-        if np.any(unlabelled_points):
-            nonzero = np.nonzero(unlabelled_points)
+        unlabelled_points = self._label_index.unlabelled_points()
+        if unlabelled_points.shape[0] > 0:
+            nonzero = (unlabelled_points,)
             raise ValueError(
                 'Every point in the landmark pointcloud must be labelled. '
                 'Points {0} were unlabelled.'.format(nonzero))
@@ -440,16 +637,10 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
                              'group. Available labels are: {1}'.format(
                 list(set_difference), self.labels))
 
-        masks_to_keep = [self._labels_to_masks[l] for l in labels
-                         if l in self._labels_to_masks]
-        overlap = np.sum(masks_to_keep, axis=0) > 0
-        masks_to_keep = [l[overlap] for l in masks_to_keep]
-
-        new_graph = self.from_mask(overlap)
-        return LabelledPointUndirectedGraph(new_graph.points,
-                                            new_graph.adjacency_matrix,
-                                            OrderedDict(zip(labels,
-                                                            masks_to_keep)))
+        indices, label_index, adjacency_matrix = self._label_index.select(
+            labels, self.adjacency_matrix)
+        return LabelledPointUndirectedGraph._init_from_label_index(
+            self.points[indices], adjacency_matrix, label_index, copy=False)
 
     def tojson(self):
         r"""
@@ -461,9 +652,10 @@ class LabelledPointUndirectedGraph(PointUndirectedGraph):
         json : ``dict``
             Dictionary conforming to the LJSON v2 specification.
         """
-        labels = [{'mask': mask.nonzero()[0].tolist(),
+        labels = [{'mask': indices.tolist(),
                    'label': label}
-                  for label, mask in self._labels_to_masks.items()]
+                  for label, indices in
+                  self._label_index.labels_to_indices.items()]
         lms_dict = PointUndirectedGraph.tojson(self)
         lms_dict['labels'] = labels
         return lms_dict
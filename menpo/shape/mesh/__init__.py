@@ -1,3 +1,5 @@
 from .base import TriMesh
 from .coloured import ColouredTriMesh
 from .textured import TexturedTriMesh
+from .topology import TriMeshTopology
+from .geodesic import HeatGeodesics
@@ -1,11 +1,16 @@
 # coding=utf-8
-from collections import Counter
 import numpy as np
 from warnings import warn
 
+from menpo.base import copy_landmarks_and_path
 from .. import PointCloud
 from ..adjacency import mask_adjacency_array, reindex_adjacency_array
-from .normals import compute_vertex_normals, compute_face_normals
+from .normals import (compute_face_normals_and_areas,
+                      compute_vertex_normals_from_incidence)
+from .topology import TriMeshTopology
+from .laplacian import (triangle_cotangents, cotangent_laplacian,
+                        barycentric_mass_matrix,
+                        _with_unit_mass_for_isolated_points)
 
 
 Delaunay = None  # expensive, from scipy.spatial
@@ -133,6 +138,13 @@ class TriMesh(PointCloud):
         Any trilist will also not be copied.
         In general this should only be used if you know what you are doing.
     """
+    _cache_attributes = PointCloud._cache_attributes + ('_topology',
+                                                        '_geometry_cache')
+    # (trilist, topology) of the cached topology, see the topology property
+    _topology = None
+    # (points, trilist, dict) of the cached normals and areas, see _geometry
+    _geometry_cache = None
+
     def __init__(self, points, trilist=None, copy=True):
         super(TriMesh, self).__init__(points, copy=copy)
         if trilist is None:
@@ -229,6 +241,74 @@ class TriMesh(PointCloud):
         """
         return len(self.trilist)
 
+    @property
+    def topology(self):
+        r"""
+        The edge topology of the triangle list. It is built on first use and
+        cached until the trilist is replaced. Copies of this mesh share it.
+        Note that modifying the ``trilist`` array in place does **not**
+        invalidate the cache.
+
+        :type: :map:`TriMeshTopology`
+        """
+        cache = self._topology
+        if (cache is None or cache[0] is not self.trilist or
+                cache[1].n_points < self.n_points):
+            cache = (self.trilist, TriMeshTopology(self.trilist,
+                                                   self.n_points))
+            self._topology = cache
+        return cache[1]
+
+    def copy(self):
+        r"""
+        Generate an efficient copy of this :map:`TriMesh`. The (immutable)
+        topology of the triangle list is shared with the copy, but the cached
+        geometry (normals, areas, Laplacian, ...) is not, as the points of the
+        copy may be modified in place.
+
+        Returns
+        -------
+        ``type(self)``
+            A copy of this object
+        """
+        new = super(TriMesh, self).copy()
+        if self._topology is not None and self._topology[0] is self.trilist:
+            new._topology = (new.trilist, self._topology[1])
+        return new
+
+    def _geometry(self):
+        r"""
+        The cache of the quantities derived from the points and the trilist
+        (normals and areas). It is emptied whenever either the points or the
+        trilist are replaced (for instance by :meth:`from_vector_inplace`).
+        Note that modifying either array in place does **not** invalidate the
+        cache.
+
+        Returns
+        -------
+        cache : `dict`
+            The cached geometry of the current points and trilist.
+        """
+        cache = self._geometry_cache
+        if (cache is None or cache[0] is not self.points or
+                cache[1] is not self.trilist):
+            cache = (self.points, self.trilist, {})
+            self._geometry_cache = cache
+        return cache[2]
+
+    def _tri_normals_and_areas(self):
+        geometry = self._geometry()
+        if 'tri_normals' not in geometry:
+            points = self.points
+            if points.dtype not in (np.float32, np.float64):
+                points = points.astype(np.float64)
+            normals, areas = compute_face_normals_and_areas(
+                np.ascontiguousarray(points),
+                np.ascontiguousarray(self.trilist))
+            geometry['tri_normals'] = normals
+            geometry['tri_areas'] = areas
+        return geometry['tri_normals'], geometry['tri_areas']
+
     def tojson(self):
         r"""
         Convert this :map:`TriMesh` to a dictionary representation suitable
@@ -346,7 +426,8 @@ class TriMesh(PointCloud):
     def vertex_normals(self):
         r"""
         Compute the per-vertex normals from the current set of points and
-        triangle list. Only valid for 3D dimensional meshes.
+        triangle list. Only valid for 3D dimensional meshes. The normals are
+        cached until the points or the trilist are replaced.
 
         Returns
         -------
@@ -360,12 +441,19 @@ class TriMesh(PointCloud):
         """
         if self.n_dims != 3:
             raise ValueError("Normals are only valid for 3D meshes")
-        return compute_vertex_normals(self.points, self.trilist)
+        geometry = self._geometry()
+        if 'vertex_normals' not in geometry:
+            incidence = self.topology.vertex_tri_incidence()
+            geometry['vertex_normals'] = compute_vertex_normals_from_incidence(
+                self._tri_normals_and_areas()[0], incidence.indptr,
+                incidence.indices)[:self.n_points]
+        return geometry['vertex_normals'].copy()
 
     def tri_normals(self):
         r"""
         Compute the triangle face normals from the current set of points and
-        triangle list. Only valid for 3D dimensional meshes.
+        triangle list. Only valid for 3D dimensional meshes. The normals are
+        cached until the points or the trilist are replaced.
 
         Returns
         -------
@@ -379,10 +467,11 @@ class TriMesh(PointCloud):
         """
         if self.n_dims != 3:
             raise ValueError("Normals are only valid for 3D meshes")
-        return compute_face_normals(self.points, self.trilist)
+        return self._tri_normals_and_areas()[0].copy()
 
     def tri_areas(self):
-        r"""The area of each triangle face.
+        r"""The area of each triangle face. The areas are cached until the
+        points or the trilist are replaced.
 
         Returns
         -------
@@ -394,12 +483,15 @@ class TriMesh(PointCloud):
         ValueError
             If mesh is not 2D or 3D
         """
-        t = self.points[self.trilist]
-        ij, ik = t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]
         if self.n_dims == 2:
-            return np.abs(np.cross(ij, ik) * 0.5)
+            geometry = self._geometry()
+            if 'tri_areas' not in geometry:
+                t = self.points[self.trilist]
+                ij, ik = t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]
+                geometry['tri_areas'] = np.abs(np.cross(ij, ik) * 0.5)
+            return geometry['tri_areas'].copy()
         elif self.n_dims == 3:
-            return np.linalg.norm(np.cross(ij, ik), axis=1) * 0.5
+            return self._tri_normals_and_areas()[1].copy()
         else:
             raise ValueError('tri_areas can only be calculated on a 2D or '
                              '3D mesh')
@@ -420,29 +512,41 @@ class TriMesh(PointCloud):
         return np.mean(self.tri_areas())
 
     def boundary_tri_index(self):
-        r"""Boolean index into triangles that are at the edge of the TriMesh
+        r"""Index into triangles that are at the edge of the TriMesh
 
         Returns
         -------
-        boundary_tri_index : ``(n_tris,)`` `ndarray`
-            For each triangle (ABC), returns whether any of it's edges is not
-            also an edge of another triangle (and so this triangle exists on
-            the boundary of the TriMesh)
+        boundary_tri_index : ``(n_boundary_tris,)`` `ndarray`
+            The sorted indices of the triangles (ABC) for which any of the
+            edges is not also an edge of another triangle (and so this
+            triangle exists on the boundary of the TriMesh)
         """
-        trilist = self.trilist
-        # Get a sorted list of edge pairs
-        edge_pairs = np.sort(np.vstack((trilist[:, [0, 1]],
-                                        trilist[:, [0, 2]],
-                                        trilist[:, [1, 2]])))
-
-        # convert to a tuple per edge pair
-        edges = [tuple(x) for x in edge_pairs]
-        # count the occurrences of the ordered edge pairs - edge pairs that
-        # occur once are at the edge of the whole mesh
-        mesh_edges = (e for e, i in Counter(edges).items() if i == 1)
-        # index back into the edges to find which triangles contain these edges
-        return np.array(list(set(edges.index(e) % trilist.shape[0]
-                                 for e in mesh_edges)))
+        return self.topology.boundary_tri_index()
+
+    def boundary_loops(self):
+        r"""The closed loops of points along the boundary of the TriMesh.
+
+        Each loop follows the orientation of its triangles. The boundary is
+        assumed to be manifold (no point is on more than one boundary loop).
+
+        Returns
+        -------
+        boundary_loops : `list` of ``(n_loop_points,)`` `ndarray`
+            The ordered point indices of each boundary loop.
+        """
+        return [loop.copy() for loop in self.topology.boundary_loops()]
+
+    def tri_adjacency(self):
+        r"""The neighbouring triangle across each edge of each triangle.
+
+        Returns
+        -------
+        tri_adjacency : ``(n_tris, 3)`` `ndarray`
+            For each triangle (ABC), the index of the triangle that shares
+            the edges AB, BC and CA, or ``-1`` if the edge is on the boundary
+            of the TriMesh (or is shared by more than two triangles).
+        """
+        return self.topology.tri_adjacency().copy()
 
     def edge_vectors(self):
         r"""A vector of edges of each triangle face.
@@ -499,19 +603,9 @@ class TriMesh(PointCloud):
             Return a point index that rebuilds all edges present in this
             :map:`TriMesh` only once.
         """
-        # Get a sorted list of edge pairs. sort ensures that each edge is
-        # ordered from lowest index to highest.
-        edge_pairs = np.sort(self.edge_indices())
-
-        # We want to remove duplicates - this is a little hairy: basically we
-        # get a view on the array where each pair is considered by numpy to be
-        # one item
-        edge_pair_view = np.ascontiguousarray(edge_pairs).view(
-            np.dtype((np.void, edge_pairs.dtype.itemsize * edge_pairs.shape[1])))
-        # Now we can use this view to ask for only unique edges...
-        unique_edge_index = np.unique(edge_pair_view, return_index=True)[1]
-        # And use that to filter our original list down
-        return edge_pairs[unique_edge_index]
+        # Each edge is ordered from lowest index to highest, and the edges
+        # are sorted
+        return self.topology.edges.astype(self.trilist.dtype)
 
     def unique_edge_vectors(self):
         r"""An unordered vector of unique edges for the whole :map:`TriMesh`.
@@ -574,6 +668,279 @@ class TriMesh(PointCloud):
         return np.mean(self.unique_edge_lengths() if unique
                        else self.edge_lengths())
 
+    def _laplacian_and_mass(self):
+        geometry = self._geometry()
+        if 'cotangent_laplacian' not in geometry:
+            points = self.points.astype(np.float64, copy=False)
+            cotangents, areas = triangle_cotangents(points, self.trilist)
+            geometry['cotangent_laplacian'] = cotangent_laplacian(
+                points, self.trilist, cotangents)
+            geometry['mass_matrix'] = barycentric_mass_matrix(
+                self.trilist, areas, self.n_points)
+        return geometry['cotangent_laplacian'], geometry['mass_matrix']
+
+    def laplacian(self, weights='cotangent'):
+        r"""The Laplacian of this :map:`TriMesh`, as a sparse
+        ``(n_points, n_points)`` matrix. The off-diagonal entry of each edge
+        holds its weight and the diagonal holds minus the sum of the weights
+        of each row, so the Laplacian is symmetric and negative
+        semi-definite.
+
+        The cotangent Laplacian is cached until the points or the trilist are
+        replaced. The uniform Laplacian only depends on the trilist and is
+        cached on the :attr:`topology`.
+
+        Parameters
+        ----------
+        weights : ``{'cotangent', 'uniform'}``, optional
+            The weight of each edge. ``'cotangent'`` weighs each edge by
+            ``(cot(alpha) + cot(beta)) / 2``, where ``alpha`` and ``beta``
+            are the angles opposite to it. ``'uniform'`` gives every edge a
+            weight of ``1``.
+
+        Returns
+        -------
+        laplacian : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+            The Laplacian.
+
+        Raises
+        ------
+        ValueError
+            If ``weights`` is not ``'cotangent'`` or ``'uniform'``
+        """
+        return self._laplacian(weights).copy()
+
+    def _laplacian(self, weights):
+        if weights == 'cotangent':
+            return self._laplacian_and_mass()[0]
+        elif weights == 'uniform':
+            topology = self.topology
+            laplacian = topology.uniform_laplacian()
+            if topology.n_points > self.n_points:
+                # the trilist refers to missing points, as the topology does
+                laplacian = laplacian[:self.n_points, :self.n_points]
+            return laplacian
+        else:
+            raise ValueError("weights must be either 'cotangent' or "
+                             "'uniform', not '{}'".format(weights))
+
+    def mass_matrix(self):
+        r"""The lumped (barycentric) mass matrix of this :map:`TriMesh`: a
+        diagonal sparse matrix holding a third of the area of the triangles
+        around each point. It is cached until the points or the trilist are
+        replaced.
+
+        Returns
+        -------
+        mass : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+            The mass matrix.
+        """
+        return self._laplacian_and_mass()[1].copy()
+
+    def smooth(self, step=None, n_iterations=1, weights='cotangent',
+               cache_factorisation=True):
+        r"""Smooth this :map:`TriMesh` with implicit Laplacian smoothing.
+        Each iteration solves ``(M - step * L) p' = M p``, where ``L`` is
+        the Laplacian (see :meth:`laplacian`) and ``M`` the mass matrix (see
+        :meth:`mass_matrix`) of this mesh, which are used for all the
+        iterations.
+
+        Parameters
+        ----------
+        step : `float`, optional
+            The amount of smoothing of each iteration. If ``None``, the
+            square of the mean edge length is used.
+        n_iterations : `int`, optional
+            The number of smoothing iterations.
+        weights : ``{'cotangent', 'uniform'}``, optional
+            The edge weights of the Laplacian.
+        cache_factorisation : `bool`, optional
+            If ``True``, the factorisation of the smoothing system is cached
+            until the points or the trilist are replaced, so smoothing this
+            mesh again with the same ``step`` and ``weights`` only costs
+            back-substitutions.
+
+        Returns
+        -------
+        smoothed : ``type(self)``
+            A copy of this mesh with smoothed points.
+        """
+        if step is None:
+            step = self.mean_edge_length(unique=False) ** 2
+        mass = _with_unit_mass_for_isolated_points(
+            self._laplacian_and_mass()[1])
+        geometry = self._geometry()
+        key = ('smoothing_factorisation', weights, step)
+        solve = geometry.get(key)
+        if solve is None:
+            from scipy.sparse.linalg import factorized
+            solve = factorized((mass - step * self._laplacian(weights))
+                               .tocsc())
+            if cache_factorisation:
+                geometry[key] = solve
+        points = self.points.astype(np.float64)
+        for _ in range(n_iterations):
+            weighted = mass.dot(points)
+            points = np.stack([solve(weighted[:, k].copy())
+                               for k in range(self.n_dims)], axis=1)
+        smoothed = self.copy()
+        smoothed.points = points
+        return smoothed
+
+    def geodesic_distances(self, source_indices, time_step=None):
+        r"""The geodesic distance of every point to the nearest of the source
+        points, computed with the heat method (see :map:`HeatGeodesics`).
+
+        The heat method factorises two sparse systems built from the
+        cotangent Laplacian of the mesh (see :meth:`laplacian`). The
+        factorisations are cached until the points or the trilist are
+        replaced, so repeated queries on the same mesh only cost two sparse
+        back-substitutions each.
+
+        Parameters
+        ----------
+        source_indices : `int` or ``(n_sources,)`` `ndarray`
+            The index of the source point (or points).
+        time_step : `float`, optional
+            The diffusion time of the heat method. If ``None``, the square of
+            the mean edge length is used.
+
+        Returns
+        -------
+        distances : ``(n_points,)`` `ndarray`
+            The geodesic distance of each point to the nearest source. Points
+            that are not connected to any source have an infinite distance.
+
+        Raises
+        ------
+        ValueError
+            If any of the source indices is not a valid point index.
+        """
+        geometry = self._geometry()
+        key = ('heat_geodesics', time_step)
+        if key not in geometry:
+            from .geodesic import HeatGeodesics
+            laplacian, mass = self._laplacian_and_mass()
+            geometry[key] = HeatGeodesics(self.points, self.trilist,
+                                          time_step=time_step,
+                                          laplacian=laplacian, mass=mass)
+        return geometry[key].distances(source_indices)
+
+    def _vertex_attributes(self):
+        # the per-vertex data that decimate and subdivide interpolate
+        return []
+
+    def _from_resampled(self, points, trilist, attributes):
+        # built from the new arrays, so the (larger) arrays of this mesh are
+        # never copied
+        return copy_landmarks_and_path(
+            self, TriMesh(points, trilist=trilist, copy=False))
+
+    def decimate(self, target_n_tris, return_mapping=False):
+        r"""Decimate this :map:`TriMesh` to (at most) ``target_n_tris``
+        triangles by repeatedly collapsing the edge of least quadric error
+        [1]. Each edge collapses to the point of least error along it, so the
+        per-vertex data of :map:`ColouredTriMesh` (colours) and
+        :map:`TexturedTriMesh` (texture coordinates) is linearly interpolated
+        along the edge. Collapses that would make the mesh non-manifold or
+        flip a triangle are skipped, so fewer triangles than requested may be
+        removed. The boundaries of the mesh are preserved. Only valid for 3D
+        meshes.
+
+        Parameters
+        ----------
+        target_n_tris : `int`
+            The number of triangles of the decimated mesh.
+        return_mapping : `bool`, optional
+            If ``True``, the point of the decimated mesh that each point of
+            this mesh was merged into is also returned.
+
+        Returns
+        -------
+        decimated : ``type(self)``
+            A copy of this mesh with fewer triangles.
+        mapping : ``(n_points,)`` `ndarray`
+            The index of the point of ``decimated`` that each point of this
+            mesh was merged into. Only returned if ``return_mapping`` is
+            ``True``. Per-vertex data of this mesh can be transferred to the
+            decimated mesh as ``data[mapping]`` (the value of any of the
+            merged points) or by averaging over ``mapping``.
+
+        Raises
+        ------
+        ValueError
+            If mesh is not 3D
+
+        References
+        ----------
+        .. [1] M. Garland, P. Heckbert. "Surface Simplification Using Quadric
+           Error Metrics", SIGGRAPH 1997.
+        """
+        if self.n_dims != 3:
+            raise ValueError("Decimation is only valid for 3D meshes")
+        from .decimation import QEMDecimator
+        topology = self.topology
+        boundary = topology.boundary_edge_mask()[topology.half_edge_to_edge]
+        boundary = np.hstack([topology.half_edges[boundary],
+                              topology.half_edge_tri_index()[boundary, None]])
+        # all the per-vertex data is interpolated as a single array
+        attributes = self._vertex_attributes()
+        widths = np.cumsum([a.shape[1] for a in attributes])[:-1]
+        stacked = np.hstack([np.empty((self.n_points, 0))] + attributes)
+        decimator = QEMDecimator(
+            np.ascontiguousarray(self.points, dtype=np.float64),
+            topology._trilist, np.ascontiguousarray(topology.edges),
+            np.ascontiguousarray(boundary, dtype=np.int64),
+            np.ascontiguousarray(stacked, dtype=np.float64))
+        points, stacked, trilist, mapping = decimator.decimate(target_n_tris)
+        decimated = self._from_resampled(points, trilist,
+                                         np.split(stacked, widths, axis=1))
+        return (decimated, mapping) if return_mapping else decimated
+
+    def subdivide(self, return_mapping=False):
+        r"""Subdivide each triangle of this :map:`TriMesh` into four by
+        inserting a point in the middle of each edge. The per-vertex data of
+        :map:`ColouredTriMesh` (colours) and :map:`TexturedTriMesh` (texture
+        coordinates) is interpolated to the new points. The points of this
+        mesh are the first ``n_points`` points of the subdivided mesh.
+
+        Parameters
+        ----------
+        return_mapping : `bool`, optional
+            If ``True``, the two points of this mesh that each point of the
+            subdivided mesh lies between are also returned.
+
+        Returns
+        -------
+        subdivided : ``type(self)``
+            A copy of this mesh with four times as many triangles.
+        mapping : ``(n_subdivided_points, 2)`` `ndarray`
+            The two points of this mesh whose midpoint is each point of
+            ``subdivided`` (both equal for the original points). Only
+            returned if ``return_mapping`` is ``True``. Per-vertex data of
+            this mesh can be transferred to the subdivided mesh as
+            ``data[mapping].mean(axis=1)``.
+        """
+        topology = self.topology
+        edges = topology.edges
+        # the new point on each half-edge of each triangle (AB, BC, CA)
+        midpoints = (self.n_points +
+                     topology.half_edge_to_edge.reshape([3, -1]).T)
+        trilist = self.trilist
+        ab, bc, ca = midpoints[:, 0], midpoints[:, 1], midpoints[:, 2]
+        trilist = np.vstack([
+            np.stack([trilist[:, 0], ab, ca], axis=1),
+            np.stack([ab, trilist[:, 1], bc], axis=1),
+            np.stack([ca, bc, trilist[:, 2]], axis=1),
+            np.stack([ab, bc, ca], axis=1)])
+        original = np.arange(self.n_points)
+        mapping = np.vstack([np.stack([original, original], axis=1), edges])
+        points = np.vstack([self.points, self.points[edges].mean(axis=1)])
+        attributes = [np.vstack([a, a[edges].mean(axis=1)])
+                      for a in self._vertex_attributes()]
+        subdivided = self._from_resampled(points, trilist, attributes)
+        return (subdivided, mapping) if return_mapping else subdivided
+
     def _view_2d(self, figure_id=None, new_figure=False, image_view=True,
                  render_lines=True, line_colour='r', line_style='-',
                  line_width=1., render_markers=True, marker_style='o',
@@ -1,5 +1,6 @@
 import numpy as np
 
+from menpo.base import copy_landmarks_and_path
 from ..adjacency import mask_adjacency_array, reindex_adjacency_array
 from .base import TriMesh
 
@@ -136,6 +137,14 @@ class ColouredTriMesh(TriMesh):
         """
         return self.colours.shape[1]
 
+    def _vertex_attributes(self):
+        return [self.colours]
+
+    def _from_resampled(self, points, trilist, attributes):
+        return copy_landmarks_and_path(
+            self, ColouredTriMesh(points, trilist=trilist,
+                                  colours=attributes[0], copy=False))
+
     def from_mask(self, mask):
         """
         A 1D boolean array with the same number of elements as the number of
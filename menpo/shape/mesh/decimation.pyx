@@ -0,0 +1,387 @@
+import numpy as np
+cimport numpy as np
+cimport cython
+from libc.math cimport sqrt
+from libcpp.vector cimport vector
+from libcpp.queue cimport priority_queue
+from libcpp.pair cimport pair
+
+
+# The weight of the planes that pin the boundary edges, relative to the
+# weight of the planes of the triangles
+cdef double BOUNDARY_WEIGHT = 1000.0
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void add_plane(double[:, ::1] quadrics, Py_ssize_t v,
+                           double a, double b, double c, double d,
+                           double w):
+    # the 10 unique entries of the symmetric 4x4 matrix w * p p^T
+    quadrics[v, 0] += w * a * a
+    quadrics[v, 1] += w * a * b
+    quadrics[v, 2] += w * a * c
+    quadrics[v, 3] += w * a * d
+    quadrics[v, 4] += w * b * b
+    quadrics[v, 5] += w * b * c
+    quadrics[v, 6] += w * b * d
+    quadrics[v, 7] += w * c * c
+    quadrics[v, 8] += w * c * d
+    quadrics[v, 9] += w * d * d
+
+
+cdef inline double bilinear(double *q, double *x, double *y):
+    # x^T Q y for the symmetric 4x4 matrix Q stored as its 10 unique entries
+    return (q[0] * x[0] * y[0] + q[4] * x[1] * y[1] + q[7] * x[2] * y[2] +
+            q[9] * x[3] * y[3] +
+            q[1] * (x[0] * y[1] + x[1] * y[0]) +
+            q[2] * (x[0] * y[2] + x[2] * y[0]) +
+            q[3] * (x[0] * y[3] + x[3] * y[0]) +
+            q[5] * (x[1] * y[2] + x[2] * y[1]) +
+            q[6] * (x[1] * y[3] + x[3] * y[1]) +
+            q[8] * (x[2] * y[3] + x[3] * y[2]))
+
+
+cdef inline void cross(double *a, double *b, double *out):
+    out[0] = a[1] * b[2] - a[2] * b[1]
+    out[1] = a[2] * b[0] - a[0] * b[2]
+    out[2] = a[0] * b[1] - a[1] * b[0]
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef class QEMDecimator:
+    r"""
+    Decimates a 3D triangle mesh by repeatedly collapsing the edge of least
+    quadric error (Garland and Heckbert, 1997). Each collapsed edge is
+    replaced by the point of least error on the edge, so the per-vertex
+    attributes are linearly interpolated along the edge as well. Collapses
+    that would make the mesh non-manifold or flip a triangle are skipped and
+    boundary edges are preserved by heavily weighted constraint planes.
+
+    Parameters
+    ----------
+    points : ``(n_points, 3)`` `ndarray`
+        The points of the mesh.
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+    edges : ``(n_edges, 2)`` `ndarray`
+        The unique edges of the mesh.
+    boundary : ``(n_boundary_edges, 3)`` `ndarray`
+        The two vertices and the triangle of each boundary edge.
+    attributes : ``(n_points, n_attributes)`` `ndarray`
+        The per-vertex attributes to interpolate.
+    """
+    cdef double[:, ::1] points
+    cdef double[:, ::1] attributes
+    cdef double[:, ::1] quadrics
+    cdef np.int64_t[:, ::1] trilist
+    cdef np.uint8_t[::1] tri_alive
+    cdef np.uint8_t[::1] alive
+    cdef np.uint8_t[::1] on_boundary
+    cdef np.int64_t[::1] stamp
+    cdef np.int64_t[::1] parent
+    cdef np.int64_t[::1] mark
+    cdef np.int64_t token
+    cdef Py_ssize_t n_tris
+    cdef vector[vector[np.int64_t]] vertex_tris
+    cdef vector[np.int64_t] neighbours
+    # the candidate collapses, ordered by (negated) error
+    cdef priority_queue[pair[double, Py_ssize_t]] heap
+    cdef vector[np.int64_t] record_u, record_v, record_stamp_u, record_stamp_v
+    cdef vector[double] record_s
+
+    def __cinit__(self, const double[:, ::1] points not None,
+                  const np.int64_t[:, ::1] trilist not None,
+                  const np.int64_t[:, ::1] edges not None,
+                  const np.int64_t[:, ::1] boundary not None,
+                  const double[:, ::1] attributes not None):
+        cdef:
+            Py_ssize_t n_points = points.shape[0], i, k
+            double e1[3]
+            double e[3]
+            double n[3]
+            double *p
+            double length
+        self.points = np.array(points, copy=True)
+        self.attributes = np.array(attributes, copy=True)
+        self.trilist = np.array(trilist, copy=True)
+        self.quadrics = np.zeros((n_points, 10))
+        self.n_tris = trilist.shape[0]
+        self.tri_alive = np.ones(self.n_tris, dtype=np.uint8)
+        self.alive = np.ones(n_points, dtype=np.uint8)
+        self.on_boundary = np.zeros(n_points, dtype=np.uint8)
+        self.stamp = np.zeros(n_points, dtype=np.int64)
+        self.parent = np.arange(n_points, dtype=np.int64)
+        self.mark = np.zeros(n_points, dtype=np.int64)
+        self.token = 0
+        self.vertex_tris.resize(n_points)
+
+        # the plane of each triangle, weighted by its area
+        for i in range(self.n_tris):
+            for k in range(3):
+                self.vertex_tris[trilist[i, k]].push_back(i)
+            self.tri_normal(i, n)
+            length = sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+            if length == 0:
+                continue
+            for k in range(3):
+                n[k] /= length
+            p = &self.points[trilist[i, 0], 0]
+            for k in range(3):
+                add_plane(self.quadrics, trilist[i, k], n[0], n[1], n[2],
+                          -(n[0] * p[0] + n[1] * p[1] + n[2] * p[2]),
+                          0.5 * length)
+
+        # the plane through each boundary edge, perpendicular to its triangle
+        for i in range(boundary.shape[0]):
+            self.on_boundary[boundary[i, 0]] = 1
+            self.on_boundary[boundary[i, 1]] = 1
+            self.tri_normal(boundary[i, 2], n)
+            for k in range(3):
+                e[k] = (self.points[boundary[i, 1], k] -
+                        self.points[boundary[i, 0], k])
+            cross(e, n, e1)
+            length = sqrt(e1[0] * e1[0] + e1[1] * e1[1] + e1[2] * e1[2])
+            if length == 0:
+                continue
+            for k in range(3):
+                e1[k] /= length
+            p = &self.points[boundary[i, 0], 0]
+            for k in range(2):
+                add_plane(self.quadrics, boundary[i, k], e1[0], e1[1], e1[2],
+                          -(e1[0] * p[0] + e1[1] * p[1] + e1[2] * p[2]),
+                          BOUNDARY_WEIGHT * (e[0] * e[0] + e[1] * e[1] +
+                                             e[2] * e[2]))
+
+        for i in range(edges.shape[0]):
+            self.push_edge(edges[i, 0], edges[i, 1])
+
+    cdef void tri_normal(self, Py_ssize_t t, double *n):
+        cdef:
+            double e1[3]
+            double e2[3]
+            Py_ssize_t k
+        for k in range(3):
+            e1[k] = (self.points[self.trilist[t, 1], k] -
+                     self.points[self.trilist[t, 0], k])
+            e2[k] = (self.points[self.trilist[t, 2], k] -
+                     self.points[self.trilist[t, 0], k])
+        cross(e1, e2, n)
+
+    cdef void push_edge(self, Py_ssize_t u, Py_ssize_t v):
+        cdef:
+            double q[10]
+            double x[4]
+            double d[4]
+            double alpha, beta, gamma, s
+            Py_ssize_t k
+        for k in range(10):
+            q[k] = self.quadrics[u, k] + self.quadrics[v, k]
+        for k in range(3):
+            x[k] = self.points[u, k]
+            d[k] = self.points[v, k] - self.points[u, k]
+        x[3] = 1
+        d[3] = 0
+        # the error along the edge, x + s * d, is a quadratic in s
+        alpha = bilinear(q, d, d)
+        beta = bilinear(q, d, x)
+        gamma = bilinear(q, x, x)
+        if alpha > 0:
+            s = min(max(-beta / alpha, 0.0), 1.0)
+        else:
+            s = 0.0 if beta >= 0 else 1.0
+        self.record_u.push_back(u)
+        self.record_v.push_back(v)
+        self.record_stamp_u.push_back(self.stamp[u])
+        self.record_stamp_v.push_back(self.stamp[v])
+        self.record_s.push_back(s)
+        self.heap.push(pair[double, Py_ssize_t](
+            -(alpha * s * s + 2 * beta * s + gamma),
+            self.record_u.size() - 1))
+
+    cdef void gather_neighbours(self, Py_ssize_t u):
+        # the unique neighbours of u, marked with the current token
+        cdef:
+            Py_ssize_t i, k, w
+            np.int64_t t
+        self.token += 1
+        self.neighbours.clear()
+        self.mark[u] = self.token
+        for i in range(self.vertex_tris[u].size()):
+            t = self.vertex_tris[u][i]
+            if not self.tri_alive[t]:
+                continue
+            for k in range(3):
+                w = self.trilist[t, k]
+                if self.mark[w] != self.token:
+                    self.mark[w] = self.token
+                    self.neighbours.push_back(w)
+
+    cdef bint can_collapse(self, Py_ssize_t u, Py_ssize_t v, double *x):
+        cdef:
+            Py_ssize_t i, j, k, w, n_shared = 0, n_common = 0
+            np.int64_t t
+            Py_ssize_t moved
+            double before[3]
+            double after[3]
+            double e1[3]
+            double e2[3]
+            double p[3][3]
+        # link condition: the common neighbours of u and v must be exactly
+        # the opposite vertices of the triangles they share
+        self.gather_neighbours(u)
+        for i in range(self.vertex_tris[v].size()):
+            t = self.vertex_tris[v][i]
+            if not self.tri_alive[t]:
+                continue
+            for k in range(3):
+                if self.trilist[t, k] == u:
+                    n_shared += 1
+                    break
+        self.token += 1
+        for i in range(self.vertex_tris[v].size()):
+            t = self.vertex_tris[v][i]
+            if not self.tri_alive[t]:
+                continue
+            for k in range(3):
+                w = self.trilist[t, k]
+                if w != u and w != v and self.mark[w] == self.token - 1:
+                    self.mark[w] = self.token
+                    n_common += 1
+        if n_shared == 0 or n_common != n_shared:
+            return False
+        # an interior edge between two boundary vertices would pinch the
+        # mesh
+        if n_shared > 1 and self.on_boundary[u] and self.on_boundary[v]:
+            return False
+        # no triangle may flip (or become degenerate)
+        for j in range(2):
+            moved = u if j == 0 else v
+            for i in range(self.vertex_tris[moved].size()):
+                t = self.vertex_tris[moved][i]
+                if not self.tri_alive[t]:
+                    continue
+                if ((self.trilist[t, 0] == u or self.trilist[t, 1] == u or
+                     self.trilist[t, 2] == u) and
+                        (self.trilist[t, 0] == v or self.trilist[t, 1] == v or
+                         self.trilist[t, 2] == v)):
+                    continue
+                for k in range(3):
+                    for w in range(3):
+                        if self.trilist[t, k] == moved:
+                            p[k][w] = x[w]
+                        else:
+                            p[k][w] = self.points[self.trilist[t, k], w]
+                for w in range(3):
+                    e1[w] = p[1][w] - p[0][w]
+                    e2[w] = p[2][w] - p[0][w]
+                cross(e1, e2, after)
+                self.tri_normal(t, before)
+                if (before[0] * after[0] + before[1] * after[1] +
+                        before[2] * after[2]) <= 0:
+                    return False
+        return True
+
+    cdef void collapse(self, Py_ssize_t u, Py_ssize_t v, double s,
+                       double *x):
+        cdef:
+            Py_ssize_t i, k
+            np.int64_t t
+            bint has_u
+            vector[np.int64_t] kept
+        for k in range(3):
+            self.points[u, k] = x[k]
+        for k in range(self.attributes.shape[1]):
+            self.attributes[u, k] = ((1 - s) * self.attributes[u, k] +
+                                     s * self.attributes[v, k])
+        for k in range(10):
+            self.quadrics[u, k] += self.quadrics[v, k]
+        self.alive[v] = 0
+        self.parent[v] = u
+        self.on_boundary[u] = self.on_boundary[u] or self.on_boundary[v]
+        for i in range(self.vertex_tris[v].size()):
+            t = self.vertex_tris[v][i]
+            if not self.tri_alive[t]:
+                continue
+            has_u = False
+            for k in range(3):
+                if self.trilist[t, k] == u:
+                    has_u = True
+            if has_u:
+                self.tri_alive[t] = 0
+                self.n_tris -= 1
+            else:
+                for k in range(3):
+                    if self.trilist[t, k] == v:
+                        self.trilist[t, k] = u
+                self.vertex_tris[u].push_back(t)
+        self.vertex_tris[v].clear()
+        for i in range(self.vertex_tris[u].size()):
+            if self.tri_alive[self.vertex_tris[u][i]]:
+                kept.push_back(self.vertex_tris[u][i])
+        self.vertex_tris[u].swap(kept)
+        self.stamp[u] += 1
+        self.gather_neighbours(u)
+        for i in range(self.neighbours.size()):
+            if self.neighbours[i] != u:
+                self.push_edge(u, self.neighbours[i])
+
+    def decimate(self, Py_ssize_t target_n_tris):
+        r"""
+        Collapse edges until at most ``target_n_tris`` triangles are left, or
+        no edge can be collapsed.
+
+        Returns
+        -------
+        points : ``(n_decimated_points, 3)`` `ndarray`
+            The points of the decimated mesh.
+        attributes : ``(n_decimated_points, n_attributes)`` `ndarray`
+            The interpolated attributes of the decimated mesh.
+        trilist : ``(n_decimated_tris, 3)`` `ndarray`
+            The triangle list of the decimated mesh.
+        vertex_map : ``(n_points,)`` `ndarray`
+            The decimated point that each of the original points was merged
+            into.
+        """
+        cdef:
+            pair[double, Py_ssize_t] top
+            Py_ssize_t r, u, v, i, k
+            double s
+            double x[3]
+        while self.n_tris > target_n_tris and not self.heap.empty():
+            top = self.heap.top()
+            self.heap.pop()
+            r = top.second
+            u = self.record_u[r]
+            v = self.record_v[r]
+            if (not self.alive[u] or not self.alive[v] or
+                    self.stamp[u] != self.record_stamp_u[r] or
+                    self.stamp[v] != self.record_stamp_v[r]):
+                continue
+            s = self.record_s[r]
+            for k in range(3):
+                x[k] = ((1 - s) * self.points[u, k] +
+                        s * self.points[v, k])
+            if self.can_collapse(u, v, x):
+                self.collapse(u, v, s, x)
+
+        alive = np.asarray(self.alive).astype(np.bool)
+        new_index = np.cumsum(alive) - 1
+        parent = np.asarray(self.parent)
+        # follow the collapses to the surviving point (with path compression)
+        cdef np.int64_t[::1] roots = parent.copy()
+        for i in range(roots.shape[0]):
+            r = i
+            while roots[r] != r:
+                r = roots[r]
+            u = i
+            while roots[u] != r:
+                v = roots[u]
+                roots[u] = r
+                u = v
+        trilist = np.asarray(self.trilist)[
+            np.asarray(self.tri_alive).astype(np.bool)]
+        return (np.asarray(self.points)[alive],
+                np.asarray(self.attributes)[alive],
+                new_index[trilist], new_index[np.asarray(roots)])
@@ -0,0 +1,156 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import factorized
+
+from .laplacian import (triangle_cotangents, cotangent_laplacian,
+                        barycentric_mass_matrix,
+                        _with_unit_mass_for_isolated_points)
+
+
+class HeatGeodesics(object):
+    r"""
+    Geodesic distances on a triangle mesh, computed with the heat method [1].
+    Heat is diffused from the sources for a short time, the normalized
+    gradient of the heat gives the direction of the geodesics and the
+    distance is recovered by solving a Poisson equation.
+
+    Both linear systems (the heat and the Poisson system) are sparse and
+    factorised once on construction, so every query costs two sparse
+    back-substitutions. A :map:`TriMesh` caches its solver (see
+    :meth:`TriMesh.geodesic_distances`) until its points or trilist are
+    replaced.
+
+    Parameters
+    ----------
+    points : ``(n_points, n_dims)`` `ndarray`
+        The points of the mesh.
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+    time_step : `float`, optional
+        The diffusion time. If ``None``, the square of the mean edge length
+        is used, as recommended in [1].
+    laplacian : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`, optional
+        The cotangent Laplacian of the mesh (see :meth:`TriMesh.laplacian`),
+        if already computed.
+    mass : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`, optional
+        The mass matrix of the mesh (see :meth:`TriMesh.mass_matrix`), if
+        already computed.
+
+    References
+    ----------
+    .. [1] K. Crane, C. Weischedel, M. Wardetzky. "Geodesics in Heat: A New
+       Approach to Computing Distance Based on Heat Flow", ACM Transactions
+       on Graphics, 2013.
+    """
+    def __init__(self, points, trilist, time_step=None, laplacian=None,
+                 mass=None):
+        points = np.asarray(points, dtype=np.float64)
+        trilist = np.asarray(trilist)
+        self.n_points = points.shape[0]
+        self._points = points
+        self._trilist = trilist
+        cotangents, areas = triangle_cotangents(points, trilist)
+        self._cotangents = cotangents
+        if laplacian is None:
+            laplacian = cotangent_laplacian(points, trilist, cotangents)
+        if mass is None:
+            mass = barycentric_mass_matrix(trilist, areas, self.n_points)
+        # the (positive semi-definite) stiffness matrix
+        stiffness = -laplacian
+        if time_step is None:
+            t = points[trilist]
+            edges = np.concatenate([t[:, 1] - t[:, 0], t[:, 2] - t[:, 1],
+                                    t[:, 0] - t[:, 2]])
+            time_step = np.mean(np.sqrt(np.sum(edges ** 2, axis=1))) ** 2
+        self.time_step = time_step
+
+        # heat: (M + tK) u = delta. Points that are in no triangle have no
+        # mass, they are given a unit mass to keep the system non-singular
+        mass = _with_unit_mass_for_isolated_points(mass)
+        self._solve_heat = factorized((mass + stiffness * time_step).tocsc())
+
+        # poisson: K phi = -div X. K is singular (constant in each connected
+        # component), so one vertex per component is pinned to 0. The
+        # components are found on the triangles, as cotangent weights can
+        # vanish
+        half_edges = coo_matrix(
+            (np.ones(trilist.size), (trilist.ravel(),
+                                     np.roll(trilist, 1, axis=1).ravel())),
+            shape=(self.n_points, self.n_points))
+        n_components, self._components = connected_components(
+            half_edges, directed=False)
+        pinned = np.zeros(self.n_points, dtype=bool)
+        pinned[np.unique(self._components, return_index=True)[1]] = True
+        self._free = np.flatnonzero(~pinned)
+        self._solve_poisson = factorized(
+            stiffness[self._free][:, self._free].tocsc())
+
+    def distances(self, sources):
+        r"""
+        The geodesic distance of every vertex to the nearest source vertex.
+
+        Parameters
+        ----------
+        sources : `int` or ``(n_sources,)`` `ndarray`
+            The source vertex (or vertices).
+
+        Returns
+        -------
+        distances : ``(n_points,)`` `ndarray`
+            The geodesic distance of each vertex to the nearest source. The
+            vertices that are not connected to any source have an infinite
+            distance.
+        """
+        sources = np.atleast_1d(sources)
+        if np.any(sources < 0) or np.any(sources >= self.n_points):
+            raise ValueError('The source vertices must be between '
+                             '0 and {}.'.format(self.n_points - 1))
+        delta = np.zeros(self.n_points)
+        delta[sources] = 1
+        u = self._solve_heat(delta)
+
+        # normalized (negative) gradient of u on each triangle
+        points, trilist = self._points, self._trilist
+        t = points[trilist]
+        e1, e2 = t[:, 1] - t[:, 0], t[:, 2] - t[:, 0]
+        g11 = np.einsum('ij,ij->i', e1, e1)
+        g12 = np.einsum('ij,ij->i', e1, e2)
+        g22 = np.einsum('ij,ij->i', e2, e2)
+        det = np.maximum(g11 * g22 - g12 ** 2, np.finfo(float).tiny)
+        du = u[trilist]
+        du1, du2 = du[:, 1] - du[:, 0], du[:, 2] - du[:, 0]
+        # the gradient is e1 * a + e2 * b, with [a, b] = G^-1 [du1, du2]
+        a = (g22 * du1 - g12 * du2) / det
+        b = (g11 * du2 - g12 * du1) / det
+        gradient = e1 * a[:, None] + e2 * b[:, None]
+        norm = np.sqrt(np.sum(gradient ** 2, axis=1))
+        x = -gradient / np.maximum(norm, np.finfo(float).tiny)[:, None]
+
+        # integrated divergence of x at each vertex
+        divergence = np.zeros(self.n_points)
+        for corner in range(3):
+            j, k = (corner + 1) % 3, (corner + 2) % 3
+            p = t[:, corner]
+            contribution = 0.5 * (
+                self._cotangents[:, k] *
+                np.einsum('ij,ij->i', t[:, j] - p, x) +
+                self._cotangents[:, j] *
+                np.einsum('ij,ij->i', t[:, k] - p, x))
+            divergence += np.bincount(trilist[:, corner],
+                                      weights=contribution,
+                                      minlength=self.n_points)
+
+        phi = np.zeros(self.n_points)
+        phi[self._free] = self._solve_poisson(-divergence[self._free])
+
+        # shift each component so its nearest source is at distance 0
+        distances = np.full(self.n_points, np.inf)
+        components = self._components
+        source_components = components[sources]
+        for c in np.unique(source_components):
+            in_component = components == c
+            distances[in_component] = (
+                phi[in_component] -
+                phi[sources[source_components == c]].min())
+        return distances
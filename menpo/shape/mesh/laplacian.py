@@ -0,0 +1,133 @@
+import numpy as np
+from scipy.sparse import coo_matrix, diags
+
+
+def triangle_cotangents(points, trilist):
+    r"""
+    The cotangent of the angle at each corner of each triangle and the area of
+    each triangle, for points of any dimensionality.
+
+    Parameters
+    ----------
+    points : ``(n_points, n_dims)`` `ndarray`
+        The points of the mesh.
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+
+    Returns
+    -------
+    cotangents : ``(n_tris, 3)`` `ndarray`
+        The cotangent of the angle at each corner (A, B, C) of each triangle.
+    areas : ``(n_tris,)`` `ndarray`
+        The area of each triangle.
+    """
+    t = points[trilist]
+    cotangents = np.empty(trilist.shape)
+    areas = None
+    for corner in range(3):
+        p = t[:, corner]
+        a = t[:, (corner + 1) % 3] - p
+        b = t[:, (corner + 2) % 3] - p
+        dot = np.einsum('ij,ij->i', a, b)
+        # |a x b| for any dimensionality (Lagrange's identity)
+        cross = np.sqrt(np.maximum(np.einsum('ij,ij->i', a, a) *
+                                   np.einsum('ij,ij->i', b, b) - dot ** 2, 0))
+        if areas is None:
+            areas = 0.5 * cross
+        cotangents[:, corner] = dot / np.maximum(cross, np.finfo(float).tiny)
+    return cotangents, areas
+
+
+def _laplacian_from_edge_weights(i, j, w, n_points):
+    # symmetric off-diagonal weights and the (negative) row sums on the
+    # diagonal, duplicate entries are summed by the conversion to CSR
+    rows = np.concatenate([i, j, i, j])
+    cols = np.concatenate([j, i, i, j])
+    data = np.concatenate([w, w, -w, -w])
+    return coo_matrix((data, (rows, cols)),
+                      shape=(n_points, n_points)).tocsr()
+
+
+def cotangent_laplacian(points, trilist, cotangents=None):
+    r"""
+    The cotangent Laplacian of a mesh. Each edge ``(i, j)`` has weight
+    ``(cot(alpha) + cot(beta)) / 2``, where ``alpha`` and ``beta`` are the
+    angles opposite the edge, and the diagonal holds minus the sum of the
+    weights of each row. The Laplacian is therefore symmetric and negative
+    semi-definite.
+
+    Parameters
+    ----------
+    points : ``(n_points, n_dims)`` `ndarray`
+        The points of the mesh.
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+    cotangents : ``(n_tris, 3)`` `ndarray`, optional
+        The output of :func:`triangle_cotangents`, if already computed.
+
+    Returns
+    -------
+    laplacian : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+        The cotangent Laplacian.
+    """
+    if cotangents is None:
+        cotangents = triangle_cotangents(points, trilist)[0]
+    # the edge opposite to each corner
+    i = np.concatenate([trilist[:, 1], trilist[:, 2], trilist[:, 0]])
+    j = np.concatenate([trilist[:, 2], trilist[:, 0], trilist[:, 1]])
+    return _laplacian_from_edge_weights(i, j, 0.5 * cotangents.T.ravel(),
+                                        points.shape[0])
+
+
+def uniform_laplacian(edges, n_points):
+    r"""
+    The uniform (graph) Laplacian of a mesh. Each edge has weight ``1`` and
+    the diagonal holds minus the number of neighbours of each vertex.
+
+    Parameters
+    ----------
+    edges : ``(n_edges, 2)`` `ndarray`
+        The unique undirected edges of the mesh.
+    n_points : `int`
+        The number of points of the mesh.
+
+    Returns
+    -------
+    laplacian : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+        The uniform Laplacian.
+    """
+    return _laplacian_from_edge_weights(edges[:, 0], edges[:, 1],
+                                        np.ones(edges.shape[0]), n_points)
+
+
+def barycentric_mass_matrix(trilist, areas, n_points):
+    r"""
+    The lumped (barycentric) mass matrix of a mesh: a diagonal matrix holding
+    a third of the area of the triangles around each vertex.
+
+    Parameters
+    ----------
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+    areas : ``(n_tris,)`` `ndarray`
+        The area of each triangle.
+    n_points : `int`
+        The number of points of the mesh.
+
+    Returns
+    -------
+    mass : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+        The diagonal mass matrix.
+    """
+    mass = np.bincount(trilist.ravel(), weights=np.repeat(areas / 3.0, 3),
+                       minlength=n_points)
+    return diags(mass, 0, format='csr')
+
+
+def _with_unit_mass_for_isolated_points(mass):
+    # the points that are in no triangle have no mass, which makes any
+    # (mass - t * laplacian) system singular
+    diagonal = mass.diagonal()
+    if np.all(diagonal > 0):
+        return mass
+    return diags(np.where(diagonal > 0, diagonal, 1.0), 0, format='csr')
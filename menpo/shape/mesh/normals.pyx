@@ -2,6 +2,7 @@ import numpy as np
 import cython
 cimport numpy as np
 cimport cython
+from cython.parallel cimport prange
 from libc.math cimport sqrt
 from menpo.cy_utils cimport dtype_from_memoryview
 
@@ -167,3 +168,118 @@ cpdef compute_face_normals(floats[:, :] vertex, integrals[:, :] face):
     normalize(face_normal)
 
     return np.asarray(face_normal)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void _unit_cross_and_area(floats[:, ::1] vertex,
+                                      integrals[:, ::1] face,
+                                      floats[:, ::1] face_normal,
+                                      floats[::1] area, floats eps,
+                                      Py_ssize_t i) nogil:
+    cdef:
+        Py_ssize_t j
+        floats x[3]
+        floats y[3]
+        floats mag
+    for j in range(3):
+        x[j] = vertex[face[i, 1], j] - vertex[face[i, 0], j]
+        y[j] = vertex[face[i, 2], j] - vertex[face[i, 0], j]
+    face_normal[i, 0] = x[1] * y[2] - x[2] * y[1]
+    face_normal[i, 1] = x[2] * y[0] - x[0] * y[2]
+    face_normal[i, 2] = x[0] * y[1] - x[1] * y[0]
+    mag = sqrt(face_normal[i, 0] * face_normal[i, 0] +
+               face_normal[i, 1] * face_normal[i, 1] +
+               face_normal[i, 2] * face_normal[i, 2])
+    area[i] = 0.5 * mag
+    for j in range(3):
+        # Zero magnitude (or close to) causes massive values, so just set
+        # vector to zero.
+        face_normal[i, j] = 0 if mag < eps else face_normal[i, j] / mag
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline void _gathered_unit_sum(floats[:, ::1] face_normal,
+                                    const np.int64_t[::1] indptr,
+                                    const np.int64_t[::1] indices,
+                                    floats[:, ::1] vertex_normal, floats eps,
+                                    Py_ssize_t v) nogil:
+    cdef:
+        Py_ssize_t j, k
+        floats n[3]
+        floats mag
+    n[0] = 0
+    n[1] = 0
+    n[2] = 0
+    for k in range(indptr[v], indptr[v + 1]):
+        for j in range(3):
+            n[j] += face_normal[indices[k], j]
+    mag = sqrt(n[0] * n[0] + n[1] * n[1] + n[2] * n[2])
+    for j in range(3):
+        vertex_normal[v, j] = 0 if mag < eps else n[j] / mag
+
+
+cpdef compute_face_normals_and_areas(floats[:, ::1] vertex,
+                                     integrals[:, ::1] face):
+    """
+    Compute the unit per-face normals and the areas of the faces, in
+    parallel over the faces.
+
+    Parameters
+    ----------
+    vertex : (N, 3) c-contiguous float32/float64 ndarray
+        The list of points.
+    face : (M, 3) c-contiguous integer ndarray
+        The list of faces (triangle list).
+
+    Returns
+    -------
+    face_normal : (M, 3) c-contiguous float32/float64 ndarray
+        The normal per face.
+    area : (M,) c-contiguous float32/float64 ndarray
+        The area of each face.
+    """
+    vertex_dtype = dtype_from_memoryview(vertex)
+    cdef:
+        Py_ssize_t i, n_face = face.shape[0]
+        floats[:, ::1] face_normal = np.empty([n_face, 3], dtype=vertex_dtype)
+        floats[::1] area = np.empty(n_face, dtype=vertex_dtype)
+        floats eps = np.spacing(1)
+
+    for i in prange(n_face, nogil=True, schedule='static'):
+        _unit_cross_and_area(vertex, face, face_normal, area, eps, i)
+    return np.asarray(face_normal), np.asarray(area)
+
+
+cpdef compute_vertex_normals_from_incidence(floats[:, ::1] face_normal,
+                                            const np.int64_t[::1] indptr,
+                                            const np.int64_t[::1] indices):
+    """
+    Compute the per-vertex normals by summing the unit normals of the
+    faces each vertex belongs to, in parallel over the vertices.
+
+    Parameters
+    ----------
+    face_normal : (M, 3) c-contiguous float32/float64 ndarray
+        The unit normal per face.
+    indptr : (N + 1,) c-contiguous int64 ndarray
+        The CSR row pointers of the vertex to face incidence.
+    indices : (M * 3,) c-contiguous int64 ndarray
+        The CSR column indices (faces) of the vertex to face incidence.
+
+    Returns
+    -------
+    vertex_normal : (N, 3) c-contiguous float32/float64 ndarray
+        The normal per vertex.
+    """
+    normal_dtype = dtype_from_memoryview(face_normal)
+    cdef:
+        Py_ssize_t v, n_vert = indptr.shape[0] - 1
+        floats[:, ::1] vertex_normal = np.empty([n_vert, 3],
+                                                dtype=normal_dtype)
+        floats eps = np.spacing(1)
+
+    for v in prange(n_vert, nogil=True, schedule='static'):
+        _gathered_unit_sum(face_normal, indptr, indices, vertex_normal, eps, v)
+    return np.asarray(vertex_normal)
@@ -1,4 +1,6 @@
-from menpo.shape import TriMesh
+from nose.tools import raises
+from menpo.image import Image
+from menpo.shape import TriMesh, ColouredTriMesh, TexturedTriMesh
 import numpy as np
 
 
@@ -83,3 +85,312 @@ def test_mean_edge_length():
 def test_mean_edge_length_not_unique():
     assert np.allclose(utils_mesh().mean_edge_length(unique=False),
                        np.mean(gt_edge_lengths))
+
+
+def test_unique_edge_indices():
+    assert np.all(utils_mesh().unique_edge_indices() ==
+                  np.array([[0, 1], [0, 2], [0, 3], [1, 2], [2, 3]]))
+
+
+def test_boundary_tri_index():
+    assert np.all(utils_mesh().boundary_tri_index() == [0, 1])
+    mesh = TriMesh.init_2d_grid((4, 4))
+    assert np.all(mesh.boundary_tri_index() ==
+                  [0, 3, 6, 7, 8, 9, 10, 11, 14, 17])
+
+
+def test_boundary_loops():
+    loops = utils_mesh().boundary_loops()
+    assert len(loops) == 1
+    assert np.all(loops[0] == [0, 1, 2, 3])
+
+
+def test_tri_adjacency():
+    assert np.all(utils_mesh().tri_adjacency() == [[-1, -1, 1],
+                                                   [0, -1, -1]])
+
+
+def test_topology_cached_and_shared_by_copies():
+    mesh = utils_mesh()
+    topology = mesh.topology
+    assert mesh.topology is topology
+    assert mesh.copy().topology is topology
+    mesh.trilist = mesh.trilist[:1].copy()
+    assert mesh.topology is not topology
+    assert mesh.topology.n_edges == 3
+
+
+def test_vertex_tri_incidence():
+    incidence = utils_mesh().topology.vertex_tri_incidence()
+    assert incidence.shape == (4, 2)
+    assert np.all(incidence.toarray() == [[1, 1], [1, 0], [1, 1], [0, 1]])
+
+
+def test_geodesic_distances_flat_grid():
+    mesh = TriMesh.init_2d_grid((21, 21), spacing=0.1)
+    source = 10 * 21 + 10
+    distances = mesh.geodesic_distances(source)
+    euclidean = np.linalg.norm(mesh.points - mesh.points[source], axis=1)
+    assert distances[source] == 0
+    assert np.abs(distances - euclidean).max() < 0.05 * euclidean.max()
+
+
+def test_geodesic_distances_multiple_sources():
+    mesh = TriMesh.init_2d_grid((21, 21), spacing=0.1)
+    sources = [0, mesh.n_points - 1]
+    distances = mesh.geodesic_distances(sources)
+    euclidean = np.linalg.norm(mesh.points[:, None] - mesh.points[sources],
+                               axis=2).min(axis=1)
+    np.testing.assert_allclose(distances[sources], 0, atol=1e-10)
+    assert np.abs(distances - euclidean).max() < 0.05 * euclidean.max()
+
+
+def test_geodesic_distances_disconnected():
+    points = np.array([[0., 0.], [1., 0.], [0., 1.],
+                       [5., 0.], [6., 0.], [5., 1.]])
+    mesh = TriMesh(points, trilist=np.array([[0, 1, 2], [3, 4, 5]]))
+    distances = mesh.geodesic_distances(0)
+    assert np.all(np.isfinite(distances[:3]))
+    assert np.all(np.isinf(distances[3:]))
+
+
+def test_geodesic_distances_solver_cached():
+    from menpo.shape import HeatGeodesics
+    mesh = TriMesh.init_2d_grid((5, 5))
+    mesh.geodesic_distances(0)
+    solvers = [v for v in mesh._geometry().values()
+               if isinstance(v, HeatGeodesics)]
+    assert len(solvers) == 1
+    distances = mesh.geodesic_distances(3)
+    assert [v for v in mesh._geometry().values()
+            if isinstance(v, HeatGeodesics)] == solvers
+    mesh.points = mesh.points * 2
+    # replacing the points invalidates the solver
+    np.testing.assert_allclose(mesh.geodesic_distances(3), distances * 2)
+
+
+@raises(ValueError)
+def test_geodesic_distances_invalid_source_raises():
+    TriMesh.init_2d_grid((5, 5)).geodesic_distances(25)
+
+
+def test_geodesic_distances_unreferenced_point():
+    grid = TriMesh.init_2d_grid((5, 5))
+    mesh = TriMesh(np.vstack([grid.points, [[10., 10.]]]),
+                   trilist=grid.trilist)
+    distances = mesh.geodesic_distances(0)
+    assert np.all(np.isfinite(distances[:25]))
+    assert np.isinf(distances[25])
+    assert mesh.geodesic_distances(25)[25] == 0
+
+
+def test_cotangent_laplacian():
+    mesh = utils_mesh()
+    laplacian = mesh.laplacian().toarray()
+    # the diagonals of the square face are opposite right angles
+    gt = np.array([[-1, 0.5, 0, 0.5],
+                   [0.5, -1, 0.5, 0],
+                   [0, 0.5, -1, 0.5],
+                   [0.5, 0, 0.5, -1]])
+    np.testing.assert_allclose(laplacian, gt, atol=1e-12)
+
+
+def test_cotangent_laplacian_linear_precision():
+    mesh = TriMesh.init_2d_grid((5, 5))
+    interior = 12
+    np.testing.assert_allclose(mesh.laplacian().dot(mesh.points)[interior], 0,
+                               atol=1e-12)
+
+
+def test_uniform_laplacian():
+    mesh = utils_mesh()
+    gt = np.array([[-3, 1, 1, 1],
+                   [1, -2, 1, 0],
+                   [1, 1, -3, 1],
+                   [1, 0, 1, -2]])
+    np.testing.assert_allclose(mesh.laplacian(weights='uniform').toarray(),
+                               gt)
+
+
+@raises(ValueError)
+def test_laplacian_invalid_weights_raises():
+    utils_mesh().laplacian(weights='unknown')
+
+
+def test_mass_matrix():
+    mass = utils_mesh().mass_matrix()
+    np.testing.assert_allclose(mass.diagonal(),
+                               [1. / 3, 1. / 6, 1. / 3, 1. / 6])
+    assert mass.nnz == 4
+
+
+def test_laplacian_cached_until_points_replaced():
+    mesh = utils_mesh()
+    laplacian = mesh.laplacian()
+    laplacian.data[:] = 0
+    np.testing.assert_allclose(mesh.laplacian().diagonal(), -1)
+    assert (mesh._geometry()['cotangent_laplacian'] is
+            mesh._laplacian('cotangent'))
+    mesh.points = mesh.points * 2
+    assert 'cotangent_laplacian' not in mesh._geometry()
+    # the cotangent weights are scale invariant
+    np.testing.assert_allclose(mesh.laplacian().diagonal(), -1)
+
+
+def test_smooth():
+    rng = np.random.RandomState(0)
+    grid = TriMesh.init_2d_grid((10, 10))
+    mesh = TriMesh(np.hstack([grid.points, rng.rand(100, 1)]), grid.trilist)
+    smoothed = mesh.smooth(n_iterations=3)
+    assert type(smoothed) is TriMesh
+    assert smoothed.points[:, 2].std() < mesh.points[:, 2].std()
+    # implicit smoothing preserves the weighted centroid
+    mass = mesh.mass_matrix().diagonal()
+    np.testing.assert_allclose(mass.dot(smoothed.points),
+                               mass.dot(mesh.points))
+    np.testing.assert_allclose(
+        mesh.smooth(n_iterations=3, weights='uniform').points[:, 2].mean(),
+        mesh.points[:, 2].mean(), atol=0.05)
+
+
+def test_smooth_factorisation_cache():
+    mesh = TriMesh.init_2d_grid((5, 5))
+    mesh.smooth(step=1.0, cache_factorisation=False)
+    assert not any(isinstance(k, tuple) for k in mesh._geometry())
+    mesh.smooth(step=1.0)
+    assert ('smoothing_factorisation', 'cotangent', 1.0) in mesh._geometry()
+
+
+def test_uniform_laplacian_cached_on_topology():
+    mesh = utils_mesh()
+    laplacian = mesh.topology.uniform_laplacian()
+    assert not laplacian.data.flags.writeable
+    assert mesh.copy().topology.uniform_laplacian() is laplacian
+
+
+def bumpy_grid(shape=(20, 20)):
+    grid = TriMesh.init_2d_grid(shape)
+    z = np.sin(grid.points[:, :1] / 3.0)
+    return TriMesh(np.hstack([grid.points, z]), trilist=grid.trilist)
+
+
+def test_decimate():
+    mesh = bumpy_grid()
+    decimated, mapping = mesh.decimate(200, return_mapping=True)
+    assert type(decimated) is TriMesh
+    assert decimated.n_tris == 200
+    assert mapping.shape == (mesh.n_points,)
+    assert np.all(np.bincount(mapping) > 0)
+    # no triangle flips and the boundary is kept
+    assert np.all(decimated.tri_normals()[:, 2] > 0)
+    np.testing.assert_allclose(decimated.bounds(), mesh.bounds())
+    assert len(decimated.boundary_loops()) == 1
+    assert np.all(decimated.topology.edge_n_tris <= 2)
+
+
+def test_decimate_planar_mesh_is_exact():
+    grid = TriMesh.init_2d_grid((10, 10))
+    mesh = TriMesh(np.hstack([grid.points, np.zeros((100, 1))]),
+                   trilist=grid.trilist)
+    decimated = mesh.decimate(2)
+    np.testing.assert_allclose(decimated.tri_areas().sum(),
+                               mesh.tri_areas().sum())
+
+
+def test_decimate_carries_colours():
+    mesh = bumpy_grid()
+    # colours that are a linear function of the points are interpolated
+    # exactly
+    colours = mesh.points / mesh.points.max(axis=0)
+    ctm = ColouredTriMesh(mesh.points, trilist=mesh.trilist, colours=colours)
+    decimated = ctm.decimate(100)
+    assert type(decimated) is ColouredTriMesh
+    np.testing.assert_allclose(decimated.colours,
+                               decimated.points / mesh.points.max(axis=0))
+    assert ctm.n_points == 400
+
+
+def test_decimate_carries_tcoords():
+    mesh = bumpy_grid()
+    tcoords = mesh.points[:, :2] / 19.0
+    ttm = TexturedTriMesh(mesh.points, tcoords, Image.init_blank((4, 4)),
+                          trilist=mesh.trilist)
+    decimated = ttm.decimate(100)
+    assert type(decimated) is TexturedTriMesh
+    np.testing.assert_allclose(decimated.tcoords.points,
+                               decimated.points[:, :2] / 19.0)
+    assert ttm.tcoords.n_points == 400
+
+
+@raises(ValueError)
+def test_decimate_2d_raises():
+    TriMesh.init_2d_grid((5, 5)).decimate(10)
+
+
+def test_subdivide():
+    mesh = utils_mesh()
+    subdivided, mapping = mesh.subdivide(return_mapping=True)
+    assert subdivided.n_tris == 8
+    assert subdivided.n_points == 9
+    np.testing.assert_allclose(subdivided.points[:4], mesh.points)
+    np.testing.assert_allclose(subdivided.points,
+                               mesh.points[mapping].mean(axis=1))
+    np.testing.assert_allclose(subdivided.tri_areas().sum(),
+                               mesh.tri_areas().sum())
+    assert np.all(subdivided.topology.edge_n_tris <= 2)
+    np.testing.assert_allclose(subdivided.tri_areas(), 0.125)
+
+
+def test_subdivide_carries_colours():
+    ctm = ColouredTriMesh(utils_mesh().points, trilist=utils_mesh().trilist,
+                          colours=np.eye(4)[:, :3])
+    subdivided, mapping = ctm.subdivide(return_mapping=True)
+    assert type(subdivided) is ColouredTriMesh
+    np.testing.assert_allclose(subdivided.colours,
+                               ctm.colours[mapping].mean(axis=1))
+
+
+def test_resampled_mesh_shares_texture_and_copies_landmarks():
+    import warnings
+    from menpo.shape import PointCloud
+    mesh = bumpy_grid()
+    texture = Image.init_blank((4, 4))
+    ttm = TexturedTriMesh(mesh.points, mesh.points[:, :2] / 19.0, texture,
+                          trilist=mesh.trilist)
+    ttm.landmarks['test'] = PointCloud(mesh.points[:3])
+    with warnings.catch_warnings(record=True) as w:
+        warnings.simplefilter('always')
+        decimated = ttm.decimate(100)
+        subdivided = ttm.subdivide()
+    assert len(w) == 0
+    for resampled in (decimated, subdivided):
+        assert resampled.texture is ttm.texture
+        assert resampled.landmarks['test'] is not ttm.landmarks['test']
+        np.testing.assert_allclose(resampled.landmarks['test'].points,
+                                   mesh.points[:3])
+
+
+def test_laplacian_and_smooth_of_edited_copy():
+    mesh = bumpy_grid((8, 8))
+    mesh.laplacian()
+    mesh.mass_matrix()
+    mesh.smooth(step=1.0)
+    edited = mesh.copy()
+    edited.points[:, 2] *= 3
+    fresh = TriMesh(edited.points, trilist=edited.trilist)
+    np.testing.assert_allclose(edited.laplacian().toarray(),
+                               fresh.laplacian().toarray())
+    np.testing.assert_allclose(edited.mass_matrix().diagonal(),
+                               fresh.mass_matrix().diagonal())
+    np.testing.assert_allclose(edited.smooth(step=1.0).points,
+                               fresh.smooth(step=1.0).points)
+
+
+def test_geodesic_distances_of_edited_copy():
+    mesh = bumpy_grid((8, 8))
+    mesh.geodesic_distances(0)
+    # constrain_to_bounds edits the points of a copy in place
+    constrained = mesh.constrain_to_bounds(([0, 0, 0], [7, 7, 0.5]))
+    fresh = TriMesh(constrained.points, trilist=constrained.trilist)
+    np.testing.assert_allclose(constrained.geodesic_distances(0),
+                               fresh.geodesic_distances(0))
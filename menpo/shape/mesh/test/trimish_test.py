@@ -325,3 +325,54 @@ def test_trimesh_vertex_normals():
     trimesh.points = trimesh.points.astype(np.float32)
     vertex_normals = trimesh.vertex_normals()
     assert_allclose(vertex_normals, expected_normals)
+
+
+def test_trimesh_normals_match_uncached_kernels():
+    from menpo.shape.mesh.normals import (compute_vertex_normals,
+                                          compute_face_normals)
+    grid = TriMesh.init_2d_grid((10, 12))
+    points = np.hstack([grid.points, np.random.rand(grid.n_points, 1)])
+    trimesh = TriMesh(points, trilist=grid.trilist)
+    assert_allclose(trimesh.vertex_normals(),
+                    compute_vertex_normals(points, grid.trilist))
+    assert_allclose(trimesh.tri_normals(),
+                    compute_face_normals(points, grid.trilist))
+
+
+def test_trimesh_normals_and_areas_cached_until_points_replaced():
+    points = np.array([[0.0, 0.0, -1.0],
+                       [1.0, 0.0, 0.0],
+                       [1.0, 1.0, 0.0],
+                       [0.0, 1.0, 0.0]])
+    trilist = np.array([[0, 1, 3],
+                        [1, 2, 3]])
+    trimesh = TriMesh(points, trilist)
+    normals = trimesh.vertex_normals()
+    areas = trimesh.tri_areas()
+    geometry = trimesh._geometry()
+    assert 'vertex_normals' in geometry and 'tri_areas' in geometry
+    # the cached results are not handed out
+    normals[:] = 0
+    assert_allclose(trimesh.vertex_normals()[2], [0, 0, 1])
+    # copies may be edited in place, so they do not inherit the cache
+    assert 'tri_normals' not in trimesh.copy()._geometry()
+    trimesh._from_vector_inplace(trimesh.as_vector() * 2)
+    assert trimesh._geometry() is not geometry
+    assert_allclose(trimesh.tri_areas(), areas * 4)
+
+
+def test_trimesh_edited_copy_recomputes_geometry():
+    points = np.array([[0.0, 0.0, -1.0],
+                       [1.0, 0.0, 0.0],
+                       [1.0, 1.0, 0.0],
+                       [0.0, 1.0, 0.0]])
+    trilist = np.array([[0, 1, 3],
+                        [1, 2, 3]])
+    trimesh = TriMesh(points, trilist)
+    trimesh.vertex_normals()
+    trimesh.tri_areas()
+    # constrain_to_bounds edits the points of a copy in place
+    constrained = trimesh.constrain_to_bounds(([0, 0, 0], [1, 1, 1]))
+    fresh = TriMesh(constrained.points, trilist)
+    assert_allclose(constrained.vertex_normals(), fresh.vertex_normals())
+    assert_allclose(constrained.tri_areas(), fresh.tri_areas())
@@ -1,5 +1,6 @@
 import numpy as np
 
+from menpo.base import copy_landmarks_and_path
 from menpo.shape import PointCloud
 from menpo.transform import tcoords_to_image_coords
 
@@ -192,6 +193,15 @@ class TexturedTriMesh(TriMesh):
                                self.tcoords.points, self.texture,
                                trilist=self.trilist)
 
+    def _vertex_attributes(self):
+        return [self.tcoords.points]
+
+    def _from_resampled(self, points, trilist, attributes):
+        # the texture is shared, as it is unchanged by the resampling
+        return copy_landmarks_and_path(
+            self, TexturedTriMesh(points, attributes[0], self.texture,
+                                  trilist=trilist, copy=False))
+
     def from_mask(self, mask):
         """
         A 1D boolean array with the same number of elements as the number of
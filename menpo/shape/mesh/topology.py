@@ -0,0 +1,243 @@
+import numpy as np
+
+
+def _readonly(array):
+    array.flags.writeable = False
+    return array
+
+
+class TriMeshTopology(object):
+    r"""
+    The topology of a triangle list: the half-edges of every triangle, the
+    unique (undirected) edges, which half-edges share each edge and which
+    triangles each vertex belongs to.
+    Everything is built on first use with vectorized sorting (``np.unique``),
+    which takes ``O(n log n)`` time in the number of triangles, and is then
+    cached, so repeated queries reuse the same arrays.
+
+    A :map:`TriMesh` builds its topology on first use (see
+    :attr:`TriMesh.topology`) and caches it for as long as its trilist is not
+    replaced. The topology is immutable (all its arrays are read-only), so it
+    is shared by copies of the mesh.
+
+    Parameters
+    ----------
+    trilist : ``(n_tris, 3)`` `ndarray`
+        The triangle list.
+    n_points : `int`
+        The number of points of the mesh.
+    """
+    def __init__(self, trilist, n_points):
+        trilist = np.asarray(trilist)
+        self.n_tris = trilist.shape[0]
+        if self.n_tris > 0:
+            n_points = max(n_points, int(trilist.max()) + 1)
+        self.n_points = n_points
+        self._trilist = _readonly(np.array(trilist, dtype=np.int64,
+                                           order='C'))
+        self._edges = None
+        self._tri_adjacency = None
+        self._boundary_loops = None
+        self._vertex_tri_incidence = None
+        self._uniform_laplacian = None
+
+    def _build_edges(self):
+        if self._edges is None:
+            trilist, n_points = self._trilist, self.n_points
+            # half-edges in the order of TriMesh.edge_indices: all the AB,
+            # then all the BC, then all the CA
+            half_edges = np.concatenate([trilist[:, [0, 1]],
+                                         trilist[:, [1, 2]],
+                                         trilist[:, [2, 0]]])
+            # a unique integer key for each undirected edge
+            keys = (half_edges.min(axis=1) * n_points +
+                    half_edges.max(axis=1))
+            keys, half_edge_to_edge, counts = np.unique(
+                keys, return_inverse=True, return_counts=True)
+            edges = np.stack([keys // n_points, keys % n_points], axis=1)
+            self._edges = (_readonly(half_edges), _readonly(edges),
+                           _readonly(half_edge_to_edge), _readonly(counts))
+        return self._edges
+
+    @property
+    def half_edges(self):
+        r"""
+        The directed edges of every triangle: all the AB edges, then all the
+        BC edges, then all the CA edges.
+
+        :type: ``(n_tris * 3, 2)`` `ndarray`
+        """
+        return self._build_edges()[0]
+
+    @property
+    def edges(self):
+        r"""
+        The unique undirected edges, each as a sorted pair of vertices.
+
+        :type: ``(n_edges, 2)`` `ndarray`
+        """
+        return self._build_edges()[1]
+
+    @property
+    def half_edge_to_edge(self):
+        r"""
+        The unique edge of each half-edge.
+
+        :type: ``(n_tris * 3,)`` `ndarray`
+        """
+        return self._build_edges()[2]
+
+    @property
+    def edge_n_tris(self):
+        r"""
+        The number of triangles that share each unique edge.
+
+        :type: ``(n_edges,)`` `ndarray`
+        """
+        return self._build_edges()[3]
+
+    @property
+    def n_edges(self):
+        r"""
+        The number of unique edges.
+
+        :type: `int`
+        """
+        return self.edges.shape[0]
+
+    def half_edge_tri_index(self):
+        r"""
+        The triangle that each half-edge belongs to.
+
+        Returns
+        -------
+        tri_index : ``(n_tris * 3,)`` `ndarray`
+            The triangle of each half-edge.
+        """
+        return np.tile(np.arange(self.n_tris), 3)
+
+    def boundary_edge_mask(self):
+        r"""
+        Which of the unique edges belong to a single triangle.
+
+        Returns
+        -------
+        mask : ``(n_edges,)`` `ndarray`
+            ``True`` for the edges on the boundary of the mesh.
+        """
+        return self.edge_n_tris == 1
+
+    def boundary_tri_index(self):
+        r"""
+        The triangles that have at least one edge on the boundary of the mesh.
+
+        Returns
+        -------
+        tri_index : ``(n_boundary_tris,)`` `ndarray`
+            The sorted indices of the boundary triangles.
+        """
+        on_boundary = self.boundary_edge_mask()[self.half_edge_to_edge]
+        return np.unique(np.nonzero(on_boundary)[0] % max(self.n_tris, 1))
+
+    def tri_adjacency(self):
+        r"""
+        The neighbouring triangle across each edge of each triangle.
+
+        Returns
+        -------
+        adjacency : ``(n_tris, 3)`` `ndarray`
+            ``adjacency[t, k]`` is the triangle that shares the ``k``'th edge
+            (AB, BC, CA) of triangle ``t``, or ``-1`` if the edge is on the
+            boundary or is shared by more than two triangles.
+        """
+        if self._tri_adjacency is None:
+            order = np.argsort(self.half_edge_to_edge, kind='mergesort')
+            starts = np.cumsum(self.edge_n_tris) - self.edge_n_tris
+            manifold = starts[self.edge_n_tris == 2]
+            first, second = order[manifold], order[manifold + 1]
+            tri_index = self.half_edge_tri_index()
+            adjacency = np.full(self.n_tris * 3, -1, dtype=np.int64)
+            adjacency[first] = tri_index[second]
+            adjacency[second] = tri_index[first]
+            self._tri_adjacency = _readonly(
+                adjacency.reshape([3, self.n_tris]).T)
+        return self._tri_adjacency
+
+    def vertex_tri_incidence(self):
+        r"""
+        The triangles that each vertex belongs to, as a sparse
+        ``(n_points, n_tris)`` matrix in CSR format. The triangles of each
+        vertex (the column indices of each row) are in ascending order, so
+        gathering over them visits the triangles in trilist order.
+
+        Returns
+        -------
+        incidence : ``(n_points, n_tris)`` `scipy.sparse.csr_matrix`
+            ``incidence[v, t]`` is the number of times that vertex ``v``
+            appears in triangle ``t``.
+        """
+        if self._vertex_tri_incidence is None:
+            from scipy.sparse import csr_matrix
+            tri_index = np.repeat(np.arange(self.n_tris), 3)
+            incidence = csr_matrix((np.ones(self.n_tris * 3),
+                                    (self._trilist.ravel(), tri_index)),
+                                   shape=(self.n_points, self.n_tris))
+            incidence.sort_indices()
+            # scipy may downcast the index arrays, keep int64 for the kernels
+            incidence.indptr = incidence.indptr.astype(np.int64)
+            incidence.indices = incidence.indices.astype(np.int64)
+            for a in (incidence.data, incidence.indptr, incidence.indices):
+                _readonly(a)
+            self._vertex_tri_incidence = incidence
+        return self._vertex_tri_incidence
+
+    def uniform_laplacian(self):
+        r"""
+        The uniform (graph) Laplacian of the triangle list, as a sparse
+        ``(n_points, n_points)`` matrix in CSR format. Each edge has weight
+        ``1`` and the diagonal holds minus the number of neighbours of each
+        vertex.
+
+        Returns
+        -------
+        laplacian : ``(n_points, n_points)`` `scipy.sparse.csr_matrix`
+            The uniform Laplacian. Its arrays are read-only.
+        """
+        if self._uniform_laplacian is None:
+            from .laplacian import uniform_laplacian
+            laplacian = uniform_laplacian(self.edges, self.n_points)
+            for a in (laplacian.data, laplacian.indptr, laplacian.indices):
+                _readonly(a)
+            self._uniform_laplacian = laplacian
+        return self._uniform_laplacian
+
+    def boundary_loops(self):
+        r"""
+        The closed loops of vertices along the boundary of the mesh. Each
+        loop follows the orientation of its triangles. The boundary is
+        assumed to be manifold (no vertex is on more than one boundary loop).
+
+        Returns
+        -------
+        loops : `list` of ``(n_loop_vertices,)`` `ndarray`
+            The ordered vertex indices of each boundary loop.
+        """
+        if self._boundary_loops is None:
+            on_boundary = self.boundary_edge_mask()[self.half_edge_to_edge]
+            boundary = self.half_edges[on_boundary]
+            successor = dict(zip(boundary[:, 0].tolist(),
+                                 boundary[:, 1].tolist()))
+            visited = set()
+            loops = []
+            for start in boundary[:, 0].tolist():
+                if start in visited:
+                    continue
+                loop = []
+                vertex = start
+                while vertex not in visited and vertex in successor:
+                    visited.add(vertex)
+                    loop.append(vertex)
+                    vertex = successor[vertex]
+                loops.append(_readonly(np.array(loop, dtype=np.int64)))
+            self._boundary_loops = loops
+        return self._boundary_loops
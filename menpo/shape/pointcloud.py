@@ -5,6 +5,7 @@ import numbers
 import collections
 from warnings import warn
 from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
 from scipy.spatial.distance import cdist
 
 from menpo.transform import WithDims
@@ -126,6 +127,10 @@ class PointCloud(Shape):
 
     Currently only 2D and 3D pointclouds are viewable.
 
+    Nearest neighbour and radius queries are answered by a KD-tree of the
+    points (see :attr:`kdtree`) that is built on first use and cached until
+    the points are replaced.
+
     Parameters
     ----------
     points : ``(n_points, n_dims)`` `ndarray`
@@ -138,6 +143,11 @@ class PointCloud(Shape):
         In general this should only be used if you know what you are doing.
     """
 
+    # attributes holding caches that are cheap to rebuild and not pickled
+    _cache_attributes = ('_kdtree',)
+    # (points, tree) of the cached KD-tree, see the kdtree property
+    _kdtree = None
+
     def __init__(self, points, copy=True):
         super(PointCloud, self).__init__()
         if not copy:
@@ -1140,31 +1150,159 @@ class PointCloud(Shape):
         self.points = transform(self.points)
         return self
 
-    def distance_to(self, pointcloud, **kwargs):
+    def copy(self):
+        r"""
+        Generate an efficient copy of this PointCloud. The cached results
+        derived from the points (such as the :attr:`kdtree`) are not carried
+        over, so they never outlive an in place edit of the copied points.
+
+        Returns
+        -------
+        ``type(self)``
+            A copy of this object
+        """
+        new = super(PointCloud, self).copy()
+        for attr in self._cache_attributes:
+            new.__dict__.pop(attr, None)
+        return new
+
+    def __getstate__(self):
+        # caches are cheap to rebuild, don't pickle them
+        state = self.__dict__.copy()
+        for attr in self._cache_attributes:
+            state.pop(attr, None)
+        return state
+
+    @property
+    def kdtree(self):
+        r"""
+        A KD-tree of the points. It is built on first use and cached until
+        the points are replaced (for instance by :meth:`from_vector_inplace`
+        or by transforming this PointCloud in place). Note that modifying the
+        ``points`` array in place does **not** invalidate the cache.
+
+        :type: `scipy.spatial.cKDTree`
+        """
+        cache = self._kdtree
+        if cache is None or cache[0] is not self.points:
+            cache = (self.points, cKDTree(self.points))
+            self._kdtree = cache
+        return cache[1]
+
+    def nearest_neighbours(self, other, k=1, max_distance=np.inf):
+        r"""
+        Finds the nearest points of this PointCloud to each of the points of
+        `other`.
+
+        Parameters
+        ----------
+        other : :map:`PointCloud` or ``(n_queries, n_dims)`` `ndarray`
+            The query points. This must be of the same dimension as this
+            PointCloud.
+        k : `int`, optional
+            The number of nearest neighbours to find for each query point.
+        max_distance : `float`, optional
+            Only neighbours closer than this are returned. Missing neighbours
+            have infinite distance and an index of ``n_points``.
+
+        Returns
+        -------
+        distances : ``(n_queries,)`` or ``(n_queries, k)`` `ndarray`
+            The Euclidean distances to the nearest neighbours, sorted from
+            nearest to farthest. The last dimension is dropped if ``k == 1``.
+        indices : ``(n_queries,)`` or ``(n_queries, k)`` `ndarray`
+            The indices of the nearest neighbours in this PointCloud.
+
+        Raises
+        ------
+        ValueError
+            If `other` is not of the same dimensionality as this PointCloud.
+        """
+        points = getattr(other, 'points', other)
+        if points.shape[-1] != self.n_dims:
+            raise ValueError("The query points must be of the same "
+                             "dimensionality as the PointCloud.")
+        return self.kdtree.query(points, k=k, distance_upper_bound=max_distance)
+
+    def points_within(self, centres, radius):
+        r"""
+        Finds the points of this PointCloud that lie within `radius` of
+        each of `centres`.
+
+        Parameters
+        ----------
+        centres : ``(n_dims,)`` or ``(n_queries, n_dims)`` `ndarray` or :map:`PointCloud`
+            The centre (or centres) of the query balls.
+        radius : `float`
+            The radius of the query balls.
+
+        Returns
+        -------
+        indices : ``(n_within,)`` `ndarray` or `list` of ``(n_within,)`` `ndarray`
+            The sorted indices of the points within `radius` of the centre.
+            If several centres are provided, a `list` with the indices for
+            each centre is returned.
+
+        Raises
+        ------
+        ValueError
+            If `centres` is not of the same dimensionality as this PointCloud.
+        """
+        centres = np.asarray(getattr(centres, 'points', centres))
+        if centres.shape[-1] != self.n_dims:
+            raise ValueError("The query centres must be of the same "
+                             "dimensionality as the PointCloud.")
+        indices = self.kdtree.query_ball_point(centres, radius)
+        if centres.ndim == 1:
+            return np.array(sorted(indices), dtype=np.int)
+        return [np.array(sorted(i), dtype=np.int) for i in indices]
+
+    def distance_to(self, pointcloud, max_distance=None, **kwargs):
         r"""
         Returns a distance matrix between this PointCloud and another.
         By default the Euclidean distance is calculated - see
         `scipy.spatial.distance.cdist` for valid kwargs to change the metric
         and other properties.
 
+        If `max_distance` is provided, a sparse matrix of the (Euclidean)
+        distances of the pairs of points that are at most `max_distance`
+        apart is computed with the KD-trees of the two PointClouds, without
+        ever building the dense matrix.
+
         Parameters
         ----------
         pointcloud : :map:`PointCloud`
             The second pointcloud to compute distances between. This must be
             of the same dimension as this PointCloud.
+        max_distance : `float`, optional
+            If provided, the distances larger than this are not computed and
+            a sparse matrix is returned.
 
         Returns
         -------
-        distance_matrix: ``(n_points, n_points)`` `ndarray`
+        distance_matrix: ``(n_points, n_points)`` `ndarray` or `scipy.sparse.csr_matrix`
             The symmetric pairwise distance matrix between the two PointClouds
             s.t. ``distance_matrix[i, j]`` is the distance between the i'th
             point of this PointCloud and the j'th point of the input
-            PointCloud.
+            PointCloud. Note that in the sparse case pairs of coincident
+            points (with a distance of ``0``) are not stored.
+
+        Raises
+        ------
+        ValueError
+            If the PointClouds are not of the same dimensionality, or if
+            `max_distance` is combined with kwargs for `cdist`.
         """
         if self.n_dims != pointcloud.n_dims:
             raise ValueError("The two PointClouds must be of the same "
                              "dimensionality.")
-        return cdist(self.points, pointcloud.points, **kwargs)
+        if max_distance is None:
+            return cdist(self.points, pointcloud.points, **kwargs)
+        if kwargs:
+            raise ValueError("Only the Euclidean distance is supported when "
+                             "max_distance is provided.")
+        return self.kdtree.sparse_distance_matrix(
+            pointcloud.kdtree, max_distance).tocsr()
 
     def norm(self, **kwargs):
         r"""
@@ -3,6 +3,7 @@ from numpy.testing import assert_allclose
 from nose.tools import raises
 from scipy.sparse import csr_matrix, lil_matrix
 from menpo.image import Image, MaskedImage
+from menpo.testing import is_same_array
 from menpo.shape import (UndirectedGraph, DirectedGraph, Tree,
                          PointUndirectedGraph, PointDirectedGraph, PointTree)
 
@@ -392,3 +393,104 @@ def test_relative_locations():
 def test_relative_locations():
     pg_tree.relative_location_edge(8, 5)
     pg_tree.relative_location_edge(0, 6)
+
+
+def _chain_adjacency(n_vertices):
+    return csr_matrix((np.ones(n_vertices - 1),
+                       (np.arange(n_vertices - 1), np.arange(1, n_vertices))),
+                      shape=(n_vertices, n_vertices))
+
+
+def test_deep_tree_no_recursion():
+    n_vertices = 5000
+    t = Tree(_chain_adjacency(n_vertices), 0)
+    assert t.maximum_depth == n_vertices - 1
+    assert t.depth_of_vertex(2500) == 2500
+    assert t.leaves == [n_vertices - 1]
+    assert t.parent(0) is None
+    assert t.parent(10) == 9
+    assert len(t.find_all_paths(0, n_vertices - 1)[0]) == n_vertices
+
+
+def test_has_cycles_large_graphs():
+    chain = _chain_adjacency(5000)
+    assert not DirectedGraph(chain).has_cycles()
+    assert not UndirectedGraph(chain + chain.T).has_cycles()
+    chain = chain.tolil()
+    chain[4999, 0] = 1
+    chain = chain.tocsr()
+    assert DirectedGraph(chain).has_cycles()
+    assert UndirectedGraph(chain + chain.T).has_cycles()
+
+
+def test_graph_cache_invalidated_on_new_adjacency():
+    g = DirectedGraph(adj_directed)
+    assert g.has_cycles()
+    assert g.children(1) == [0, 2, 3]
+    g.adjacency_matrix = csr_matrix(np.triu(adj_directed.toarray()))
+    assert not g.has_cycles()
+    assert g.children(1) == [2, 3]
+
+
+def test_tree_init_from_edges_shares_checks():
+    edges = np.array([[0, 1], [0, 2], [1, 3], [1, 4], [2, 5], [3, 6],
+                      [4, 7], [5, 8]])
+    t = PointTree.init_from_edges(points2, edges, 0)
+    t_2 = PointTree.init_from_edges(points2 + 1, edges, 0)
+    assert t.adjacency_matrix is t_2.adjacency_matrix
+    assert t._cache()['is_tree']
+    assert t._cache()[('is_valid_root', 0)]
+    t_copy = t.copy()
+    assert t_copy.adjacency_matrix is t.adjacency_matrix
+    assert not is_same_array(t_copy.points, t.points)
+
+
+@raises(ValueError)
+def test_tree_init_from_edges_shared_invalid_root():
+    edges = np.array([[0, 1], [0, 2], [1, 3], [1, 4], [2, 5], [3, 6],
+                      [4, 7], [5, 8]])
+    PointTree.init_from_edges(points2, edges, 0)
+    PointTree.init_from_edges(points2, edges, 3)
+
+
+def test_pointgraph_copy_owns_writeable_adjacency():
+    g = PointUndirectedGraph(points, adj_undirected)
+    g_copy = g.copy()
+    assert g_copy.adjacency_matrix is not g.adjacency_matrix
+    n_edges = g.n_edges
+    g_copy.adjacency_matrix.data[:] = 0
+    g_copy.adjacency_matrix.eliminate_zeros()
+    assert g_copy.n_edges == 0
+    assert g.n_edges == n_edges
+
+
+def test_graph_copy_true_unshares_adjacency():
+    edges = np.array([[0, 1], [1, 2], [2, 3]])
+    g = UndirectedGraph.init_from_edges(edges, 4)
+    g_private = UndirectedGraph(g.adjacency_matrix, copy=True)
+    assert g_private.adjacency_matrix is not g.adjacency_matrix
+    g_private.adjacency_matrix.data[:] = 2
+    assert np.all(g.adjacency_matrix.data == 1)
+    assert g_private._cache() is not g._cache()
+
+
+@raises(ValueError)
+def test_init_from_edges_adjacency_read_only():
+    edges = np.array([[0, 1], [1, 2], [2, 3]])
+    g = PointUndirectedGraph.init_from_edges(points[:4], edges)
+    g.adjacency_matrix.data[0] = 2
+
+
+def test_init_from_edges_copies_points():
+    edges = np.array([[0, 1], [1, 2], [2, 3]])
+    p = points[:4].astype(np.float64)
+    g = PointUndirectedGraph.init_from_edges(p, edges)
+    assert not is_same_array(g.points, p)
+    g = PointUndirectedGraph.init_from_edges(p, edges, copy=False)
+    assert is_same_array(g.points, p)
+
+
+def test_pointgraph_kdtree_not_copied():
+    g = PointUndirectedGraph(points, adj_undirected)
+    g.kdtree
+    assert g.copy()._kdtree is None
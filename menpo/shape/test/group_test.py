@@ -30,7 +30,6 @@ def test_LabelledPointUndirectedGraph_copy_true():
 def test_LabelledPointUndirectedGraph_copy_false():
     lgroup = LabelledPointUndirectedGraph(points, adjacency_matrix, mask_dict, copy=False)
     assert is_same_array(lgroup.points, points)
-    assert lgroup._labels_to_masks is mask_dict
     assert lgroup.adjacency_matrix is adjacency_matrix
 
 
@@ -39,12 +38,33 @@ def test_LabelledPointUndirectedGraph_copy_method():
     lgroup_copy = lgroup.copy()
 
     assert not is_same_array(lgroup_copy.points, lgroup.points)
-    # Check the mask dictionary is deepcopied properly
-    assert lgroup._labels_to_masks is not lgroup_copy._labels_to_masks
-    masks = zip(lgroup_copy._labels_to_masks.values(),
-                lgroup._labels_to_masks.values())
-    for ms in masks:
-        assert ms[0] is not ms[1]
+    # The (immutable) labels are shared
+    assert lgroup._label_index is lgroup_copy._label_index
+    for mask in lgroup_copy._labels_to_masks.values():
+        assert not mask.flags.writeable
+    # The (writeable) adjacency matrix is copied
+    assert lgroup_copy.adjacency_matrix is not lgroup.adjacency_matrix
+
+
+def test_LabelledPointUndirectedGraph_init_from_edges_shares_adjacency():
+    edges = np.array([[0, 1], [1, 2], [2, 3]])
+    lgroup = LabelledPointUndirectedGraph.init_from_edges(points, edges,
+                                                          mask_dict)
+    lgroup_2 = LabelledPointUndirectedGraph.init_from_edges(points.copy(),
+                                                            edges, mask_dict)
+    assert lgroup.adjacency_matrix is lgroup_2.adjacency_matrix
+    assert not lgroup.adjacency_matrix.data.flags.writeable
+    assert lgroup._cache() is lgroup_2._cache()
+    assert lgroup.n_edges == 3
+    assert lgroup.copy().adjacency_matrix is lgroup.adjacency_matrix
+
+
+@raises(ValueError)
+def test_LabelledPointUndirectedGraph_shared_adjacency_read_only():
+    edges = np.array([[0, 1], [1, 2], [2, 3]])
+    lgroup = LabelledPointUndirectedGraph.init_from_edges(points, edges,
+                                                          mask_dict)
+    lgroup.adjacency_matrix.data[0] = 2
 
 
 def test_LabelledPointUndirectedGraph_iterate_labels():
@@ -196,3 +216,37 @@ def test_LabelledPointUndirectedGraph_has_nan_values():
     lgroup = LabelledPointUndirectedGraph.init_with_all_label(points2,
                                                               adjacency_matrix)
     assert lgroup.has_nan_values()
+
+
+def test_LabelledPointUndirectedGraph_labels_not_modified_by_masks():
+    masks = OrderedDict([('all', np.ones(10, dtype=np.bool))])
+    lgroup = LabelledPointUndirectedGraph(points, adjacency_matrix, masks)
+    masks['all'][0] = False
+    assert lgroup._labels_to_masks['all'][0]
+
+
+def test_LabelledPointUndirectedGraph_with_labels_cached():
+    edges = np.array([[0, 1], [1, 2], [5, 6], [6, 7], [8, 9]])
+    lgroup = LabelledPointUndirectedGraph.init_from_edges(points, edges,
+                                                          mask_dict_3)
+    lower_group = lgroup.with_labels('lower')
+    assert lower_group.n_points == 6
+    assert lower_group.n_edges == 2
+    assert np.all(lower_group._labels_to_masks['lower'])
+    # a different group with the same template reuses the selection
+    lgroup_2 = LabelledPointUndirectedGraph.init_from_edges(points * 2, edges,
+                                                            mask_dict_3)
+    lower_group_2 = lgroup_2.with_labels('lower')
+    assert lower_group_2.adjacency_matrix is lower_group.adjacency_matrix
+    assert lower_group_2._label_index is lower_group._label_index
+    assert_allclose(lower_group_2.points, points[:6] * 2)
+
+
+def test_LabelledPointUndirectedGraph_with_overlapping_labels():
+    lgroup = LabelledPointUndirectedGraph(points, adjacency_matrix,
+                                          mask_dict_3)
+    new_lgroup = lgroup.with_labels(['upper', 'all'])
+    assert new_lgroup.labels == ['upper', 'all']
+    assert new_lgroup.n_points == 10
+    assert np.all(new_lgroup._labels_to_masks['upper'] == upper)
+    assert lgroup.without_labels('all').labels == ['lower', 'upper']
@@ -1,3 +1,4 @@
+import pickle
 import warnings
 import numpy as np
 from nose.tools import raises
@@ -198,3 +199,75 @@ def test_pointcloud_bounding_box_3d():
 def test_bounding_box_creation():
     bb = bounding_box([0, 0], [1, 1])
     assert_allclose(bb.points, [[0, 0], [1, 0], [1, 1], [0, 1]])
+
+
+def test_pointcloud_kdtree_cached():
+    pc = PointCloud(np.random.rand(20, 3))
+    assert pc.kdtree is pc.kdtree
+
+
+def test_pointcloud_kdtree_invalidated():
+    pc = PointCloud(np.random.rand(20, 2))
+    tree = pc.kdtree
+    pc._from_vector_inplace(pc.as_vector() + 1)
+    assert pc.kdtree is not tree
+    assert_allclose(pc.kdtree.data, pc.points)
+    tree = pc.kdtree
+    pc._transform_self_inplace(lambda x: x * 2)
+    assert pc.kdtree is not tree
+    assert_allclose(pc.kdtree.data, pc.points)
+
+
+def test_pointcloud_nearest_neighbours():
+    pc = PointCloud(np.random.rand(50, 3))
+    queries = PointCloud(np.random.rand(10, 3))
+    distances, indices = pc.nearest_neighbours(queries)
+    dense = pc.distance_to(queries)
+    assert_allclose(indices, np.argmin(dense, axis=0))
+    assert_allclose(distances, np.min(dense, axis=0))
+    distances, indices = pc.nearest_neighbours(queries, k=3)
+    assert distances.shape == (10, 3)
+    assert_allclose(indices, np.argsort(dense, axis=0)[:3].T)
+
+
+def test_pointcloud_points_within():
+    pc = PointCloud(np.random.rand(50, 2))
+    centre = np.array([0.5, 0.5])
+    expected = np.nonzero(np.linalg.norm(pc.points - centre, axis=1) <=
+                          0.3)[0]
+    assert_allclose(pc.points_within(centre, 0.3), expected)
+    within = pc.points_within(PointCloud(np.array([centre, centre])), 0.3)
+    assert len(within) == 2
+    assert_allclose(within[1], expected)
+
+
+def test_pointcloud_sparse_distance_to():
+    pc = PointCloud(np.random.rand(30, 2))
+    other = PointCloud(np.random.rand(20, 2))
+    dense = pc.distance_to(other)
+    sparse = pc.distance_to(other, max_distance=0.2)
+    assert sparse.shape == (30, 20)
+    assert_allclose(sparse.toarray(), np.where(dense <= 0.2, dense, 0))
+
+
+@raises(ValueError)
+def test_pointcloud_sparse_distance_to_metric_raises():
+    pc = PointCloud(np.random.rand(30, 2))
+    pc.distance_to(pc, max_distance=0.2, metric='cityblock')
+
+
+def test_pointcloud_kdtree_not_pickled():
+    pc = PointCloud(np.random.rand(20, 2))
+    pc.kdtree
+    unpickled = pickle.loads(pickle.dumps(pc))
+    assert unpickled._kdtree is None
+    assert_allclose(unpickled.nearest_neighbours(pc)[1], np.arange(20))
+
+
+def test_pointcloud_kdtree_not_copied():
+    pc = PointCloud(np.random.rand(20, 2))
+    pc.kdtree
+    pc_copy = pc.copy()
+    assert pc_copy._kdtree is None
+    pc_copy.points[:] += 1
+    assert_allclose(pc_copy.kdtree.data, pc_copy.points)
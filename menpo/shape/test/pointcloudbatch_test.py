@@ -0,0 +1,113 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_equal
+from nose.tools import raises
+
+from menpo.shape import PointCloud, PointCloudBatch, mean_pointcloud
+from menpo.transform import (HomogeneousBatch, Translation, UniformScale,
+                             generalized_procrustes)
+from menpo.math import as_matrix
+from menpo.model import PCAModel
+
+
+points = np.random.rand(5, 10, 2)
+pointclouds = [PointCloud(p) for p in points]
+
+
+def test_pointcloudbatch_init_from_pointclouds():
+    batch = PointCloudBatch.init_from_pointclouds(pointclouds)
+    assert batch.n_pointclouds == 5
+    assert batch.n_points == 10
+    assert batch.n_dims == 2
+    assert batch.n_parameters == 20
+    assert_equal(batch.points, points)
+
+
+def test_pointcloudbatch_getitem_is_view():
+    batch = PointCloudBatch(points)
+    pc = batch[2]
+    assert isinstance(pc, PointCloud)
+    pc.points[0, 0] = -1
+    assert batch.points[2, 0, 0] == -1
+    sliced = batch[1:3]
+    assert isinstance(sliced, PointCloudBatch)
+    assert len(sliced) == 2
+    assert_equal(sliced.points, batch.points[1:3])
+
+
+def test_pointcloudbatch_statistics():
+    batch = PointCloudBatch(points)
+    min_b, max_b = batch.bounds(boundary=1)
+    for i, pc in enumerate(pointclouds):
+        assert_allclose(batch.centre()[i], pc.centre())
+        assert_allclose(batch.centre_of_bounds()[i], pc.centre_of_bounds())
+        assert_allclose(min_b[i], pc.bounds(boundary=1)[0])
+        assert_allclose(max_b[i], pc.bounds(boundary=1)[1])
+        assert_allclose(batch.range()[i], pc.range())
+        assert_allclose(batch.norm()[i], pc.norm())
+
+
+def test_pointcloudbatch_distance_to():
+    batch = PointCloudBatch(points)
+    other = PointCloud(np.random.rand(7, 2))
+    distances = batch.distance_to(other)
+    assert distances.shape == (5, 10, 7)
+    for i, pc in enumerate(pointclouds):
+        assert_allclose(distances[i], pc.distance_to(other))
+
+
+@raises(ValueError)
+def test_pointcloudbatch_distance_to_dims_raises():
+    PointCloudBatch(points).distance_to(PointCloud(np.random.rand(7, 3)))
+
+
+def test_pointcloudbatch_transform():
+    batch = PointCloudBatch(points)
+    t = Translation([1, 2])
+    transformed = batch.transform(t)
+    for i, pc in enumerate(pointclouds):
+        assert_allclose(transformed.points[i], t.apply(pc).points)
+    transforms = [UniformScale(i + 1., 2) for i in range(5)]
+    transformed = batch.transform(
+        HomogeneousBatch.init_from_transforms(transforms))
+    for i, (t, pc) in enumerate(zip(transforms, pointclouds)):
+        assert_allclose(transformed.points[i], t.apply(pc).points)
+
+
+def test_pointcloudbatch_vector_round_trip():
+    batch = PointCloudBatch(points)
+    vectors = batch.as_vector()
+    for v, pc in zip(vectors, pointclouds):
+        assert_equal(v, pc.as_vector())
+    assert_equal(batch.from_vector(vectors).points, batch.points)
+
+
+def test_pointcloudbatch_as_matrix_and_mean():
+    batch = PointCloudBatch(points)
+    data, template = as_matrix(batch, return_template=True)
+    assert_equal(data, as_matrix(pointclouds))
+    # the data matrix and template do not share memory with the batch
+    data[0] = 0
+    template.points[0] = 0
+    assert_equal(batch.points, points)
+    assert_allclose(mean_pointcloud(batch).points,
+                    mean_pointcloud(pointclouds).points)
+
+
+def test_pointcloudbatch_pca_model():
+    batch = PointCloudBatch(points)
+    model = PCAModel(batch)
+    expected = PCAModel(pointclouds)
+    assert_allclose(model.mean().points, expected.mean().points)
+    assert_allclose(np.abs(model.components), np.abs(expected.components))
+    assert_equal(batch.points, points)
+
+
+def test_pointcloudbatch_generalized_procrustes():
+    batch = PointCloudBatch(points)
+    assert_allclose(generalized_procrustes(batch)[0],
+                    generalized_procrustes(points)[0])
+
+
+@raises(ValueError)
+def test_pointcloudbatch_not_3d_raises():
+    PointCloudBatch(np.random.rand(10, 2))
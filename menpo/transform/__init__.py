@@ -3,7 +3,8 @@ from .homogeneous import *
 from .thinplatesplines import ThinPlateSplines
 from .piecewiseaffine import PiecewiseAffine
 from .rbf import R2LogR2RBF, R2LogRRBF
-from .groupalign.procrustes import GeneralizedProcrustesAnalysis
+from .groupalign.procrustes import (GeneralizedProcrustesAnalysis,
+                                   generalized_procrustes)
 from .compositions import (scale_about_centre, rotate_ccw_about_centre,
                            shear_about_centre, transform_about_centre)
 from .tcoords import image_coords_to_tcoords, tcoords_to_image_coords
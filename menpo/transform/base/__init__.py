@@ -141,7 +141,7 @@ class Transform(Copyable):
             raise ValueError('apply_inplace can only be used on Transformable'
                              ' objects.')
 
-    def apply(self, x, batch_size=None, **kwargs):
+    def apply(self, x, batch_size=None, out=None, **kwargs):
         r"""
         Applies this transform to ``x``.
 
@@ -164,6 +164,12 @@ class Transform(Copyable):
             array will be passed through the transform at a time. This is
             useful for operations that require large intermediate matrices
             to be computed.
+        out : ``(n_points, n_dims_output)`` `ndarray`, optional
+            If provided, the result is written into this array, which is
+            returned. Only valid if ``x`` is an `ndarray`. Transforms that
+            support it (e.g. :map:`Homogeneous`) avoid allocating any
+            intermediate arrays, which helps when repeatedly transforming
+            points in a tight loop.
         kwargs : `dict`
             Passed through to :meth:`_apply`.
 
@@ -171,6 +177,11 @@ class Transform(Copyable):
         -------
         transformed : ``type(x)``
             The transformed object or array
+
+        Raises
+        ------
+        ValueError
+            If ``out`` is provided and ``x`` is not an `ndarray`.
         """
 
         def transform(x_):
@@ -180,14 +191,42 @@ class Transform(Copyable):
             """
             return self._apply_batched(x_, batch_size, **kwargs)
 
+        if out is not None:
+            if not isinstance(x, np.ndarray):
+                raise ValueError('out can only be provided when applying a '
+                                 'transform to an ndarray.')
+            result = self._apply_batched(x, batch_size, out=out, **kwargs)
+            if result is not out:
+                # Subclasses overriding _apply_batched may not support out
+                out[...] = result
+            return out
         try:
             return x._transform(transform)
         except AttributeError:
             return self._apply_batched(x, batch_size, **kwargs)
 
-    def _apply_batched(self, x, batch_size, **kwargs):
+    def _apply_out(self, x, out, **kwargs):
+        r"""
+        Calls :meth:`_apply`, making sure the result ends up in ``out``
+        whether or not the subclass writes into it natively.
+        """
+        result = self._apply(x, out=out, **kwargs)
+        if result is not out:
+            out[...] = result
+        return out
+
+    def _apply_batched(self, x, batch_size, out=None, **kwargs):
         if batch_size is None:
-            return self._apply(x, **kwargs)
+            if out is None:
+                return self._apply(x, **kwargs)
+            return self._apply_out(x, out, **kwargs)
+        elif out is not None:
+            n_points = x.shape[0]
+            for lo_ind in range(0, n_points, batch_size):
+                hi_ind = lo_ind + batch_size
+                self._apply_out(x[lo_ind:hi_ind], out[lo_ind:hi_ind],
+                                **kwargs)
+            return out
         else:
             outputs = []
             n_points = x.shape[0]
@@ -296,3 +335,4 @@ class Transformable(Copyable):
 from .alignment import Alignment
 from .composable import TransformChain, ComposableTransform, VComposable
 from .invertible import Invertible, VInvertible
+from .differentiable import DP, DX
@@ -2,6 +2,12 @@ from menpo.transform.base import Transform
 from functools import reduce
 
 
+# collapsing a run of homogeneous transforms has a fixed cost (a matrix
+# product and a new transform per step), which only pays off once the
+# intermediate arrays it avoids are large enough
+_COLLAPSE_MIN_POINTS = 5000
+
+
 class ComposableTransform(Transform):
     r"""
     :map:`Transform` subclass that enables native composition, such that the
@@ -274,10 +280,60 @@ class TransformChain(ComposableTransform):
         # TODO Should TransformChain copy on input?
         self.transforms = transforms
 
+    def collapse(self):
+        r"""
+        Returns an equivalent transform in which every run of adjacent
+        :map:`Homogeneous` transforms of the chain is composed into a single
+        :map:`Homogeneous` transform. If the whole chain is homogeneous, a
+        single :map:`Homogeneous` transform is returned, otherwise a new
+        :map:`TransformChain`.
+
+        The transforms of the chain are not modified, so the collapsed
+        transform will not reflect any later changes to them.
+
+        Returns
+        -------
+        transform : :map:`Homogeneous` or :map:`TransformChain`
+            The collapsed transform.
+        """
+        transforms = self._collapsed_transforms()
+        if len(transforms) == 1:
+            return transforms[0]
+        return TransformChain(transforms)
+
+    def _collapsed_transforms(self):
+        from menpo.transform.homogeneous import Homogeneous
+        transforms = []
+        for t in self.transforms:
+            if (transforms and isinstance(t, Homogeneous) and
+                    isinstance(transforms[-1], Homogeneous)):
+                # compose_before always returns a new transform, so the
+                # transforms of the chain are left untouched
+                transforms[-1] = transforms[-1].compose_before(t)
+            else:
+                transforms.append(t)
+        return transforms
+
+    def _has_homogeneous_run(self):
+        from menpo.transform.homogeneous import Homogeneous
+        previous_is_homogeneous = False
+        for t in self.transforms:
+            is_homogeneous = isinstance(t, Homogeneous)
+            if is_homogeneous and previous_is_homogeneous:
+                return True
+            previous_is_homogeneous = is_homogeneous
+        return False
+
     def _apply(self, x, **kwargs):
         r"""
         Applies each of the transforms to the array ``x``, in order.
 
+        For large arrays, runs of adjacent :map:`Homogeneous` transforms are
+        first composed into a single matrix (see :meth:`collapse`), so they
+        are applied in one pass without any intermediate arrays. This is done
+        on every application, so changes to the transforms are always
+        respected.
+
         Parameters
         ----------
         x : ``(n_points, n_dims)`` `ndarray`
@@ -288,7 +344,11 @@ class TransformChain(ComposableTransform):
         transformed : ``(n_points, n_dims_output)`` `ndarray`
             Transformed array having passed through the chain of transforms.
         """
-        return reduce(lambda x_i, tr: tr._apply(x_i), self.transforms, x)
+        transforms = self.transforms
+        if (self._has_homogeneous_run() and
+                x.shape[0] >= _COLLAPSE_MIN_POINTS):
+            transforms = self._collapsed_transforms()
+        return reduce(lambda x_i, tr: tr._apply(x_i), transforms, x)
 
     @property
     def composes_inplace_with(self):
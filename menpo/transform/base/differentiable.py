@@ -0,0 +1,56 @@
+class DP(object):
+    r"""
+    Mix-in for transforms that can take their own derivative with respect to
+    their parameters.
+
+    For :map:`Vectorizable` transforms the parameters are those of
+    :meth:`as_vector`. For :map:`Alignment` transforms that are not
+    :map:`Vectorizable` (such as :map:`PiecewiseAffine` and
+    :map:`ThinPlateSplines`), the parameters are the flattened target points,
+    in the order of ``target.as_vector()``.
+    """
+
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameters,
+        evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_parameters, n_dims_output)`` `ndarray`
+            ``d_dp[k, p, i]`` is the derivative of the ``i``'th coordinate of
+            the transformed ``k``'th point with respect to the ``p``'th
+            parameter.
+        """
+        raise NotImplementedError()
+
+
+class DX(object):
+    r"""
+    Mix-in for transforms that can take their own derivative with respect to
+    the points they are applied to (their spatial Jacobian).
+    """
+
+    def d_dx(self, points):
+        r"""
+        The derivative of this transform with respect to the input points,
+        evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, n_dims_output, n_dims)`` `ndarray`
+            ``d_dx[k, i, j]`` is the derivative of the ``i``'th coordinate of
+            the transformed ``k``'th point with respect to its ``j``'th
+            coordinate.
+        """
+        raise NotImplementedError()
@@ -1,13 +1,77 @@
 import numpy as np
 
-from ..homogeneous import AlignmentSimilarity
+from ..homogeneous import (AlignmentSimilarity, Similarity,
+                           HomogeneousBatch)
+from ..homogeneous.batch import _procrustes_h_matrices, _as_points_stack
 from .base import MultipleAlignment
 
 
-avoid_circular = None      # to avoid circular imports
-mean_pointcloud = None     # to avoid circular imports
-PointCloud = None          # to avoid circular imports
-scale_about_centre = None  # to avoid circular imports
+def generalized_procrustes(sources, target=None, allow_mirror=False,
+                           max_iterations=100, tolerance=1e-6):
+    r"""
+    Generalized Procrustes Analysis of a stack of shapes.
+
+    Each shape is aligned to the target with a similarity transform, then the
+    target is replaced by the mean of the aligned shapes (rescaled to the
+    size of the initial target) until the target moves less than
+    ``tolerance``. Each iteration estimates all the alignments at once with
+    a batched SVD.
+
+    Parameters
+    ----------
+    sources : ``(n_sources, n_points, n_dims)`` `ndarray` or :map:`PointCloudBatch`
+        The shapes to align.
+    target : ``(n_points, n_dims)`` `ndarray` or :map:`PointCloud`, optional
+        The initial target. If ``None``, the mean of the sources is used.
+    allow_mirror : `bool`, optional
+        If ``True``, the Kabsch algorithm check is not performed, and mirroring
+        of the rotation matrices is permitted.
+    max_iterations : `int`, optional
+        The maximum number of iterations.
+    tolerance : `float`, optional
+        Convergence is reached when the Frobenius norm of the change of the
+        target is smaller than this.
+
+    Returns
+    -------
+    h_matrices : ``(n_sources, n_dims + 1, n_dims + 1)`` `ndarray`
+        The homogeneous matrices of the similarity transforms aligning each
+        source to the final target.
+    target : ``(n_points, n_dims)`` `ndarray`
+        The final target.
+    n_iterations : `int`
+        The number of iterations performed.
+    converged : `bool`
+        Whether the target converged within ``max_iterations``.
+    """
+    sources = _as_points_stack(sources)
+    if target is None:
+        target = sources.mean(axis=0)
+    else:
+        target = _as_points_stack(target)
+    h_matrices = _procrustes_h_matrices(sources, target,
+                                        allow_mirror=allow_mirror)
+    initial_target_scale = np.linalg.norm(target - target.mean(axis=0))
+    aligned = np.empty(sources.shape)
+    n_iterations = 1
+    while n_iterations <= max_iterations:
+        batch = HomogeneousBatch(h_matrices, transform_cls=Similarity,
+                                 copy=False, skip_checks=True)
+        new_target = batch.apply(sources, out=aligned).mean(axis=0)
+        # rescale the new target to be the same size as the original about
+        # its centre
+        centre = new_target.mean(axis=0)
+        new_target -= centre
+        new_target *= initial_target_scale / np.linalg.norm(new_target)
+        new_target += centre
+        # check to see if we have converged yet
+        if np.linalg.norm(target - new_target) < tolerance:
+            return h_matrices, target, n_iterations, True
+        n_iterations += 1
+        h_matrices = _procrustes_h_matrices(sources, new_target,
+                                            allow_mirror=allow_mirror)
+        target = new_target
+    return h_matrices, target, n_iterations, False
 
 
 class GeneralizedProcrustesAnalysis(MultipleAlignment):
@@ -17,6 +81,9 @@ class GeneralizedProcrustesAnalysis(MultipleAlignment):
     After construction, the :map:`AlignmentSimilarity` transforms used to map
     each `source` optimally to the `target` can be found at `transforms`.
 
+    The alignment itself is performed by :func:`generalized_procrustes` on
+    all the sources at once.
+
     Parameters
     ----------
     sources : `list` of :map:`PointCloud`
@@ -34,50 +101,26 @@ class GeneralizedProcrustesAnalysis(MultipleAlignment):
         Need at least two sources to align
     """
     def __init__(self, sources, target=None, allow_mirror=False):
+        from menpo.shape import PointCloud
         super(GeneralizedProcrustesAnalysis, self).__init__(sources,
                                                             target=target)
         initial_target = self.target
-        self.transforms = [AlignmentSimilarity(source, self.target,
-                                               allow_mirror=allow_mirror)
-                           for source in self.sources]
         self.initial_target_scale = self.target.norm()
-        self.n_iterations = 1
         self.max_iterations = 100
-        self.converged = self._recursive_procrustes()
+        h_matrices, final_target, self.n_iterations, self.converged = \
+            generalized_procrustes(np.array([s.points for s in self.sources]),
+                                   target=self.target.points,
+                                   allow_mirror=allow_mirror,
+                                   max_iterations=self.max_iterations)
+        if final_target is not initial_target.points:
+            self.target = PointCloud(final_target, copy=False)
+        self.transforms = [AlignmentSimilarity(source, self.target,
+                                               allow_mirror=allow_mirror,
+                                               h_matrix=h)
+                           for source, h in zip(self.sources, h_matrices)]
         if target is not None:
             self.target = initial_target
 
-    def _recursive_procrustes(self):
-        r"""
-        Recursively calculates a procrustes alignment.
-        """
-        global mean_pointcloud, PointCloud, scale_about_centre, avoid_circular
-        if avoid_circular is None:
-            from menpo.shape import mean_pointcloud, PointCloud
-            from ..compositions import scale_about_centre
-            avoid_circular = True
-
-        if self.n_iterations > self.max_iterations:
-            return False
-        new_tgt = mean_pointcloud([PointCloud(t.aligned_source().points,
-                                              copy=False)
-                                   for t in self.transforms])
-        # rescale the new_target to be the same size as the original about
-        # it's centre
-        rescale = scale_about_centre(new_tgt,
-                                     self.initial_target_scale / new_tgt.norm())
-        rescale._apply_inplace(new_tgt)
-        # check to see if we have converged yet
-        delta_target = np.linalg.norm(self.target.points - new_tgt.points)
-        if delta_target < 1e-6:
-            return True
-        else:
-            self.n_iterations += 1
-            for t in self.transforms:
-                t.set_target(new_tgt)
-            self.target = new_tgt
-            return self._recursive_procrustes()
-
     def mean_aligned_shape(self):
         r"""
         Returns the mean of the aligned shapes.
@@ -94,8 +137,11 @@ class GeneralizedProcrustesAnalysis(MultipleAlignment):
 
         :type: `float`
         """
-        return sum([t.alignment_error() for t in
-                    self.transforms])/self.n_sources
+        batch = HomogeneousBatch.init_from_transforms(self.transforms)
+        aligned = batch.apply(np.array([s.points for s in self.sources]))
+        targets = np.array([t.target.points for t in self.transforms])
+        errors = np.sqrt(np.sum((targets - aligned) ** 2, axis=(1, 2)))
+        return np.sum(errors) / self.n_sources
 
     def __str__(self):
         if self.converged:
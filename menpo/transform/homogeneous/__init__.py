@@ -4,3 +4,4 @@ from .similarity import Similarity, AlignmentSimilarity
 from .rotation import Rotation, AlignmentRotation
 from .translation import Translation, AlignmentTranslation
 from .scale import Scale, NonUniformScale, UniformScale, AlignmentUniformScale
+from .batch import HomogeneousBatch
@@ -1,6 +1,6 @@
 import numpy as np
 
-from .base import Homogeneous, HomogFamilyAlignment
+from .base import Homogeneous, HomogFamilyAlignment, _apply_affine
 from functools import reduce
 
 
@@ -169,7 +169,7 @@ class Affine(Homogeneous):
         list_str = [t._transform_str() for t in self.decompose()]
         return header + reduce(lambda x, y: x + '\n' + '  ' + y, list_str, '  ')
 
-    def _apply(self, x, **kwargs):
+    def _apply(self, x, out=None, **kwargs):
         r"""
         Applies this transform to a new set of vectors.
 
@@ -177,13 +177,15 @@ class Affine(Homogeneous):
         ----------
         x : ``(N, D)`` `ndarray`
             Array to apply this transform to.
+        out : ``(N, D)`` `ndarray`, optional
+            If provided, the result is written into this array.
 
         Returns
         -------
         transformed_x : ``(N, D)`` `ndarray`
-            The transformed array.
+            The transformed array (``out`` if provided).
         """
-        return np.dot(x, self.linear_component.T) + self.translation_component
+        return _apply_affine(x, self.h_matrix, out=out)
 
     @property
     def n_parameters(self):
@@ -257,6 +259,48 @@ class Affine(Homogeneous):
                        "homogeneous matrices are supported.")
         self._set_h_matrix(h_matrix, copy=False, skip_checks=True)
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameters (see
+        :meth:`as_vector`), evaluated at ``points``. As the transform is
+        linear in its parameters this does not depend on them.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_parameters, n_dims)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            parameter.
+        """
+        n_points, n_dims = points.shape
+        h_x = np.hstack([points, np.ones([n_points, 1])])
+        # parameters are in Fortran order - the column of the h_matrix first
+        d_dp = np.zeros((n_points, n_dims + 1, n_dims, n_dims))
+        for i in range(n_dims):
+            d_dp[:, :, i, i] = h_x
+        return d_dp.reshape([n_points, -1, n_dims])
+
+    def d_dx(self, points):
+        r"""
+        The derivative of this transform with respect to the input points,
+        which is the linear component at every point.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, n_dims, n_dims)`` `ndarray`
+            The Jacobian of the transform at each point.
+        """
+        return np.repeat(self.linear_component[None], points.shape[0], axis=0)
+
     @property
     def composes_inplace_with(self):
         r"""
@@ -298,25 +342,35 @@ class AlignmentAffine(HomogFamilyAlignment, Affine):
     def __init__(self, source, target):
         # first, initialize the alignment
         HomogFamilyAlignment.__init__(self, source, target)
+        self._source_projector = None
         # now, the Affine
-        optimal_h = self._build_alignment_h_matrix(source, target)
+        optimal_h = self._build_alignment_h_matrix()
         Affine.__init__(self, optimal_h, copy=False, skip_checks=True)
 
-    @staticmethod
-    def _build_alignment_h_matrix(source, target):
+    def __setstate__(self, state):
+        # older versions of menpo did not store the source projector
+        state.setdefault('_source_projector', None)
+        self.__dict__.update(state)
+
+    def _build_alignment_h_matrix(self):
         r"""
-        Returns the optimal alignment of `source` to `target`.
+        Returns the optimal alignment of the source to the current target.
 
-        Parameters
-        ----------
-        source : :map:`PointCloud`
-            The source pointcloud instance used in the alignment
-        target : :map:`PointCloud`
-            The target pointcloud instance used in the alignment
+        The least squares projector ``(a a')^-1 a`` only depends on the source,
+        so it is computed once (and again only if the source changes, e.g.
+        after :meth:`pseudoinverse`). Updating the target is then a single
+        product with the target points.
         """
-        a = source.h_points()
-        b = target.h_points()
-        return np.linalg.solve(np.dot(a, a.T), np.dot(a, b.T)).T
+        projector = self._source_projector
+        if projector is None or projector[0] is not self.source:
+            a = self.source.h_points()
+            projector = (self.source, np.linalg.solve(a.dot(a.T), a))
+            self._source_projector = projector
+        n_dims = self.source.n_dims
+        h_matrix = np.zeros((n_dims + 1, n_dims + 1))
+        h_matrix[:n_dims] = projector[1].dot(self.target.points).T
+        h_matrix[n_dims, n_dims] = 1
+        return h_matrix
 
     def _set_h_matrix(self, value, copy=True, skip_checks=False):
         r"""
@@ -352,7 +406,7 @@ class AlignmentAffine(HomogFamilyAlignment, Affine):
         self._sync_target_from_state()
 
     def _sync_state_from_target(self):
-        optimal_h = self._build_alignment_h_matrix(self.source, self.target)
+        optimal_h = self._build_alignment_h_matrix()
         # Use the pure Affine setter (so we don't get syncing)
         # We know the resulting affine is correct so skip the checks
         Affine._set_h_matrix(self, optimal_h, copy=False, skip_checks=True)
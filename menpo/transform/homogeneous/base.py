@@ -4,7 +4,67 @@ import numpy as np
 
 from menpo.base import Vectorizable, MenpoDeprecationWarning
 from menpo.transform.base import (Alignment, ComposableTransform,
-                                  VComposable, VInvertible)
+                                  VComposable, VInvertible, DP, DX)
+
+
+def _write_out(result, out):
+    r"""
+    Copy ``result`` into ``out`` (if provided) and return whichever holds the
+    final result.
+    """
+    if out is None:
+        return result
+    out[...] = result
+    return out
+
+
+def _can_write_directly(x, matrix, out):
+    # BLAS backed products can only write into a C contiguous buffer of the
+    # exact result type that doesn't overlap the input
+    return (out is not None and
+            out.dtype == np.result_type(x, matrix) and
+            out.flags.c_contiguous and not np.may_share_memory(x, out))
+
+
+def _apply_affine(x, h_matrix, out=None):
+    r"""
+    Apply the affine homogeneous matrix ``h_matrix`` to the points ``x`` as
+    ``x @ A.T + b``, without forming homogeneous coordinates. If ``out`` is
+    provided the result is written into it, normally without allocating any
+    temporaries.
+    """
+    linear = h_matrix[:-1, :-1]
+    if _can_write_directly(x, linear, out):
+        np.dot(x, linear.T, out=out)
+    else:
+        out = _write_out(np.dot(x, linear.T), out)
+    out += h_matrix[:-1, -1]
+    return out
+
+
+def _apply_projective(x, h_matrix, out=None):
+    r"""
+    Apply the (general) homogeneous matrix ``h_matrix`` to the points ``x``,
+    re-normalizing by the homogeneous coordinate.
+    """
+    # x @ h[:, :-1].T + h[:, -1] is the same as appending a column of ones
+    # to x and multiplying by the full h_matrix, without the copy
+    h_y = np.dot(x, h_matrix[:, :-1].T)
+    h_y += h_matrix[:, -1]
+    if out is None:
+        out = np.empty((h_y.shape[0], h_y.shape[1] - 1),
+                       dtype=h_y.dtype)
+    np.divide(h_y[:, :-1], h_y[:, -1:], out=out)
+    return out
+
+
+def _is_affine(h_matrix):
+    r"""
+    ``True`` if the last row of ``h_matrix`` is ``[0, ..., 0, 1]``, in which
+    case the homogeneous divide is redundant.
+    """
+    last_row = h_matrix[-1]
+    return last_row[-1] == 1 and not np.any(last_row[:-1])
 
 
 class HomogFamilyAlignment(Alignment):
@@ -61,7 +121,8 @@ class HomogFamilyAlignment(Alignment):
         return selfcopy
 
 
-class Homogeneous(ComposableTransform, Vectorizable, VComposable, VInvertible):
+class Homogeneous(ComposableTransform, Vectorizable, VComposable, VInvertible,
+                  DP, DX):
     r"""
     A simple ``n``-dimensional homogeneous transformation.
 
@@ -250,17 +311,85 @@ class Homogeneous(ComposableTransform, Vectorizable, VComposable, VInvertible):
         # doesn't have to be a square homogeneous matrix...
         return self.h_matrix.shape[0] - 1
 
-    def _apply(self, x, **kwargs):
-        # convert to homogeneous
-        h_x = np.hstack([x, np.ones([x.shape[0], 1])])
-        # apply the transform
-        h_y = h_x.dot(self.h_matrix.T)
-        # normalize and return
-        return (h_y / h_y[:, -1][:, None])[:, :-1]
+    def _apply(self, x, out=None, **kwargs):
+        r"""
+        Applies this transform to a new set of vectors.
+
+        If the homogeneous matrix is affine (the last row is
+        ``[0, ..., 0, 1]``) the normalization by the homogeneous coordinate
+        is skipped.
+
+        Parameters
+        ----------
+        x : ``(N, D)`` `ndarray`
+            Array to apply this transform to.
+        out : ``(N, n_dims_output)`` `ndarray`, optional
+            If provided, the result is written into this array.
+
+        Returns
+        -------
+        transformed_x : ``(N, n_dims_output)`` `ndarray`
+            The transformed array (``out`` if provided).
+        """
+        if _is_affine(self.h_matrix):
+            return _apply_affine(x, self.h_matrix, out=out)
+        return _apply_projective(x, self.h_matrix, out=out)
 
     def _as_vector(self):
         return self.h_matrix.ravel()
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to each element of the
+        ``h_matrix`` (in the order of :meth:`as_vector`), evaluated at
+        ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_parameters, n_dims_output)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            parameter.
+        """
+        n_points = points.shape[0]
+        n_out = self.n_dims_output
+        h_x = np.hstack([points, np.ones([n_points, 1])])
+        w = h_x.dot(self.h_matrix[-1])
+        h_x_over_w = h_x / w[:, None]
+        d_dp = np.zeros((n_points, n_out + 1, self.n_dims + 1, n_out))
+        # each output coordinate only depends on its own row...
+        for i in range(n_out):
+            d_dp[:, i, :, i] = h_x_over_w
+        # ...and on the last row through the homogeneous divide
+        d_dp[:, n_out] = -h_x_over_w[..., None] * self._apply(points)[:, None]
+        return d_dp.reshape([n_points, -1, n_out])
+
+    def d_dx(self, points):
+        r"""
+        The derivative of this transform with respect to the input points,
+        evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, n_dims_output, n_dims)`` `ndarray`
+            The Jacobian of the transform at each point.
+        """
+        h = self.h_matrix
+        w = np.dot(points, h[-1, :-1]) + h[-1, -1]
+        y = self._apply(points)
+        d_dx = h[None, :-1, :-1] - y[..., None] * h[-1, :-1]
+        d_dx /= w[:, None, None]
+        return d_dx
+
     def _from_vector_inplace(self, vector):
         """
         Update the state of this object from a vector form.
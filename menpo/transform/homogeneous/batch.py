@@ -0,0 +1,425 @@
+import numpy as np
+
+from menpo.base import Copyable
+from .base import Homogeneous
+from .affine import Affine
+from .similarity import Similarity
+
+
+def _as_points_stack(x):
+    r"""
+    Convert a `list` of :map:`PointCloud` (or an `ndarray`) to a single
+    ``(N, n_points, n_dims)`` (or ``(n_points, n_dims)``) `ndarray`.
+    """
+    if isinstance(x, np.ndarray):
+        return x
+    if hasattr(x, 'points'):
+        return x.points
+    return np.array([getattr(p, 'points', p) for p in x])
+
+
+def _common_transform_cls(a, b):
+    r"""
+    The most specialised class of :map:`Homogeneous`, :map:`Affine` and
+    :map:`Similarity` that both ``a`` and ``b`` belong to.
+    """
+    for cls in (Similarity, Affine):
+        if issubclass(a, cls) and issubclass(b, cls):
+            return cls
+    return Homogeneous
+
+
+def _procrustes_h_matrices(sources, targets, rotation=True,
+                           allow_mirror=False):
+    r"""
+    The ``(N, n_dims + 1, n_dims + 1)`` homogeneous matrices of the similarity
+    transforms that optimally align each of the ``(N, n_points, n_dims)``
+    ``sources`` to the corresponding ``targets``. ``targets`` may also be a
+    single ``(n_points, n_dims)`` array that all sources are aligned to.
+    Exactly equivalent to calling :func:`procrustes_alignment` on each pair.
+    """
+    n_sources, _, n_dims = sources.shape
+    src_centres = sources.mean(axis=-2)
+    tgt_centres = targets.mean(axis=-2)
+    centred_src = sources - src_centres[:, None, :]
+    centred_tgt = targets - tgt_centres[..., None, :]
+    src_norms = np.sqrt(np.einsum('nij,nij->n', centred_src, centred_src))
+    tgt_norms = np.sqrt(np.einsum('...ij,...ij->...', centred_tgt,
+                                  centred_tgt))
+    scales = tgt_norms / src_norms
+
+    if rotation:
+        # The scale is positive so doesn't change the optimal rotation -
+        # one SVD of all the correlation matrices at once
+        tgt_subscripts = 'ki' if centred_tgt.ndim == 2 else 'nki'
+        correlation = np.einsum(tgt_subscripts + ',nkj->nij', centred_tgt,
+                                centred_src)
+        U, _, Vt = np.linalg.svd(correlation)
+        R = np.matmul(U, Vt)
+        if not allow_mirror:
+            # Kabsch check - flip the last singular vector of any reflections
+            mirrored = np.linalg.det(R) < 0
+            if np.any(mirrored):
+                U[mirrored, :, -1] *= -1
+                R[mirrored] = np.matmul(U[mirrored], Vt[mirrored])
+        linear = R * scales[:, None, None]
+    else:
+        linear = np.eye(n_dims)[None] * scales[:, None, None]
+
+    h_matrices = np.zeros((n_sources, n_dims + 1, n_dims + 1))
+    h_matrices[:, :n_dims, :n_dims] = linear
+    h_matrices[:, :n_dims, n_dims] = tgt_centres - np.einsum(
+        'nij,nj->ni', linear, src_centres)
+    h_matrices[:, n_dims, n_dims] = 1
+    return h_matrices
+
+
+class HomogeneousBatch(Copyable):
+    r"""
+    A batch of ``N`` homogeneous transforms of the same dimensionality, stored
+    as a single ``(N, n_dims + 1, n_dims + 1)`` stack of homogeneous matrices.
+
+    All operations (:meth:`apply`, composition, :meth:`pseudoinverse`,
+    vectorization) are performed on the whole stack at once, which is much
+    faster than looping over ``N`` individual :map:`Homogeneous` transforms.
+    Indexing the batch returns the individual transforms.
+
+    Parameters
+    ----------
+    h_matrices : ``(N, n_dims + 1, n_dims + 1)`` `ndarray`
+        The homogeneous matrices of the transforms.
+    transform_cls : {:map:`Homogeneous`, :map:`Affine`, :map:`Similarity`}, optional
+        The family all the transforms of the batch belong to. Determines
+        the type of the individual transforms and the parametrisation used
+        by :meth:`as_vector` and :meth:`from_vector`.
+    copy : `bool`, optional
+        If ``False``, avoid copying ``h_matrices``. Useful for performance.
+    skip_checks : `bool`, optional
+        If ``True``, avoid sanity checks on ``h_matrices``. Useful for
+        performance.
+
+    Raises
+    ------
+    ValueError
+        If ``h_matrices`` is not a stack of square matrices.
+    """
+    def __init__(self, h_matrices, transform_cls=Homogeneous, copy=True,
+                 skip_checks=False):
+        if not skip_checks:
+            h_matrices = np.asarray(h_matrices)
+            if h_matrices.ndim != 3 or (h_matrices.shape[1] !=
+                                        h_matrices.shape[2]):
+                raise ValueError('h_matrices must be a (N, n_dims + 1, '
+                                 'n_dims + 1) stack of square matrices.')
+            if transform_cls not in (Homogeneous, Affine, Similarity):
+                raise ValueError('transform_cls must be one of Homogeneous, '
+                                 'Affine or Similarity.')
+        if copy:
+            h_matrices = h_matrices.copy()
+        self._h_matrices = h_matrices
+        self.transform_cls = transform_cls
+
+    @classmethod
+    def init_identity(cls, n_transforms, n_dims, transform_cls=Homogeneous):
+        r"""
+        Creates a batch of identity transforms.
+
+        Parameters
+        ----------
+        n_transforms : `int`
+            The number of transforms in the batch.
+        n_dims : `int`
+            The number of dimensions.
+        transform_cls : {:map:`Homogeneous`, :map:`Affine`, :map:`Similarity`}, optional
+            The family of the transforms.
+
+        Returns
+        -------
+        identity : :map:`HomogeneousBatch`
+            The batch of identity transforms.
+        """
+        h_matrices = np.tile(np.eye(n_dims + 1), (n_transforms, 1, 1))
+        return cls(h_matrices, transform_cls=transform_cls, copy=False,
+                   skip_checks=True)
+
+    @classmethod
+    def init_from_transforms(cls, transforms):
+        r"""
+        Stacks a `list` of :map:`Homogeneous` transforms into a batch. The
+        family of the batch is the most specialised one that all the
+        transforms belong to.
+
+        Parameters
+        ----------
+        transforms : `list` of :map:`Homogeneous`
+            The transforms to stack. They must have the same dimensionality.
+
+        Returns
+        -------
+        batch : :map:`HomogeneousBatch`
+            The batch of transforms.
+        """
+        transform_cls = Similarity
+        for t in transforms:
+            transform_cls = _common_transform_cls(transform_cls, type(t))
+        h_matrices = np.array([t.h_matrix for t in transforms])
+        return cls(h_matrices, transform_cls=transform_cls, copy=False)
+
+    @classmethod
+    def init_procrustes_alignment(cls, sources, targets, rotation=True,
+                                  allow_mirror=False):
+        r"""
+        Estimates the similarity transforms that optimally align each source
+        to its target, all at once. This gives the same transforms as
+        :map:`AlignmentSimilarity` (without the alignment behaviour), but
+        with a single batched SVD rather than ``N`` separate ones.
+
+        Parameters
+        ----------
+        sources : ``(N, n_points, n_dims)`` `ndarray` or `list` of :map:`PointCloud`
+            The source shapes.
+        targets : ``(N, n_points, n_dims)`` or ``(n_points, n_dims)`` `ndarray`, :map:`PointCloud` or `list` of :map:`PointCloud`
+            The target shapes. A single target is shared by all the sources.
+        rotation : `bool`, optional
+            If ``False``, only scale and translation effects are estimated.
+        allow_mirror : `bool`, optional
+            If ``True``, the Kabsch algorithm check is not performed, and
+            mirroring of the rotation matrices is permitted.
+
+        Returns
+        -------
+        batch : :map:`HomogeneousBatch`
+            The batch of :map:`Similarity` transforms.
+        """
+        h_matrices = _procrustes_h_matrices(_as_points_stack(sources),
+                                            _as_points_stack(targets),
+                                            rotation=rotation,
+                                            allow_mirror=allow_mirror)
+        return cls(h_matrices, transform_cls=Similarity, copy=False,
+                   skip_checks=True)
+
+    @property
+    def h_matrices(self):
+        r"""
+        The homogeneous matrices of the transforms.
+
+        :type: ``(N, n_dims + 1, n_dims + 1)`` `ndarray`
+        """
+        return self._h_matrices
+
+    @property
+    def n_transforms(self):
+        r"""
+        The number of transforms in the batch.
+
+        :type: `int`
+        """
+        return self._h_matrices.shape[0]
+
+    @property
+    def n_dims(self):
+        r"""
+        The dimensionality of the data the transforms operate on.
+
+        :type: `int`
+        """
+        return self._h_matrices.shape[2] - 1
+
+    def __len__(self):
+        return self.n_transforms
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or not np.isscalar(index):
+            return HomogeneousBatch(self._h_matrices[index],
+                                    transform_cls=self.transform_cls,
+                                    copy=False, skip_checks=True)
+        return self.transform_cls(self._h_matrices[index], copy=True,
+                                  skip_checks=True)
+
+    def __iter__(self):
+        for i in range(self.n_transforms):
+            yield self[i]
+
+    def __str__(self):
+        return '{} {}D {} transforms'.format(self.n_transforms, self.n_dims,
+                                             self.transform_cls.__name__)
+
+    def _is_affine(self):
+        last_rows = self._h_matrices[:, -1]
+        return (self.transform_cls is not Homogeneous or
+                (np.all(last_rows[:, -1] == 1) and
+                 not np.any(last_rows[:, :-1])))
+
+    def apply(self, x, out=None):
+        r"""
+        Applies every transform of the batch to its own set of points.
+
+        Parameters
+        ----------
+        x : ``(N, n_points, n_dims)`` or ``(n_points, n_dims)`` `ndarray` or `list` of :map:`PointCloud`
+            The points to transform. If a single set of points is provided,
+            every transform is applied to it.
+        out : ``(N, n_points, n_dims)`` `ndarray`, optional
+            If provided, the result is written into this array.
+
+        Returns
+        -------
+        transformed : ``(N, n_points, n_dims)`` `ndarray`
+            The transformed points (``out`` if provided).
+        """
+        x = _as_points_stack(x)
+        h = self._h_matrices
+        # x @ A.T + b, batched over the transforms
+        y = np.matmul(x, np.swapaxes(h[:, :-1, :-1], 1, 2))
+        y += h[:, None, :-1, -1]
+        if not self._is_affine():
+            w = np.matmul(x, h[:, -1, :-1, None])
+            w += h[:, None, -1, -1:]
+            y /= w
+        if out is None:
+            return y
+        out[...] = y
+        return out
+
+    def compose_before(self, transform):
+        r"""
+        Returns a batch of transforms that apply **these** transforms
+        followed by ``transform``.
+
+        Parameters
+        ----------
+        transform : :map:`HomogeneousBatch` or :map:`Homogeneous`
+            The transforms to be applied **after** self. A single
+            :map:`Homogeneous` is composed with every transform of the batch.
+
+        Returns
+        -------
+        composed : :map:`HomogeneousBatch`
+            The batch of composed transforms.
+        """
+        h_matrices = np.matmul(self._other_h_matrices(transform),
+                               self._h_matrices)
+        return self._composed(h_matrices, transform)
+
+    def compose_after(self, transform):
+        r"""
+        Returns a batch of transforms that apply ``transform`` followed by
+        **these** transforms.
+
+        Parameters
+        ----------
+        transform : :map:`HomogeneousBatch` or :map:`Homogeneous`
+            The transforms to be applied **before** self. A single
+            :map:`Homogeneous` is composed with every transform of the batch.
+
+        Returns
+        -------
+        composed : :map:`HomogeneousBatch`
+            The batch of composed transforms.
+        """
+        h_matrices = np.matmul(self._h_matrices,
+                               self._other_h_matrices(transform))
+        return self._composed(h_matrices, transform)
+
+    def _other_h_matrices(self, transform):
+        if isinstance(transform, HomogeneousBatch):
+            if transform.n_transforms != self.n_transforms:
+                raise ValueError('Cannot compose batches of {} and {} '
+                                 'transforms.'.format(self.n_transforms,
+                                                      transform.n_transforms))
+            return transform.h_matrices
+        return transform.h_matrix
+
+    def _composed(self, h_matrices, transform):
+        other_cls = getattr(transform, 'transform_cls', type(transform))
+        return HomogeneousBatch(
+            h_matrices,
+            transform_cls=_common_transform_cls(self.transform_cls,
+                                                other_cls),
+            copy=False, skip_checks=True)
+
+    def pseudoinverse(self):
+        r"""
+        The batch of the inverses of each transform.
+
+        Returns
+        -------
+        inverse : :map:`HomogeneousBatch`
+            The batch of inverse transforms.
+        """
+        if self.transform_cls is Homogeneous:
+            h_matrices = np.linalg.inv(self._h_matrices)
+        else:
+            # Invert only the linear components, the affine structure is
+            # known
+            d = self.n_dims
+            linear_inv = np.linalg.inv(self._h_matrices[:, :d, :d])
+            h_matrices = np.zeros_like(self._h_matrices)
+            h_matrices[:, :d, :d] = linear_inv
+            h_matrices[:, :d, d] = -np.einsum('nij,nj->ni', linear_inv,
+                                              self._h_matrices[:, :d, d])
+            h_matrices[:, d, d] = 1
+        return HomogeneousBatch(h_matrices, transform_cls=self.transform_cls,
+                                copy=False, skip_checks=True)
+
+    def as_vector(self):
+        r"""
+        The parameters of every transform, using the same parametrisation as
+        :meth:`as_vector` on the individual transforms of the batch.
+
+        Returns
+        -------
+        vectors : ``(N, n_parameters)`` `ndarray`
+            The parameters of each transform.
+        """
+        h = self._h_matrices
+        d = self.n_dims
+        if self.transform_cls is Homogeneous:
+            return h.reshape([self.n_transforms, -1]).copy()
+        params = h[:, :d, :] - np.eye(d + 1)[:d]
+        if self.transform_cls is Affine:
+            # Fortran ordering of each matrix, as Affine.as_vector
+            return params.transpose(0, 2, 1).reshape([self.n_transforms, -1])
+        if d != 2:
+            raise NotImplementedError('Only 2D Similarity transforms can be '
+                                      'vectorized.')
+        return np.stack([params[:, 0, 0], params[:, 1, 0],
+                         params[:, 0, 2], params[:, 1, 2]], axis=1)
+
+    def from_vector(self, vectors):
+        r"""
+        Build a new batch of the same family from parameters.
+
+        Parameters
+        ----------
+        vectors : ``(N, n_parameters)`` `ndarray`
+            The parameters of each transform, as returned by
+            :meth:`as_vector`.
+
+        Returns
+        -------
+        batch : :map:`HomogeneousBatch`
+            A new batch of transforms.
+        """
+        n = vectors.shape[0]
+        d = self.n_dims
+        if self.transform_cls is Homogeneous:
+            h_matrices = vectors.reshape([n, d + 1, d + 1]).copy()
+        else:
+            h_matrices = np.tile(np.eye(d + 1), (n, 1, 1))
+            if self.transform_cls is Affine:
+                h_matrices[:, :d, :] += vectors.reshape(
+                    [n, d + 1, d]).transpose(0, 2, 1)
+            elif d == 2:
+                a, b, tx, ty = vectors.T
+                h_matrices[:, 0, 0] += a
+                h_matrices[:, 1, 1] += a
+                h_matrices[:, 0, 1] = -b
+                h_matrices[:, 1, 0] = b
+                h_matrices[:, 0, 2] = tx
+                h_matrices[:, 1, 2] = ty
+            else:
+                raise NotImplementedError('Only 2D Similarity transforms can '
+                                          'be vectorized.')
+        return HomogeneousBatch(h_matrices, transform_cls=self.transform_cls,
+                                copy=False, skip_checks=True)
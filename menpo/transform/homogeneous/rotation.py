@@ -473,6 +473,51 @@ class Rotation(DiscreteAffine, Similarity):
         """
         return Rotation
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its quaternion
+        parameters (see :meth:`as_vector`), evaluated at ``points``. Only 3D
+        rotations are currently supported.
+
+        As in :meth:`from_vector`, the quaternion is normalized before it is
+        converted to a rotation, so the derivative is tangent to the unit
+        sphere of quaternions.
+
+        Parameters
+        ----------
+        points : ``(n_points, 3)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, 4, 3)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            quaternion parameter.
+
+        Raises
+        ------
+        DimensionalityError, NotImplementedError
+            Non-3D Rotations are not yet vectorizable
+        """
+        if self.n_dims != 3:
+            raise NotImplementedError("Non-3D Rotations are not yet "
+                                      "vectorizable")
+        q = self._as_vector()
+        n = q.dot(q)
+        w, u = q[0], q[1:]
+        # R(q) x = x + (2 / n) g(q, x), with
+        # g(q, x) = w (u x x) + u (u . x) - x (u . u)
+        u_cross_x = np.cross(u, points)
+        u_dot_x = points.dot(u)
+        g = w * u_cross_x + u_dot_x[:, None] * u - points * u.dot(u)
+        dg_dq = np.empty((points.shape[0], 4, 3))
+        dg_dq[:, 0] = u_cross_x
+        for j, e_j in enumerate(np.eye(3)):
+            dg_dq[:, j + 1] = (w * np.cross(e_j, points) +
+                               u_dot_x[:, None] * e_j +
+                               points[:, j:j + 1] * u - 2 * u[j] * points)
+        return (2.0 / n) * dg_dq - (4.0 / n ** 2) * (q[:, None] * g[:, None])
+
     def pseudoinverse(self):
         r"""
         The inverse rotation matrix.
@@ -165,6 +165,24 @@ class NonUniformScale(DiscreteAffine, Affine):
         """
         return NonUniformScale, UniformScale
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameters (the
+        scale across each axis), evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_dims, n_dims)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            parameter.
+        """
+        return points[:, None, :] * np.eye(self.n_dims)
+
     def pseudoinverse(self):
         """
         The inverse scale matrix.
@@ -280,6 +298,24 @@ class UniformScale(DiscreteAffine, Similarity):
         """
         return UniformScale
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameter (the
+        scale), evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, 1, n_dims)`` `ndarray`
+            The derivative of each transformed point with respect to the
+            parameter.
+        """
+        return points[:, None, :].copy()
+
     def pseudoinverse(self):
         r"""
         The inverse scale.
@@ -130,6 +130,40 @@ class Similarity(Affine):
             raise ValueError("Only 2D and 3D Similarity transforms "
                              "are currently supported.")
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameters
+        ``[a, b, tx, ty]`` (see :meth:`as_vector`), evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, 2)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, 4, 2)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            parameter.
+
+        Raises
+        ------
+        DimensionalityError, NotImplementedError
+            Only 2D transforms are supported.
+        """
+        if self.n_dims != 2:
+            raise NotImplementedError("Only 2D Similarity transforms can be "
+                                      "differentiated.")
+        x, y = points[:, 0], points[:, 1]
+        d_dp = np.zeros((points.shape[0], 4, 2))
+        d_dp[:, 0, 0] = x
+        d_dp[:, 0, 1] = y
+        d_dp[:, 1, 0] = -y
+        d_dp[:, 1, 1] = x
+        d_dp[:, 2, 0] = 1
+        d_dp[:, 3, 1] = 1
+        return d_dp
+
     def _from_vector_inplace(self, p):
         r"""
         Returns an instance of the transform from the given parameters,
@@ -185,18 +219,58 @@ class AlignmentSimilarity(HomogFamilyAlignment, Similarity):
     allow_mirror : `bool`, optional
         If ``True``, the Kabsch algorithm check is not performed, and mirroring
         of the Rotation matrix is permitted.
+    h_matrix : ``(n_dims + 1, n_dims + 1)`` `ndarray`, optional
+        The alignment of the `source` to the `target`, if it has already been
+        estimated (e.g. by :func:`generalized_procrustes`). If ``None``, the
+        alignment is estimated from the `source` and the `target`. It is
+        assumed to be a valid similarity and is not copied.
     """
-    def __init__(self, source, target, rotation=True, allow_mirror=False):
+    def __init__(self, source, target, rotation=True, allow_mirror=False,
+                 h_matrix=None):
         HomogFamilyAlignment.__init__(self, source, target)
-        x = procrustes_alignment(source, target, rotation=rotation,
-                                 allow_mirror=allow_mirror)
-        Similarity.__init__(self, x.h_matrix, copy=False, skip_checks=True)
+        self.rotation = rotation
         self.allow_mirror = allow_mirror
+        self._source_stats = None
+        if h_matrix is None:
+            h_matrix = self._build_alignment_h_matrix()
+        Similarity.__init__(self, h_matrix, copy=False, skip_checks=True)
+
+    def __setstate__(self, state):
+        # older versions of menpo did not store the rotation flag or the
+        # source statistics
+        state.setdefault('rotation', True)
+        state.setdefault('_source_stats', None)
+        self.__dict__.update(state)
+
+    def _build_alignment_h_matrix(self):
+        r"""
+        Returns the optimal similarity alignment of the source to the current
+        target.
+
+        In 2D the alignment is solved in closed form from statistics of the
+        source that are computed once (and recomputed only if the source
+        changes, e.g. after :meth:`pseudoinverse`), so updating the target is
+        a single pass over the target points. Other dimensionalities (and
+        degenerate 2D configurations) fall back to :func:`procrustes_alignment`.
+        """
+        h_matrix = None
+        if self.source.n_dims == 2:
+            stats = self._source_stats
+            if stats is None or stats[0] is not self.source:
+                stats = (self.source, _procrustes_2d_source_stats(self.source))
+                self._source_stats = stats
+            h_matrix = _procrustes_2d_h_matrix(stats[1], self.target.points,
+                                               rotation=self.rotation,
+                                               allow_mirror=self.allow_mirror)
+        if h_matrix is None:
+            h_matrix = procrustes_alignment(
+                self.source, self.target, rotation=self.rotation,
+                allow_mirror=self.allow_mirror).h_matrix
+        return h_matrix
 
     def _sync_state_from_target(self):
-        similarity = procrustes_alignment(self.source, self.target,
-                                          allow_mirror=self.allow_mirror)
-        self._set_h_matrix(similarity.h_matrix, copy=False, skip_checks=True)
+        self._set_h_matrix(self._build_alignment_h_matrix(), copy=False,
+                           skip_checks=True)
 
     def as_non_alignment(self):
         r"""
@@ -235,6 +309,85 @@ class AlignmentSimilarity(HomogFamilyAlignment, Similarity):
         self._sync_target_from_state()
 
 
+def _procrustes_2d_source_stats(source):
+    r"""
+    Statistics of a 2D `source` from which the Procrustes alignment to any
+    target can be computed in a single pass over the target points.
+
+    Treating the centred source points as complex numbers :math:`s_k`, the
+    columns of the returned ``moments`` are such that ``t.ravel().dot(moments)``
+    gives the real and imaginary parts of :math:`\sum_k \bar{s}_k t_k`
+    (rotation) and of :math:`\sum_k s_k t_k` (reflection) for the target
+    points :math:`t_k`. As the centred source sums to zero, the target does
+    not need to be centred first.
+
+    Returns
+    -------
+    centre : ``(2,)`` `ndarray`
+        The centre of the source.
+    norm : `float`
+        The norm of the centred source.
+    moments : ``(2 * n_points, 4)`` `ndarray`
+        The source moments.
+    """
+    centre = source.centre()
+    s = source.points - centre
+    x, y = s[:, 0], s[:, 1]
+    moments = np.empty((s.size, 4))
+    moments[0::2, 0], moments[1::2, 0] = x, y
+    moments[0::2, 1], moments[1::2, 1] = -y, x
+    moments[0::2, 2], moments[1::2, 2] = x, -y
+    moments[0::2, 3], moments[1::2, 3] = y, x
+    return centre, np.linalg.norm(s), moments
+
+
+def _procrustes_2d_h_matrix(source_stats, target, rotation=True,
+                            allow_mirror=False):
+    r"""
+    Closed form of :func:`procrustes_alignment` for 2D shapes.
+
+    Parameters
+    ----------
+    source_stats : `tuple`
+        The output of :func:`_procrustes_2d_source_stats` for the source.
+    target : ``(n_points, 2)`` `ndarray`
+        The target points.
+    rotation : `bool`, optional
+        If ``True``, rotation is allowed in the alignment.
+    allow_mirror : `bool`, optional
+        If ``True``, the best reflection is used in place of the best rotation
+        when it aligns the shapes better.
+
+    Returns
+    -------
+    h_matrix : ``(3, 3)`` `ndarray` or ``None``
+        The homogeneous matrix of the alignment, or ``None`` if the optimal
+        rotation is not unique (in which case :func:`procrustes_alignment`
+        should be used).
+    """
+    src_centre, src_norm, moments = source_stats
+    tgt_centre = target.mean(axis=0)
+    scale = np.linalg.norm(target - tgt_centre) / src_norm
+    h_matrix = np.eye(3)
+    if rotation:
+        r_re, r_im, m_re, m_im = target.ravel().dot(moments)
+        r_abs = np.hypot(r_re, r_im)
+        m_abs = np.hypot(m_re, m_im)
+        if allow_mirror and m_abs > r_abs:
+            # reflection: s -> exp(i phi) * conj(s)
+            cos, sin = m_re / m_abs, m_im / m_abs
+            h_matrix[:2, :2] = [[cos, sin], [sin, -cos]]
+        elif r_abs > 0 and not (allow_mirror and m_abs == r_abs):
+            # rotation: s -> exp(i theta) * s
+            cos, sin = r_re / r_abs, r_im / r_abs
+            h_matrix[:2, :2] = [[cos, -sin], [sin, cos]]
+        else:
+            return None
+    h_matrix[:2, :2] *= scale
+    h_matrix[:2, 2] = tgt_centre - h_matrix[:2, :2].dot(src_centre)
+    return h_matrix
+
+
 def procrustes_alignment(source, target, rotation=True, allow_mirror=False):
     r"""
     Returns the similarity transform that aligns the `source` to the `target`.
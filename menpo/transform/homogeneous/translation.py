@@ -87,6 +87,24 @@ class Translation(DiscreteAffine, Similarity):
         """
         self.h_matrix[:-1, -1] = p
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to its parameters (the
+        translation in each axis), evaluated at ``points``.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_dims, n_dims)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            parameter.
+        """
+        return np.repeat(np.eye(self.n_dims)[None], points.shape[0], axis=0)
+
     def pseudoinverse(self):
         r"""
         The inverse translation (negated).
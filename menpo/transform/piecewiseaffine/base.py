@@ -1,8 +1,6 @@
 import numpy as np
-from copy import deepcopy
-from menpo.base import Copyable
-from menpo.transform.base import Alignment, Invertible, Transform
-from .fastpwa import CLookupPWA
+from menpo.transform.base import Alignment, Invertible, Transform, DP, DX
+from .fastpwa import CLookupPWA, DEFAULT_CACHE_SIZE
 # TODO View is broken for PWA (TriangleContainmentError)
 
 
@@ -185,7 +183,7 @@ def barycentric_vectors(points, trilist):
 
 
 # Note we inherit from Alignment first to get it's n_dims behavior
-class AbstractPWA(Alignment, Transform, Invertible):
+class AbstractPWA(Alignment, Transform, Invertible, DP, DX):
     r"""
     A piecewise affine transformation.
 
@@ -349,6 +347,69 @@ class AbstractPWA(Alignment, Transform, Invertible):
         """
         raise NotImplementedError()
 
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to the target points
+        (flattened as ``target.as_vector()``), evaluated at ``points``. Each
+        transformed point only depends on the three target vertices of its
+        containing triangle, weighted by its barycentric coordinates.
+
+        Parameters
+        ----------
+        points : ``(n_points, 2)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_landmarks * 2, 2)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            target coordinate.
+
+        Raises
+        ------
+        TriangleContainmentError
+            All `points` must be contained in a source triangle. Check
+            `error.points_outside_source_domain` to handle this case.
+        """
+        tri_index, alpha, beta = self.index_alpha_beta(points)
+        n_points = points.shape[0]
+        weights = np.zeros((n_points, self.n_points))
+        weights[np.arange(n_points)[:, None], self.trilist[tri_index]] = \
+            np.stack([1 - alpha - beta, alpha, beta], axis=1)
+        d_dp = weights[..., None, None] * np.eye(self.n_dims)
+        return d_dp.reshape([n_points, -1, self.n_dims])
+
+    def d_dx(self, points):
+        r"""
+        The derivative of this transform with respect to the input points,
+        evaluated at ``points``. This is the linear component of the affine
+        transform of each point's containing triangle.
+
+        Parameters
+        ----------
+        points : ``(n_points, 2)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, 2, 2)`` `ndarray`
+            The Jacobian of the transform at each point.
+
+        Raises
+        ------
+        TriangleContainmentError
+            All `points` must be contained in a source triangle. Check
+            `error.points_outside_source_domain` to handle this case.
+        """
+        tri_index = self.index_alpha_beta(points)[0]
+        s = self.source.points[self.trilist]
+        # the edge vectors of each source and target triangle as columns
+        source_edges = np.stack([s[:, 1] - s[:, 0], s[:, 2] - s[:, 0]],
+                                axis=2)
+        target_edges = np.stack([self.tij, self.tik], axis=2)
+        tri_d_dx = np.matmul(target_edges, np.linalg.inv(source_edges))
+        return tri_d_dx[tri_index]
+
     @property
     def has_true_inverse(self):
         """
@@ -406,7 +467,14 @@ class CythonPWA(AbstractPWA):
 
     The apply method in this case involves dotting the triangle vectors with
     the values of alpha and beta found. The calculation of alpha and beta is
-    done in C, and a hash map is used to cache lookup values.
+    done in C, and a hash map is used to cache lookup values. The cache holds
+    at most `cache_size` points - when it is full, the points that were least
+    recently hit are evicted (using the clock policy). :attr:`cache_stats`
+    reports how effective the cache is for the workload at hand.
+
+    Copies share the C triangle structure of the source (which is immutable)
+    and start with a copy of the lookup cache. The lookup cache is also
+    pickled, so unpickled transforms start warm.
 
     Parameters
     ----------
@@ -418,6 +486,9 @@ class CythonPWA(AbstractPWA):
     target : :class:`PointCloud`
         The target points. Note that the trilist is entirely decided by
         the source.
+    cache_size : `int` or ``None``, optional
+        The maximum number of points held in the lookup cache. If ``None``,
+        the cache is unbounded. If ``0``, lookups are not cached.
 
     Raises
     ------
@@ -428,20 +499,75 @@ class CythonPWA(AbstractPWA):
         All points to apply must be contained in a source triangle. Check
         `error.points_outside_source_domain` to handle this case.
     """
-    def __init__(self, source, target):
+    def __init__(self, source, target, cache_size=DEFAULT_CACHE_SIZE):
         super(CythonPWA, self).__init__(source, target)
+        # build the cython wrapped C object and store it locally
+        self._fastpwa = self._build_fastpwa(cache_size)
+
+    @property
+    def cache_size(self):
+        r"""
+        The maximum number of points held in the lookup cache (``None`` if
+        the cache is unbounded). Reducing it evicts points straight away.
+
+        :type: `int` or ``None``
+        """
+        return self._fastpwa.cache_size
+
+    @cache_size.setter
+    def cache_size(self, value):
+        self._fastpwa.cache_size = value
+
+    @property
+    def n_cached(self):
+        r"""
+        The number of points currently held in the lookup cache.
+
+        :type: `int`
+        """
+        return self._fastpwa.n_cached
+
+    @property
+    def cache_stats(self):
+        r"""
+        The number of ``'hits'``, ``'misses'`` and ``'evictions'`` of the
+        lookup cache since this transform was built (or :meth:`clear_cache`
+        was last called). Copies and unpickled transforms start counting from
+        zero.
+
+        :type: `dict`
+        """
+        return self._fastpwa.cache_stats
+
+    def clear_cache(self):
+        r"""
+        Empty the lookup cache and reset :attr:`cache_stats`.
+        """
+        self._fastpwa.clear_cache()
+
+    def _build_fastpwa(self, cache_size):
         # make sure the source and target satisfy the c requirements
         source_c = np.require(self.source.points, dtype=np.float64,
                               requirements=['C'])
         trilist_c = np.require(self.trilist, dtype=np.uint32,
                                requirements=['C'])
-        # build the cython wrapped C object and store it locally
-        self._fastpwa = CLookupPWA(source_c, trilist_c)
-
-    def copy(self):
-        new = Copyable.copy(self)
-        new._fastpwa = deepcopy(self._fastpwa)
-        return new
+        return CLookupPWA(source_c, trilist_c, cache_size=cache_size)
+
+    def __getstate__(self):
+        # The C lookup duplicates the source, so only its cache is stored.
+        # It is rebuilt from the source on load and starts warm.
+        state = self.__dict__.copy()
+        fastpwa = state.pop('_fastpwa')
+        state['_fastpwa_cache'] = (fastpwa.cache_size, fastpwa.cache_state())
+        return state
+
+    def __setstate__(self, state):
+        cache = state.pop('_fastpwa_cache', None)
+        self.__dict__ = state
+        if cache is not None:
+            cache_size, cache_state = cache
+            self._fastpwa = self._build_fastpwa(cache_size)
+            self._fastpwa.warm_cache(*cache_state)
 
     def index_alpha_beta(self, points):
         points_c = np.require(points, dtype=np.float64, requirements=['C'])
@@ -9,11 +9,17 @@ cdef extern from "./fastpwa/pwa.h":
     ctypedef struct AlphaBetaIndex:
         pass
 
+    ctypedef struct CacheStats:
+        unsigned long long hits
+        unsigned long long misses
+        unsigned long long evictions
+
     TriangleCollection initTriangleCollection(double *vertices,
                                               unsigned int *trilist,
                                               unsigned int n_triangles)
 
     void arrayCachedAlphaBetaIndexForPoints(AlphaBetaIndex **hashMap,
+                                      long capacity, CacheStats *stats,
                                       TriangleCollection *tris,
                                       double *points,
                                       unsigned int n_points, int *indexes,
@@ -24,54 +30,190 @@ cdef extern from "./fastpwa/pwa.h":
                                       double *alphas, double *betas)
     void clearCacheAndDelete(AlphaBetaIndex **hashMap)
     void deleteTriangleCollection(TriangleCollection *tris)
+    void shrinkCache(AlphaBetaIndex **hashMap, long capacity,
+                     CacheStats *stats)
+    unsigned int cacheSize(AlphaBetaIndex **hashMap)
+    void exportCache(AlphaBetaIndex **hashMap, double *points, int *indexes,
+                     double *alphas, double *betas)
+    void importCache(AlphaBetaIndex **hashMap, long capacity, double *points,
+                     unsigned int n_points, int *indexes, double *alphas,
+                     double *betas)
 
 
-cdef class CLookupPWA:
+# The default maximum number of points held in a lookup cache. Each cached
+# point uses roughly 100 bytes.
+DEFAULT_CACHE_SIZE = 2 ** 20
+
+
+cdef class SourceTriangles:
+    r"""
+    The immutable C triangle collection of a piecewise affine source. It is
+    shared (never copied) between copies of a :class:`CLookupPWA`.
+    """
     cdef TriangleCollection tris
-    cdef AlphaBetaIndex *hashMap
-    cdef unsigned n_tris
-    cdef object points
-    cdef object trilist
+    cdef readonly object points
+    cdef readonly object trilist
 
     def __cinit__(self,
                   double[:, ::1] points not None,
                   unsigned[:, ::1] trilist not None):
-        hashMap = NULL
         if points.shape[1] != 2:
-            raise Exception
-        self.n_tris = trilist.shape[0]
-        self.points = points
-        self.trilist = trilist
-        self.tris =  initTriangleCollection(&points[0,0], &trilist[0,0],
-                                            trilist.shape[0])
-
-    def _init_source_triangles(self,
-                  double[:, ::1] points not None,
-                  unsigned[:, ::1] trilist not None):
-        hashMap = NULL
-        if points.shape[1] != 2:
-            raise Exception
-        elif points.shape[0] != self.n_tris:
-            raise Exception
-        self.tris =  initTriangleCollection(&points[0,0], &trilist[0,0],
-                                            self.n_tris)
-
-    def _init_target_triangles(
-            self, double[:, ::1] points not None,
-            unsigned[:, ::1] trilist not None):
-        self.target_tris = initTriangleCollection(
-            &points[0, 0], &trilist[0, 0], trilist.shape[0])
+            raise ValueError('source points must be 2 dimensional')
+        if trilist.shape[1] != 3:
+            raise ValueError('trilist must be of shape (n_tris, 3)')
+        self.points = np.asarray(points)
+        self.trilist = np.asarray(trilist)
+        self.tris = initTriangleCollection(&points[0, 0], &trilist[0, 0],
+                                           trilist.shape[0])
 
     def __dealloc__(self):
         deleteTriangleCollection(&self.tris)
+
+
+cdef class CLookupPWA:
+    r"""
+    Finds the containing source triangle and barycentric coordinates of
+    points, caching the result for every point queried.
+
+    The cache holds at most ``cache_size`` points (``None`` for an unbounded
+    cache, ``0`` to disable caching). When it is full, points are evicted with
+    the clock (second chance) policy: the oldest point that was not hit since
+    the policy last visited it is evicted.
+    """
+    cdef AlphaBetaIndex *hashMap
+    cdef long capacity
+    cdef CacheStats stats
+    cdef readonly SourceTriangles source_triangles
+
+    def __cinit__(self,
+                  double[:, ::1] points not None,
+                  unsigned[:, ::1] trilist not None,
+                  cache_size=DEFAULT_CACHE_SIZE,
+                  SourceTriangles source_triangles=None):
+        self.hashMap = NULL
+        self.stats.hits = 0
+        self.stats.misses = 0
+        self.stats.evictions = 0
+        self.capacity = _cache_size_to_capacity(cache_size)
+        if source_triangles is None:
+            source_triangles = SourceTriangles(points, trilist)
+        self.source_triangles = source_triangles
+
+    def __dealloc__(self):
         clearCacheAndDelete(&self.hashMap)
 
     def __reduce__(self):
         r"""
-        Implement the reduction protocol so this object is copyable/picklable
+        Implement the reduction protocol so this object is copyable/picklable.
+        The lookup cache is part of the state, so unpickled objects start warm.
+        """
+        return self.__class__, (self.source_triangles.points,
+                                self.source_triangles.trilist,
+                                self.cache_size), \
+            self.cache_state()
+
+    def __setstate__(self, state):
+        self.warm_cache(*state)
+
+    def copy(self):
+        r"""
+        A copy of this lookup that shares the (immutable) source triangles and
+        starts with a copy of the current lookup cache.
+        """
+        new = CLookupPWA(self.source_triangles.points,
+                         self.source_triangles.trilist,
+                         cache_size=self.cache_size,
+                         source_triangles=self.source_triangles)
+        new.warm_cache(*self.cache_state())
+        return new
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    @property
+    def n_cached(self):
+        r"""
+        The number of points currently held in the lookup cache.
         """
-        return self.__class__, (np.asarray(self.points),
-                                np.asarray(self.trilist))
+        return cacheSize(&self.hashMap)
+
+    @property
+    def cache_size(self):
+        r"""
+        The maximum number of points held in the lookup cache (``None`` if
+        unbounded). Reducing it evicts points straight away.
+        """
+        return None if self.capacity < 0 else self.capacity
+
+    @cache_size.setter
+    def cache_size(self, value):
+        self.capacity = _cache_size_to_capacity(value)
+        shrinkCache(&self.hashMap, self.capacity, &self.stats)
+
+    @property
+    def cache_stats(self):
+        r"""
+        The number of lookup cache hits, misses and evictions since this
+        object was created (or :meth:`clear_cache` was last called).
+        """
+        return {'hits': self.stats.hits,
+                'misses': self.stats.misses,
+                'evictions': self.stats.evictions}
+
+    def clear_cache(self):
+        r"""
+        Empty the lookup cache and reset :attr:`cache_stats`.
+        """
+        clearCacheAndDelete(&self.hashMap)
+        self.hashMap = NULL
+        self.stats.hits = 0
+        self.stats.misses = 0
+        self.stats.evictions = 0
+
+    def cache_state(self):
+        r"""
+        The contents of the lookup cache as arrays.
+
+        Returns
+        -------
+        points : ``(n_cached, 2)`` `ndarray`
+            The cached query points.
+        indexes : ``(n_cached,)`` `ndarray`
+            The triangle index of each point (``-1`` if outside all triangles)
+        alphas : ``(n_cached,)`` `ndarray`
+            The alpha barycentric coordinate of each point.
+        betas : ``(n_cached,)`` `ndarray`
+            The beta barycentric coordinate of each point.
+        """
+        cdef unsigned int n = cacheSize(&self.hashMap)
+        cdef cnp.ndarray[double, ndim=2, mode='c'] points = \
+            np.empty((n, 2), dtype=np.float64)
+        cdef cnp.ndarray[double, ndim=1, mode='c'] alphas = \
+            np.empty(n, dtype=np.float64)
+        cdef cnp.ndarray[double, ndim=1, mode='c'] betas = \
+            np.empty(n, dtype=np.float64)
+        cdef cnp.ndarray[int, ndim=1, mode='c'] indexes = \
+            np.empty(n, dtype=np.int32)
+        if n > 0:
+            exportCache(&self.hashMap, &points[0, 0], &indexes[0],
+                        &alphas[0], &betas[0])
+        return points, indexes, alphas, betas
+
+    def warm_cache(self, double[:, ::1] points not None,
+                   int[::1] indexes not None,
+                   double[::1] alphas not None,
+                   double[::1] betas not None):
+        r"""
+        Add the output of :meth:`cache_state` (for the same source triangles)
+        to the lookup cache.
+        """
+        if points.shape[0] > 0:
+            importCache(&self.hashMap, self.capacity, &points[0, 0],
+                        points.shape[0],
+                        &indexes[0], &alphas[0], &betas[0])
 
     def index_alpha_beta(self, double[:, ::1] points not None):
         # create three c numpy arrays for storing our output into
@@ -82,8 +224,18 @@ cdef class CLookupPWA:
         cdef cnp.ndarray[int, ndim=1, mode='c'] indexes = \
             np.zeros(points.shape[0], dtype=np.int32)
         # fill the arrays with the C results
-        arrayCachedAlphaBetaIndexForPoints(&self.hashMap, &self.tris,
-                                          &points[0,0],
+        arrayCachedAlphaBetaIndexForPoints(&self.hashMap, self.capacity,
+                                           &self.stats,
+                                           &self.source_triangles.tris,
+                                           &points[0,0],
                                      points.shape[0], &indexes[0],
                                      &alphas[0], &betas[0])
         return indexes, alphas, betas
+
+
+def _cache_size_to_capacity(cache_size):
+    if cache_size is None:
+        return -1
+    elif cache_size < 0:
+        raise ValueError('cache_size must be None or >= 0')
+    return cache_size
@@ -130,8 +130,16 @@ AlphaBetaIndex* retrieveAlphaBetaFromCache(AlphaBetaIndex **hash, Point queryPoi
 }
 
 // should only be called after retrieveAlphaBetaFromCache has returned NULL
-void addAlphaBetaIndexToCache(AlphaBetaIndex **hash, Point queryPoint, int index, double alpha, double beta)
+void addAlphaBetaIndexToCache(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                              Point queryPoint, int index, double alpha, double beta)
 {
+  if (capacity == 0) {
+    return;  // caching is disabled
+  }
+  // make room for the new result
+  while (capacity > 0 && HASH_COUNT(*hash) >= (unsigned long)capacity) {
+    evictFromCache(hash, stats);
+  }
   // dynamically allocate a new result object
   AlphaBetaIndex *result;
   result = (AlphaBetaIndex *)malloc(sizeof(AlphaBetaIndex));
@@ -143,32 +151,61 @@ void addAlphaBetaIndexToCache(AlphaBetaIndex **hash, Point queryPoint, int index
   HASH_ADD(hh, *hash, queryPoint, sizeof(Point), result);
 }
 
-void cachedAlphaBetaIndexForPointInTriangleCollection(AlphaBetaIndex **hash, TriangleCollection *tris, Point point,
+// clock (second chance) eviction: entries are visited in insertion order,
+// entries that were hit since they were last visited are given a second
+// chance by moving them to the back. The first unreferenced entry is evicted.
+void evictFromCache(AlphaBetaIndex **hash, CacheStats *stats)
+{
+  AlphaBetaIndex *entry;
+  while ((entry = *hash) != NULL) {
+    HASH_DEL(*hash, entry);
+    if (entry->referenced) {
+      entry->referenced = 0;
+      HASH_ADD(hh, *hash, queryPoint, sizeof(Point), entry);
+    } else {
+      free(entry);
+      stats->evictions++;
+      return;
+    }
+  }
+}
+
+void shrinkCache(AlphaBetaIndex **hash, long capacity, CacheStats *stats)
+{
+  while (capacity >= 0 && HASH_COUNT(*hash) > (unsigned long)capacity) {
+    evictFromCache(hash, stats);
+  }
+}
+
+void cachedAlphaBetaIndexForPointInTriangleCollection(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                                                      TriangleCollection *tris, Point point,
                                                       int *index, double *alpha, double *beta)
 {
   // check to see if the point is in the hashmap
   AlphaBetaIndex *cachedResult = retrieveAlphaBetaFromCache(hash, point);
   if (cachedResult) {
-    //printf("cache hit\n");
+    stats->hits++;
+    cachedResult->referenced = 1;
     *alpha = cachedResult->alpha;
     *beta = cachedResult->beta;
     *index = cachedResult->index;
   } else {
-    //printf("cache miss\n");
+    stats->misses++;
     // no entry in the cache - calculate the alpha/beta and cache it
     containingTriangleAndAlphaBetaForPoint(tris, point, index, alpha, beta);
-    addAlphaBetaIndexToCache(hash, point, *index, *alpha, *beta);
+    addAlphaBetaIndexToCache(hash, capacity, stats, point, *index, *alpha, *beta);
   }
 }
 
-void arrayCachedAlphaBetaIndexForPoints(AlphaBetaIndex **hash, TriangleCollection *tris, double *points, unsigned int n_points,
+void arrayCachedAlphaBetaIndexForPoints(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                                  TriangleCollection *tris, double *points, unsigned int n_points,
                                   int *indexes, double *alphas, double *betas)
 {
   unsigned int i;
   for (i = 0; i < n_points; i++) {
     // build a point object
     Point queryPoint = initPoint(points + i * 2);
-    cachedAlphaBetaIndexForPointInTriangleCollection(hash, tris, queryPoint,
+    cachedAlphaBetaIndexForPointInTriangleCollection(hash, capacity, stats, tris, queryPoint,
                                                      indexes + i, alphas + i, betas + i);
   }
 }
@@ -193,3 +230,40 @@ void clearCacheAndDelete(AlphaBetaIndex **hash)
   }
 }
 
+
+unsigned int cacheSize(AlphaBetaIndex **hash)
+{
+  return HASH_COUNT(*hash);
+}
+
+// points, indexes, alphas and betas must have space for cacheSize() entries
+void exportCache(AlphaBetaIndex **hash, double *points, int *indexes,
+                 double *alphas, double *betas)
+{
+  AlphaBetaIndex *currentResult, *tmp;
+  unsigned int i = 0;
+  HASH_ITER(hh, *hash, currentResult, tmp) {
+    points[i * 2] = currentResult->queryPoint.x;
+    points[i * 2 + 1] = currentResult->queryPoint.y;
+    indexes[i] = currentResult->index;
+    alphas[i] = currentResult->alpha;
+    betas[i] = currentResult->beta;
+    i++;
+  }
+}
+
+// entries that are already in the cache are left untouched. Evictions made
+// to respect the capacity are not counted.
+void importCache(AlphaBetaIndex **hash, long capacity, double *points, unsigned int n_points,
+                 int *indexes, double *alphas, double *betas)
+{
+  unsigned int i;
+  CacheStats stats = {0, 0, 0};
+  for (i = 0; i < n_points; i++) {
+    Point queryPoint = initPoint(points + i * 2);
+    if (!retrieveAlphaBetaFromCache(hash, queryPoint)) {
+      addAlphaBetaIndexToCache(hash, capacity, &stats, queryPoint, indexes[i],
+                               alphas[i], betas[i]);
+    }
+  }
+}
@@ -38,22 +38,37 @@ typedef struct {
   double alpha;
   double beta;
   int index;
+  int referenced;
   UT_hash_handle hh;
 } AlphaBetaIndex;
 
+typedef struct {
+  unsigned long long hits;
+  unsigned long long misses;
+  unsigned long long evictions;
+} CacheStats;
+
+// capacity is the maximum number of cached points: negative for an unbounded
+// cache, 0 to disable caching
 AlphaBetaIndex* retrieveAlphaBetaFromCache(AlphaBetaIndex **hash, Point queryPoint);
 // should only be called after retrieveAlphaBetaFromCache has returned NULL
-void addAlphaBetaIndexToCache(AlphaBetaIndex **hash, Point queryPoint, int index, double alpha, double beta);
-void cachedAlphaBetaIndexForPointInTriangleCollection(AlphaBetaIndex **hash, TriangleCollection *tris, Point point,
+void addAlphaBetaIndexToCache(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                              Point queryPoint, int index, double alpha, double beta);
+void evictFromCache(AlphaBetaIndex **hash, CacheStats *stats);
+void shrinkCache(AlphaBetaIndex **hash, long capacity, CacheStats *stats);
+void cachedAlphaBetaIndexForPointInTriangleCollection(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                                                      TriangleCollection *tris, Point point,
                                                       int *index, double *alpha, double *beta);
-void arrayCachedAlphaBetaIndexForPoints(AlphaBetaIndex **hash, TriangleCollection *tris,
+void arrayCachedAlphaBetaIndexForPoints(AlphaBetaIndex **hash, long capacity, CacheStats *stats,
+                                  TriangleCollection *tris,
                                   double *points, unsigned int n_points,
                                   int *indexes, double *alphas, double *betas);
 void arrayAlphaBetaIndexForPoints(TriangleCollection *tris,
                                   double *points, unsigned int n_points,
                                   int *indexes, double *alphas, double *betas);
-void arrayMapForPointsAndTargetPoints(AlphaBetaIndex **hash, TriangleCollection *sourceTris,
-                                  TriangleCollection *targetTris, double *points, unsigned int n_points,
-                                  double *mappedPoints);
 void clearCacheAndDelete(AlphaBetaIndex **hash);
-
+unsigned int cacheSize(AlphaBetaIndex **hash);
+void exportCache(AlphaBetaIndex **hash, double *points, int *indexes,
+                 double *alphas, double *betas);
+void importCache(AlphaBetaIndex **hash, long capacity, double *points, unsigned int n_points,
+                 int *indexes, double *alphas, double *betas);
@@ -1,9 +1,40 @@
 import numpy as np
 from scipy.spatial.distance import cdist
-from .base import Transform
+from .base import Transform, DX
 
 
-class RadialBasisFunction(Transform):
+def _r2_log_r2(x, c):
+    r"""
+    :math:`r^2 \log{r^2}` for every pair of points in ``x`` and ``c``, using
+    only two ``(n_points, n_centres)`` buffers.
+    """
+    r2 = cdist(x, c, 'sqeuclidean')
+    # Clamping r^2 before the log means the singularities at r = 0 come out
+    # as exactly 0, without needing a mask
+    u = np.maximum(r2, np.finfo(r2.dtype).tiny)
+    np.log(u, out=u)
+    u *= r2
+    return u
+
+
+def _d_r2_log_r2(x, c):
+    r"""
+    The derivative of :math:`r^2 \log{r^2}` with respect to each of the points
+    ``x``, for every centre in ``c``, which is
+    :math:`2 (x - c) (\log{r^2} + 1)`.
+    """
+    diff = x[:, None, :] - c
+    r2 = np.einsum('ijk,ijk->ij', diff, diff)
+    # At r = 0, x - c = 0 so clamping r^2 gives the correct limit of 0
+    g = np.maximum(r2, np.finfo(r2.dtype).tiny)
+    np.log(g, out=g)
+    g += 1
+    g *= 2
+    diff *= g[..., None]
+    return diff
+
+
+class RadialBasisFunction(Transform, DX):
     r"""
     Radial Basis Functions are a class of transform that is used by
     :map:`ThinPlateSplines`. They have to be able to take their own radial
@@ -86,14 +117,25 @@ class R2LogR2RBF(RadialBasisFunction):
             The basis function applied to each distance,
             :math:`\lVert x - c \rVert`.
         """
-        euclidean_distance = cdist(x, self.c)
-        mask = euclidean_distance == 0
-        with np.errstate(divide='ignore', invalid='ignore'):
-            u = (euclidean_distance ** 2 *
-                 (2 * np.log(euclidean_distance)))
-        # reset singularities to 0
-        u[mask] = 0
-        return u
+        return _r2_log_r2(x, self.c)
+
+    def d_dx(self, points):
+        r"""
+        The derivative of the basis function with respect to the points,
+        :math:`2 (x - c) (\log{r^2} + 1)`.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, n_centres, n_dims)`` `ndarray`
+            The derivative of the basis function of each centre with respect
+            to each point.
+        """
+        return _d_r2_log_r2(points, self.c)
 
 
 class R2LogRRBF(RadialBasisFunction):
@@ -130,10 +172,27 @@ class R2LogRRBF(RadialBasisFunction):
             The basis function applied to each distance,
             :math:`\lVert points - c \rVert`.
         """
-        euclidean_distance = cdist(points, self.c)
-        mask = euclidean_distance == 0
-        with np.errstate(divide='ignore', invalid='ignore'):
-            u = euclidean_distance ** 2 * np.log(euclidean_distance)
-        # reset singularities to 0
-        u[mask] = 0
+        # r^2 log(r) = r^2 log(r^2) / 2
+        u = _r2_log_r2(points, self.c)
+        u *= 0.5
         return u
+
+    def d_dx(self, points):
+        r"""
+        The derivative of the basis function with respect to the points,
+        :math:`(x - c) (\log{r^2} + 1)`.
+
+        Parameters
+        ----------
+        points : ``(n_points, n_dims)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, n_centres, n_dims)`` `ndarray`
+            The derivative of the basis function of each centre with respect
+            to each point.
+        """
+        d_dx = _d_r2_log_r2(points, self.c)
+        d_dx *= 0.5
+        return d_dx
@@ -65,3 +65,60 @@ def transformchain_compose_after_inplace_composes_with_test():
     assert (no_return is None)
     assert (ref is tr)
     assert (len(tr.transforms) is 1)
+
+
+def transformchain_collapse_homogeneous_test():
+    import numpy as np
+    from numpy.testing import assert_allclose
+    from menpo.transform import Affine, Translation, UniformScale
+    t1, t2 = Translation([1, 2]), UniformScale(2, 2)
+    tr = TransformChain([t1, t2])
+    collapsed = tr.collapse()
+    assert isinstance(collapsed, Affine)
+    points = np.random.rand(10, 2)
+    assert_allclose(collapsed.apply(points), (points + [1, 2]) * 2)
+    assert_allclose(tr.apply(points), (points + [1, 2]) * 2)
+    # the transforms of the chain are untouched
+    assert_allclose(t1.h_matrix[:2, 2], [1, 2])
+
+
+def transformchain_collapse_runs_test():
+    import numpy as np
+    from numpy.testing import assert_allclose
+    from menpo.transform import Translation, UniformScale, WithDims
+    tr = TransformChain([Translation([1, 2, 3]), UniformScale(2, 3),
+                         WithDims([1, 2]), UniformScale(3, 2),
+                         Translation([1, 1])])
+    collapsed = tr.collapse()
+    assert isinstance(collapsed, TransformChain)
+    assert len(collapsed.transforms) == 3
+    points = np.random.rand(10, 3)
+    expected = ((points[:, 1:] + [2, 3]) * 2) * 3 + 1
+    assert_allclose(tr.apply(points), expected)
+    assert_allclose(collapsed.apply(points), expected)
+
+
+def transformchain_apply_collapses_large_inputs_test():
+    import numpy as np
+    from numpy.testing import assert_allclose
+    from menpo.transform import Translation, UniformScale
+    from menpo.transform.base import composable
+    tr = TransformChain([Translation([1, 2]), UniformScale(2, 2)])
+    tr._collapsed_transforms = Mock(wraps=tr._collapsed_transforms)
+    small = np.random.rand(composable._COLLAPSE_MIN_POINTS - 1, 2)
+    assert_allclose(tr.apply(small), (small + [1, 2]) * 2)
+    assert not tr._collapsed_transforms.called
+    large = np.random.rand(composable._COLLAPSE_MIN_POINTS, 2)
+    assert_allclose(tr.apply(large), (large + [1, 2]) * 2)
+    assert tr._collapsed_transforms.call_count == 1
+
+
+def transformchain_apply_no_homogeneous_run_test():
+    import numpy as np
+    from menpo.transform import Translation, WithDims
+    from menpo.transform.base import composable
+    tr = TransformChain([Translation([1, 2, 3]), WithDims([1, 2]),
+                         Translation([1, 1])])
+    tr._collapsed_transforms = Mock(wraps=tr._collapsed_transforms)
+    tr.apply(np.random.rand(composable._COLLAPSE_MIN_POINTS, 3))
+    assert not tr._collapsed_transforms.called
@@ -0,0 +1,129 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose.tools import raises
+
+from menpo.shape import PointCloud
+from menpo.transform import (Homogeneous, Affine, Similarity, Translation,
+                             UniformScale, NonUniformScale, Rotation,
+                             AlignmentSimilarity, ThinPlateSplines,
+                             PiecewiseAffine, R2LogR2RBF, R2LogRRBF)
+from menpo.transform.piecewiseaffine.base import CythonPWA, PythonPWA
+
+
+EPS = 1e-6
+
+src = PointCloud(np.array([[0.0, 0.0], [0.0, 4.0], [4.0, 0.0], [4.0, 4.0],
+                           [2.0, 2.5]]))
+tgt = PointCloud(src.points + np.array([[0.2, -0.1], [0.3, 0.4], [-0.2, 0.1],
+                                        [0.1, 0.0], [0.4, -0.3]]))
+points = np.array([[0.5, 0.5], [1.0, 3.0], [3.5, 1.0], [2.0, 2.0],
+                   [3.0, 3.5]])
+
+
+def numerical_d_dp(transform, points):
+    p = np.atleast_1d(transform.as_vector())
+    d_dp = []
+    for k in range(p.shape[0]):
+        dp = np.zeros_like(p)
+        dp[k] = EPS
+        d_dp.append((transform.from_vector(p + dp).apply(points) -
+                     transform.from_vector(p - dp).apply(points)) / (2 * EPS))
+    return np.stack(d_dp, axis=1)
+
+
+def numerical_d_dp_target(transform, points):
+    p = transform.target.as_vector()
+    d_dp = []
+    for k in range(p.shape[0]):
+        dp = np.zeros_like(p)
+        dp[k] = EPS
+        transform.set_target(transform.target.from_vector(p + dp))
+        plus = transform.apply(points)
+        transform.set_target(transform.target.from_vector(p - dp))
+        minus = transform.apply(points)
+        d_dp.append((plus - minus) / (2 * EPS))
+    transform.set_target(transform.target.from_vector(p))
+    return np.stack(d_dp, axis=1)
+
+
+def numerical_d_dx(transform, points):
+    d_dx = []
+    for j in range(points.shape[1]):
+        dx = np.zeros(points.shape[1])
+        dx[j] = EPS
+        d_dx.append((transform.apply(points + dx) -
+                     transform.apply(points - dx)) / (2 * EPS))
+    return np.stack(d_dx, axis=2)
+
+
+def homogeneous_transforms():
+    h_matrix = np.array([[1.2, 0.1, 0.5],
+                         [-0.2, 0.9, 1.5],
+                         [0.01, 0.02, 1.0]])
+    return [Homogeneous(h_matrix),
+            Affine.init_from_2d_shear(10, 20).compose_before(
+                Translation([1, 2])),
+            Similarity(Rotation.init_from_2d_ccw_angle(30).compose_before(
+                UniformScale(1.5, 2)).h_matrix),
+            AlignmentSimilarity(src, tgt),
+            Translation([1, -2]),
+            UniformScale(1.5, 2),
+            NonUniformScale([1.5, 0.5])]
+
+
+def test_homogeneous_d_dp():
+    for t in homogeneous_transforms():
+        d_dp = t.d_dp(points)
+        assert d_dp.shape == (points.shape[0], t.n_parameters, 2)
+        assert_allclose(d_dp, numerical_d_dp(t, points), atol=1e-6)
+
+
+def test_homogeneous_d_dx():
+    for t in homogeneous_transforms():
+        assert_allclose(t.d_dx(points), numerical_d_dx(t, points), atol=1e-6)
+
+
+def test_rotation_3d_d_dp():
+    rotation = Rotation.init_from_3d_ccw_angle_around_x(30).compose_before(
+        Rotation.init_from_3d_ccw_angle_around_y(-50))
+    points_3d = np.hstack([points, points[:, :1] - 1])
+    assert_allclose(rotation.d_dp(points_3d),
+                    numerical_d_dp(rotation, points_3d), atol=1e-6)
+
+
+@raises(NotImplementedError)
+def test_rotation_2d_d_dp_raises():
+    Rotation.init_from_2d_ccw_angle(30).d_dp(points)
+
+
+def test_rbf_d_dx():
+    for rbf in [R2LogR2RBF(src.points), R2LogRRBF(src.points)]:
+        assert_allclose(rbf.d_dx(points), numerical_d_dx(rbf, points),
+                        atol=1e-5)
+        # The derivative is 0 on the centres
+        assert_allclose(rbf.d_dx(src.points)[np.arange(5), np.arange(5)], 0)
+
+
+def test_tps_d_dp():
+    tps = ThinPlateSplines(src, tgt)
+    assert_allclose(tps.d_dp(points), numerical_d_dp_target(tps, points),
+                    atol=1e-6)
+
+
+def test_tps_d_dx():
+    tps = ThinPlateSplines(src, tgt)
+    assert_allclose(tps.d_dx(points), numerical_d_dx(tps, points), atol=1e-5)
+
+
+def test_pwa_d_dp():
+    for cls in [PiecewiseAffine, PythonPWA, CythonPWA]:
+        pwa = cls(src, tgt)
+        assert_allclose(pwa.d_dp(points), numerical_d_dp_target(pwa, points),
+                        atol=1e-6)
+
+
+def test_pwa_d_dx():
+    for cls in [PiecewiseAffine, PythonPWA, CythonPWA]:
+        pwa = cls(src, tgt)
+        assert_allclose(pwa.d_dx(points), numerical_d_dx(pwa, points),
+                        atol=1e-6)
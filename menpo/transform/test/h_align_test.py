@@ -6,6 +6,7 @@ from menpo.transform import (Affine, AlignmentAffine,
                              Rotation, AlignmentRotation,
                              Translation, AlignmentTranslation,
                              UniformScale, AlignmentUniformScale)
+from menpo.transform.homogeneous.similarity import procrustes_alignment
 
 # TODO check composition works correctly on all alignment methods
 
@@ -92,6 +93,17 @@ def test_align_2d_affine_as_non_alignment():
     assert(type(non_align) == Affine)
 
 
+def test_align_2d_affine_pseudoinverse_set_target():
+    source = PointCloud(np.random.randn(10, 2))
+    target = PointCloud(np.random.randn(10, 2))
+    inverse = AlignmentAffine(source, target).pseudoinverse()
+    new_target = PointCloud(np.random.randn(10, 2))
+    inverse.set_target(new_target)
+    a, b = inverse.source.h_points(), new_target.h_points()
+    assert_allclose(inverse.h_matrix,
+                    np.linalg.solve(a.dot(a.T), a.dot(b.T)).T, atol=1e-8)
+
+
 # TODO check from_vector, from_vector_inplace works correctly
 
 
@@ -139,6 +151,45 @@ def test_align_2d_similarity_set_target():
                     estimate.h_matrix)
 
 
+def test_align_2d_similarity_matches_procrustes():
+    source = PointCloud(np.random.randn(15, 2) * 40 + 200)
+    targets = [PointCloud(np.random.randn(15, 2) * 10 - 50),
+               PointCloud(source.points * [1, -1] +
+                          np.random.randn(15, 2))]
+    for rotation in [True, False]:
+        for allow_mirror in [True, False]:
+            estimate = AlignmentSimilarity(source, source, rotation=rotation,
+                                           allow_mirror=allow_mirror)
+            for target in targets:
+                estimate.set_target(target)
+                expected = procrustes_alignment(source, target,
+                                                rotation=rotation,
+                                                allow_mirror=allow_mirror)
+                assert_allclose(estimate.h_matrix, expected.h_matrix,
+                                atol=1e-10)
+
+
+def test_align_3d_similarity_set_target():
+    source = PointCloud(np.random.randn(10, 3))
+    target = PointCloud(np.random.randn(10, 3))
+    estimate = AlignmentSimilarity(source, source)
+    estimate.set_target(target)
+    assert_allclose(estimate.h_matrix,
+                    procrustes_alignment(source, target).h_matrix,
+                    atol=1e-10)
+
+
+def test_align_2d_similarity_pseudoinverse_set_target():
+    source = PointCloud(np.random.randn(10, 2))
+    target = PointCloud(np.random.randn(10, 2))
+    inverse = AlignmentSimilarity(source, target).pseudoinverse()
+    new_target = PointCloud(np.random.randn(10, 2))
+    inverse.set_target(new_target)
+    assert_allclose(inverse.h_matrix,
+                    procrustes_alignment(inverse.source,
+                                         new_target).h_matrix, atol=1e-10)
+
+
 # ROTATION
 
 def test_align_2d_rotation():
@@ -306,3 +357,41 @@ def test_align_2d_translation_from_vector():
     # check the new estimate has the source and target correct
     assert_allclose(new_est.source.points, source.points)
     assert_allclose(new_est.target.points, target.points)
+
+
+def test_align_2d_similarity_precomputed_h_matrix():
+    source = PointCloud(np.array([[0, 1], [1, 1], [-1, -5], [3, -5]]))
+    target = Similarity(np.array([[1.2, -0.4, 3], [0.4, 1.2, -1],
+                                  [0, 0, 1]])).apply(source)
+    estimated = AlignmentSimilarity(source, target)
+    given = AlignmentSimilarity(source, target, h_matrix=estimated.h_matrix)
+    assert_allclose(given.h_matrix, estimated.h_matrix)
+    assert given.rotation
+    # the given transform updates with its target like an estimated one
+    new_target = PointCloud(target.points + 1)
+    given.set_target(new_target)
+    estimated.set_target(new_target)
+    assert_allclose(given.h_matrix, estimated.h_matrix)
+
+
+def test_align_2d_similarity_unpickles_old_state():
+    source = PointCloud(np.array([[0, 1], [1, 1], [-1, -5], [3, -5]]))
+    transform = AlignmentSimilarity(source, source)
+    state = transform.__dict__.copy()
+    del state['rotation'], state['_source_stats']
+    old = AlignmentSimilarity.__new__(AlignmentSimilarity)
+    old.__setstate__(state)
+    assert old.rotation
+    old.set_target(PointCloud(source.points * 2))
+    assert_allclose(old.apply(source).points, source.points * 2)
+
+
+def test_align_2d_affine_unpickles_old_state():
+    source = PointCloud(np.array([[0, 1], [1, 1], [-1, -5], [3, -5]]))
+    transform = AlignmentAffine(source, source)
+    state = transform.__dict__.copy()
+    del state['_source_projector']
+    old = AlignmentAffine.__new__(AlignmentAffine)
+    old.__setstate__(state)
+    old.set_target(PointCloud(source.points * 2))
+    assert_allclose(old.apply(source).points, source.points * 2, atol=1e-10)
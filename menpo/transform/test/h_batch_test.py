@@ -0,0 +1,124 @@
+import numpy as np
+from numpy.testing import assert_allclose
+from nose.tools import raises
+
+from menpo.shape import PointCloud
+from menpo.transform import (HomogeneousBatch, Homogeneous, Affine,
+                             Similarity, AlignmentSimilarity, Translation,
+                             UniformScale, Rotation)
+
+
+def random_similarities(n):
+    return [Rotation.init_from_2d_ccw_angle(np.random.rand() * 360)
+            .compose_before(UniformScale(np.random.rand() + 0.5, 2))
+            .compose_before(Translation(np.random.randn(2)))
+            for _ in range(n)]
+
+
+def test_batch_init_from_transforms_cls():
+    similarities = random_similarities(3)
+    assert (HomogeneousBatch.init_from_transforms(similarities)
+            .transform_cls is Similarity)
+    affine = Affine.init_from_2d_shear(10, 5)
+    assert (HomogeneousBatch.init_from_transforms(similarities + [affine])
+            .transform_cls is Affine)
+    homog = Homogeneous(np.eye(3))
+    assert (HomogeneousBatch.init_from_transforms(similarities + [homog])
+            .transform_cls is Homogeneous)
+
+
+def test_batch_apply():
+    transforms = random_similarities(4)
+    batch = HomogeneousBatch.init_from_transforms(transforms)
+    x = np.random.rand(4, 10, 2)
+    y = batch.apply(x)
+    for t, x_i, y_i in zip(transforms, x, y):
+        assert_allclose(y_i, t.apply(x_i))
+    # A single shape is transformed by every transform
+    y = batch.apply(x[0])
+    for t, y_i in zip(transforms, y):
+        assert_allclose(y_i, t.apply(x[0]))
+
+
+def test_batch_apply_projective_out():
+    h_matrices = np.tile(np.eye(3), (2, 1, 1))
+    h_matrices[:, 2, :2] = [[0.1, 0.2], [-0.3, 0.05]]
+    batch = HomogeneousBatch(h_matrices)
+    x = np.random.rand(2, 10, 2)
+    out = np.empty_like(x)
+    assert batch.apply(x, out=out) is out
+    for h, x_i, y_i in zip(h_matrices, x, out):
+        assert_allclose(y_i, Homogeneous(h).apply(x_i))
+
+
+def test_batch_compose():
+    transforms = random_similarities(3)
+    others = random_similarities(3)
+    batch = HomogeneousBatch.init_from_transforms(transforms)
+    other_batch = HomogeneousBatch.init_from_transforms(others)
+    before = batch.compose_before(other_batch)
+    after = batch.compose_after(other_batch)
+    assert before.transform_cls is Similarity
+    for t, o, b, a in zip(transforms, others, before, after):
+        assert_allclose(b.h_matrix, t.compose_before(o).h_matrix)
+        assert_allclose(a.h_matrix, t.compose_after(o).h_matrix)
+    # Composing with a single transform broadcasts
+    shear = Affine.init_from_2d_shear(10, 5)
+    before = batch.compose_before(shear)
+    assert before.transform_cls is Affine
+    for t, b in zip(transforms, before):
+        assert_allclose(b.h_matrix, t.compose_before(shear).h_matrix)
+
+
+def test_batch_pseudoinverse():
+    transforms = random_similarities(3) + [Affine.init_from_2d_shear(10, 5)]
+    batch = HomogeneousBatch.init_from_transforms(transforms)
+    for t, inv in zip(transforms, batch.pseudoinverse()):
+        assert_allclose(inv.h_matrix, t.pseudoinverse().h_matrix)
+
+
+def test_batch_vector_round_trip():
+    transforms = random_similarities(3)
+    for cls in [Similarity, Affine, Homogeneous]:
+        batch = HomogeneousBatch.init_from_transforms(transforms)
+        batch.transform_cls = cls
+        vectors = batch.as_vector()
+        for t, v in zip(transforms, vectors):
+            assert_allclose(v, cls(t.h_matrix).as_vector())
+        rebuilt = batch.from_vector(vectors)
+        assert_allclose(rebuilt.h_matrices, batch.h_matrices)
+
+
+def test_batch_procrustes_alignment():
+    target = PointCloud(np.random.randn(10, 2))
+    sources = [t.apply(target) for t in random_similarities(5)]
+    # Include a mirrored shape to exercise the Kabsch check
+    sources.append(PointCloud(target.points * [1, -1] + 0.1 *
+                              np.random.randn(10, 2)))
+    for allow_mirror in [False, True]:
+        batch = HomogeneousBatch.init_procrustes_alignment(
+            sources, target, allow_mirror=allow_mirror)
+        for s, t in zip(sources, batch):
+            expected = AlignmentSimilarity(s, target,
+                                           allow_mirror=allow_mirror)
+            assert_allclose(t.h_matrix, expected.h_matrix, atol=1e-10)
+    # Per-source targets
+    targets = np.array([s.points[::-1] for s in sources])
+    for rotation in [True, False]:
+        batch = HomogeneousBatch.init_procrustes_alignment(
+            sources, targets, rotation=rotation)
+        for s, tgt, t in zip(sources, targets, batch):
+            expected = AlignmentSimilarity(s, PointCloud(tgt),
+                                           rotation=rotation)
+            assert_allclose(t.h_matrix, expected.h_matrix, atol=1e-10)
+
+
+@raises(ValueError)
+def test_batch_compose_mismatched_raises():
+    HomogeneousBatch.init_identity(3, 2).compose_before(
+        HomogeneousBatch.init_identity(2, 2))
+
+
+@raises(ValueError)
+def test_batch_not_square_raises():
+    HomogeneousBatch(np.ones((2, 3, 4)))
@@ -501,6 +501,48 @@ def test_homogeneous_apply_batched():
     assert_allclose(p_applied, p_manual)
 
 
+def test_homogeneous_apply_projective():
+    h_matrix = np.array([[1.5, 0.2, 1.0],
+                         [0.1, 0.9, -2.0],
+                         [0.01, 0.02, 1.0]])
+    p = np.random.rand(10, 2)
+    h_p = np.hstack([p, np.ones([10, 1])]).dot(h_matrix.T)
+    p_manual = h_p[:, :2] / h_p[:, 2:]
+    assert_allclose(Homogeneous(h_matrix).apply(p), p_manual)
+
+
+def test_homogeneous_apply_out():
+    e = np.eye(3) * 2
+    e[2, 2] = 1
+    e[:2, -1] = [2, 3]
+    p = np.random.rand(10, 2)
+    p_manual = p * 2 + np.array([2, 3])
+    for h in [Homogeneous(e), Affine(e)]:
+        out = np.empty_like(p)
+        p_applied = h.apply(p, out=out)
+        assert p_applied is out
+        assert_allclose(out, p_manual)
+        out = np.empty_like(p)
+        h.apply(p, batch_size=3, out=out)
+        assert_allclose(out, p_manual)
+
+
+def test_affine_apply_out_inplace():
+    p = np.random.rand(10, 2)
+    p_manual = p * 2 + np.array([2, 3])
+    a = Affine.init_from_2d_shear(0, 0).compose_before(
+        UniformScale(2, 2)).compose_before(Translation([2, 3]))
+    a.apply(p, out=p)
+    assert_allclose(p, p_manual)
+
+
+@raises(ValueError)
+def test_homogeneous_apply_out_transformable_raises():
+    from menpo.shape import PointCloud
+    pc = PointCloud(np.random.rand(10, 2))
+    Translation([1, 2]).apply(pc, out=np.empty((10, 2)))
+
+
 def test_homogeneous_as_vector():
     e = np.eye(3) * 2
     e[2, 2] = 1
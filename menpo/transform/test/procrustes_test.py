@@ -2,7 +2,8 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from menpo.shape import PointCloud
-from menpo.transform import GeneralizedProcrustesAnalysis
+from menpo.transform import (GeneralizedProcrustesAnalysis,
+                             generalized_procrustes)
 
 
 def test_procrustes_no_target():
@@ -58,3 +59,24 @@ def test_procrustes_with_target():
     mean = np.array([[2.0, -0.5], [4.5, 1.8], [6.0, 0.5], [3.5, -1.8]])
     assert_allclose(np.around(gpa.mean_aligned_shape().points, decimals=1),
                     mean)
+
+
+def test_generalized_procrustes_array():
+    sources = [PointCloud(np.random.randn(10, 2)) for _ in range(5)]
+    gpa = GeneralizedProcrustesAnalysis(sources)
+    h_matrices, target, n_iterations, converged = generalized_procrustes(
+        np.array([s.points for s in sources]))
+    assert converged == gpa.converged
+    assert n_iterations == gpa.n_iterations
+    assert_allclose(target, gpa.target.points)
+    for h, t in zip(h_matrices, gpa.transforms):
+        assert_allclose(h, t.h_matrix)
+
+
+def test_generalized_procrustes_not_converged():
+    sources = np.random.randn(5, 10, 2)
+    _, _, n_iterations, converged = generalized_procrustes(sources,
+                                                           max_iterations=1,
+                                                           tolerance=0)
+    assert not converged
+    assert n_iterations == 2
@@ -1,3 +1,4 @@
+import pickle
 import menpo
 from numpy.testing import assert_equal
 from menpo.transform.piecewiseaffine.base import (CythonPWA, CachedPWA,
@@ -52,3 +53,55 @@ def test_cached_pwa_forgets_cache():
     # should clear cache and be fine
     r2 = cached_pwa.apply(points)
     assert_equal(r1, r2)
+
+
+def test_cython_pwa_copy_shares_source_triangles():
+    cython = CythonPWA(src, tgt)
+    r1 = cython.apply(points)
+    copied = cython.copy()
+    assert (copied._fastpwa.source_triangles is
+            cython._fastpwa.source_triangles)
+    assert copied._fastpwa.n_cached == cython._fastpwa.n_cached
+    assert_equal(copied.apply(points), r1)
+
+
+def test_cython_pwa_pickle_warm_cache():
+    cython = CythonPWA(src, tgt)
+    r1 = cython.apply(points)
+    unpickled = pickle.loads(pickle.dumps(cython))
+    assert unpickled._fastpwa.n_cached == cython._fastpwa.n_cached
+    assert_equal(unpickled.apply(points), r1)
+
+
+def test_cython_pwa_bounded_cache():
+    cython = CythonPWA(src, tgt, cache_size=100)
+    r1 = cython.apply(points)
+    assert cython.n_cached == 100
+    stats = cython.cache_stats
+    assert stats['misses'] == points.shape[0]
+    assert stats['evictions'] == points.shape[0] - 100
+    # the most recent points are still cached
+    assert_equal(cython.apply(points[-50:]), r1[-50:])
+    assert cython.cache_stats['hits'] == 50
+
+
+def test_cython_pwa_cache_size_setter():
+    cython = CythonPWA(src, tgt, cache_size=None)
+    cython.apply(points)
+    assert cython.n_cached == points.shape[0]
+    cython.cache_size = 10
+    assert cython.n_cached == 10
+    cython.cache_size = 0
+    r1 = cython.apply(points)
+    assert cython.n_cached == 0
+    assert_equal(r1, PythonPWA(src, tgt).apply(points))
+
+
+def test_cython_pwa_clear_cache():
+    cython = CythonPWA(src, tgt)
+    cython.apply(points)
+    cython.apply(points)
+    assert cython.cache_stats['hits'] == points.shape[0]
+    cython.clear_cache()
+    assert cython.n_cached == 0
+    assert cython.cache_stats == {'hits': 0, 'misses': 0, 'evictions': 0}
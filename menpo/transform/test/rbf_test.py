@@ -22,3 +22,10 @@ def test_rbf_r2logr_apply():
                          [0.87625673, 11.86079176, 0.53696079, 11.20008815],
                          [15.9269609, 13.83726877, 2.05820995, 0.84946412]])
     assert_allclose(result, expected)
+
+
+def test_rbf_apply_on_centres_is_zero():
+    for rbf in [R2LogR2RBF(centers), R2LogRRBF(centers)]:
+        result = rbf.apply(centers)
+        assert np.all(np.isfinite(result))
+        assert_allclose(np.diag(result), 0)
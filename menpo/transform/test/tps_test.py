@@ -67,3 +67,79 @@ def test_tps_apply_batched():
     result = tps.apply(pts, batch_size=2)
     expected = np.array([[-0.2, -2.], [-1., 2.], [4.2, -5.]])
     assert_allclose(result.points, expected)
+
+
+def test_tps_set_target_matches_new():
+    tps = ThinPlateSplines(src, tgt)
+    tps.set_target(tgt_perturbed)
+    expected = ThinPlateSplines(src, tgt_perturbed)
+    assert_allclose(tps.coefficients, expected.coefficients)
+    assert_allclose(tps.apply(square_sample_points),
+                    expected.apply(square_sample_points))
+
+
+def test_tps_pseudoinverse_maps_tgt_to_src():
+    tps = ThinPlateSplines(src, tgt_perturbed)
+    tps_pinv = tps.pseudoinverse()
+    assert_allclose(tps_pinv.kernel.c, perturbed_tgt_landmarks)
+    assert_allclose(tps_pinv.apply(perturbed_tgt_landmarks),
+                    square_src_landmarks, atol=1e-10)
+
+
+def test_tps_pseudoinverse_twice_reuses_factorisation():
+    tps = ThinPlateSplines(src, tgt_perturbed)
+    tps_pinv_pinv = tps.pseudoinverse().pseudoinverse()
+    assert tps_pinv_pinv.kernel is tps.kernel
+    assert_allclose(tps_pinv_pinv.apply(square_sample_points),
+                    tps.apply(square_sample_points))
+
+
+def test_tps_apply_in_blocks():
+    from menpo.transform import thinplatesplines
+    tps = ThinPlateSplines(src, tgt_perturbed)
+    expected = tps.apply(square_sample_points)
+    block_size = thinplatesplines._APPLY_BLOCK_SIZE
+    try:
+        # 4 centres, so blocks of 3 points
+        thinplatesplines._APPLY_BLOCK_SIZE = 12
+        assert_allclose(tps.apply(square_sample_points), expected)
+    finally:
+        thinplatesplines._APPLY_BLOCK_SIZE = block_size
+
+
+def test_tps_v_y():
+    tps = ThinPlateSplines(src, tgt_perturbed)
+    assert_allclose(tps.v, perturbed_tgt_landmarks.T)
+    assert tps.y.shape == (2, 7)
+    assert_allclose(tps.y[:, :4], tps.v)
+    assert_allclose(tps.y[:, 4:], 0)
+    assert_allclose(tps.coefficients, np.linalg.pinv(tps.l).dot(tps.y.T),
+                    atol=1e-10)
+
+
+def test_tps_v_follows_target():
+    tps = ThinPlateSplines(src, tgt)
+    tps.set_target(tgt_perturbed)
+    assert_allclose(tps.v, perturbed_tgt_landmarks.T)
+
+
+def test_tps_pseudoinverse_custom_kernel():
+    from menpo.transform import R2LogR2RBF
+
+    class ScaledRBF(R2LogR2RBF):
+        def __init__(self, c, scale):
+            super(ScaledRBF, self).__init__(c)
+            self.scale = scale
+
+        def _apply(self, x, **kwargs):
+            return self.scale * super(ScaledRBF, self)._apply(x, **kwargs)
+
+    kernel = ScaledRBF(src.points, 2.0)
+    tps = ThinPlateSplines(src, tgt_perturbed, kernel=kernel)
+    tps_pinv = tps.pseudoinverse()
+    assert type(tps_pinv.kernel) is ScaledRBF
+    assert tps_pinv.kernel.scale == 2.0
+    assert_allclose(tps_pinv.kernel.c, perturbed_tgt_landmarks)
+    assert_allclose(tps.kernel.c, square_src_landmarks)
+    assert_allclose(tps_pinv.apply(perturbed_tgt_landmarks),
+                    square_src_landmarks, atol=1e-10)
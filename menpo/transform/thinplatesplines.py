@@ -1,10 +1,16 @@
 import numpy as np
-from .base import Transform, Alignment, Invertible
+from .base import Transform, Alignment, Invertible, DP, DX
 from .rbf import R2LogR2RBF
 
 
+# The maximum number of kernel values evaluated at once when applying a TPS.
+# Points are processed in blocks of at most this many (point, centre) pairs
+# so that memory use doesn't grow with the number of points.
+_APPLY_BLOCK_SIZE = 2 ** 16
+
+
 # Note we inherit from Alignment first to get it's n_dims behavior
-class ThinPlateSplines(Alignment, Transform, Invertible):
+class ThinPlateSplines(Alignment, Transform, Invertible, DP, DX):
     r"""
     The thin plate splines (TPS) alignment between 2D `source` and `target`
     landmarks.
@@ -49,34 +55,58 @@ class ThinPlateSplines(Alignment, Transform, Invertible):
         top_l = np.concatenate([self.k, self.p], axis=1)
         bot_l = np.concatenate([self.p.T, o], axis=1)
         self.l = np.concatenate([top_l, bot_l], axis=0)
-        self.v, self.y, self.coefficients = None, None, None
+        # l only depends on the source, so is only inverted once. Changing
+        # the target then only requires a single matrix product.
+        self._inv_l = _truncated_pinv(self.l, min_singular_val)
+        # The source dependent state of the TPS this is the pseudoinverse
+        # of, if any
+        self._inverse_source_state = None
+        self.coefficients = None
         self._build_coefficients()
 
     def _build_coefficients(self):
-        self.v = self.target.points.T.copy()
-        self.y = np.hstack([self.v, np.zeros([2, 3])])
-
-        # If two points are coincident, or very close to being so, then the
-        # matrix is rank deficient and thus not-invertible. Therefore,
-        # only take the inverse on the full-rank set of indices.
-        _u, _s, _v = np.linalg.svd(self.l)
-        keep = _s.shape[0] - sum(_s < self.min_singular_val)
-        inv_l = _u[:, :keep].dot(1.0 / _s[:keep, None] * _v[:keep, :])
-        self.coefficients = inv_l.dot(self.y.T)
+        # The right hand side is the target points padded with 3 rows of
+        # zeros, so only the first n_points columns of inv(l) contribute
+        self.coefficients = self._inv_l[:, :self.n_points].dot(
+            self.target.points)
 
     def _sync_state_from_target(self):
         # now the target is updated, we only have to rebuild the
         # coefficients.
         self._build_coefficients()
 
-    def _apply(self, points, **kwargs):
+    @property
+    def v(self):
+        r"""
+        The target points, one column per point.
+
+        :type: ``(2, n_points)`` `ndarray`
+        """
+        return self.target.points.T.copy()
+
+    @property
+    def y(self):
+        r"""
+        The right hand side of the TPS linear system: :attr:`v` padded with
+        3 columns of zeros.
+
+        :type: ``(2, n_points + 3)`` `ndarray`
+        """
+        return np.hstack([self.v, np.zeros([2, 3])])
+
+    def _apply(self, points, out=None, **kwargs):
         r"""
         Performs a TPS transform on the given points.
 
+        The kernel is evaluated on blocks of points at a time, so the
+        ``(n_points, n_centres)`` kernel matrix is never built in full.
+
         Parameters
         ----------
         points : ``(N, D)`` `ndarray`
             The points to transform.
+        out : ``(N, D)`` `ndarray`, optional
+            If provided, the result is written into this array.
 
         Returns
         -------
@@ -90,23 +120,72 @@ class ThinPlateSplines(Alignment, Transform, Invertible):
         """
         if points.shape[1] != self.n_dims:
             raise ValueError('TPS can only be applied to 2D data.')
-        x = points[..., 0][:, None]
-        y = points[..., 1][:, None]
-        # calculate the affine coefficients of the warp
-        # (C = Constant component, then X, Y respectively)
-        c_affine_c = self.coefficients[-3]
-        c_affine_x = self.coefficients[-2]
-        c_affine_y = self.coefficients[-1]
-        # the affine warp component
-        f_affine = c_affine_c + c_affine_x * x + c_affine_y * y
-        # calculate a distance matrix (for L2 Norm) between every source
-        # and the target
-        kernel_dist = self.kernel.apply(points)
-        # grab the affine free components of the warp
+        if out is None:
+            out = np.empty((points.shape[0], self.n_dims))
+        # the affine free coefficients (one per kernel centre), then the
+        # affine coefficients (C = Constant component, then X, Y respectively)
         c_affine_free = self.coefficients[:-3]
-        # build the affine free warp component
-        f_affine_free = kernel_dist.dot(c_affine_free)
-        return f_affine + f_affine_free
+        c_affine_c = self.coefficients[-3]
+        c_affine_xy = self.coefficients[-2:]
+        block_size = max(1, _APPLY_BLOCK_SIZE // c_affine_free.shape[0])
+        for lo in range(0, points.shape[0], block_size):
+            block = points[lo:lo + block_size]
+            # the affine free warp component from the kernel between every
+            # point of the block and every source
+            f = self.kernel.apply(block).dot(c_affine_free)
+            # plus the affine warp component
+            f += np.dot(block, c_affine_xy)
+            f += c_affine_c
+            out[lo:lo + block_size] = f
+        return out
+
+    def d_dp(self, points):
+        r"""
+        The derivative of this transform with respect to the target points
+        (flattened as ``target.as_vector()``), evaluated at ``points``. The
+        TPS is linear in the target, so this does not depend on it.
+
+        Parameters
+        ----------
+        points : ``(n_points, 2)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dp : ``(n_points, n_landmarks * 2, 2)`` `ndarray`
+            The derivative of each transformed point with respect to each
+            target coordinate.
+        """
+        n = self.n_points
+        inv_l = self._inv_l[:, :n]
+        # how much each target point contributes to each transformed point
+        weights = self.kernel.apply(points).dot(inv_l[:n])
+        weights += inv_l[n]
+        weights += points.dot(inv_l[n + 1:])
+        d_dp = weights[..., None, None] * np.eye(self.n_dims)
+        return d_dp.reshape([points.shape[0], -1, self.n_dims])
+
+    def d_dx(self, points):
+        r"""
+        The derivative of this transform with respect to the input points,
+        evaluated at ``points``. Requires the kernel to implement ``d_dx``.
+
+        Parameters
+        ----------
+        points : ``(n_points, 2)`` `ndarray`
+            The points at which the derivative is evaluated.
+
+        Returns
+        -------
+        d_dx : ``(n_points, 2, 2)`` `ndarray`
+            The Jacobian of the transform at each point.
+        """
+        # the kernel derivatives weighted by the affine free coefficients,
+        # plus the affine coefficients
+        d_dx = np.einsum('kvj,vi->kij', self.kernel.d_dx(points),
+                         self.coefficients[:-3])
+        d_dx += self.coefficients[-2:].T
+        return d_dx
 
     @property
     def has_true_inverse(self):
@@ -122,6 +201,46 @@ class ThinPlateSplines(Alignment, Transform, Invertible):
         the transforms parameters. If the transform has a true inverse this
         is returned instead.
 
+        The kernel of the pseudoinverse is a copy of this one, re-centred on
+        the `target`. Taking the pseudoinverse of a pseudoinverse
+        reuses the kernel and factorisation of the original transform.
+
         :type: ``type(self)``
         """
-        return ThinPlateSplines(self.target, self.source, kernel=self.kernel)
+        source_state = self._inverse_source_state
+        if source_state is not None and source_state[0] is self.target:
+            # We are the pseudoinverse of a TPS whose source is our target, so
+            # its kernel and factorisation (which only depend on the source)
+            # can be reused directly
+            pinv = ThinPlateSplines.__new__(ThinPlateSplines)
+            Alignment.__init__(pinv, self.target, self.source)
+            (_, pinv.min_singular_val, pinv.kernel, pinv.k, pinv.p, pinv.l,
+             pinv._inv_l) = source_state
+            pinv._build_coefficients()
+        else:
+            # The kernel is centred on the source, which is the target of the
+            # pseudoinverse. It is copied (rather than rebuilt from its
+            # centres) to keep any other state of user defined kernels
+            kernel = self.kernel.copy()
+            kernel.c = self.target.points
+            pinv = ThinPlateSplines(self.target, self.source, kernel=kernel,
+                                    min_singular_val=self.min_singular_val)
+        # Only keep the state that depends on our source (not a reference to
+        # self), so that chains of pseudoinverses don't keep each other alive
+        pinv._inverse_source_state = (self.source, self.min_singular_val,
+                                      self.kernel, self.k, self.p, self.l,
+                                      self._inv_l)
+        return pinv
+
+
+def _truncated_pinv(l, min_singular_val):
+    r"""
+    The pseudoinverse of ``l``, dropping singular values smaller than
+    ``min_singular_val``.
+    """
+    # If two points are coincident, or very close to being so, then the
+    # matrix is rank deficient and thus not-invertible. Therefore,
+    # only take the inverse on the full-rank set of indices.
+    _u, _s, _v = np.linalg.svd(l)
+    keep = _s.shape[0] - sum(_s < min_singular_val)
+    return _u[:, :keep].dot(1.0 / _s[:keep, None] * _v[:keep, :])
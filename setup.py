@@ -49,7 +49,8 @@ def no_cythonize(extensions, **_ignore):
     return extensions
 
 
-def build_extension_from_pyx(pyx_path, extra_sources_paths=None):
+def build_extension_from_pyx(pyx_path, extra_sources_paths=None,
+                             openmp=False):
     if extra_sources_paths is None:
         extra_sources_paths = []
     extra_sources_paths.insert(0, pyx_path)
@@ -59,6 +60,13 @@ def build_extension_from_pyx(pyx_path, extra_sources_paths=None):
                     language='c++')
     if IS_LINUX or IS_OSX:
         ext.extra_compile_args.append('-Wno-unused-function')
+    # prange loops run serially where OpenMP is not enabled (the default
+    # OSX compiler does not support it)
+    if openmp and IS_LINUX:
+        ext.extra_compile_args.append('-fopenmp')
+        ext.extra_link_args.append('-fopenmp')
+    elif openmp and IS_WIN:
+        ext.extra_compile_args.append('/openmp')
     return ext
 
 try:
@@ -83,7 +91,8 @@ cython_modules = [
                              'menpo/feature/cpp/LBP.cpp']),
     build_extension_from_pyx('menpo/feature/_gradient.pyx'),
     build_extension_from_pyx('menpo/image/patches.pyx'),
-    build_extension_from_pyx('menpo/shape/mesh/normals.pyx')
+    build_extension_from_pyx('menpo/shape/mesh/normals.pyx', openmp=True),
+    build_extension_from_pyx('menpo/shape/mesh/decimation.pyx')
 ]
 cython_exts = cythonize(cython_modules, quiet=True)
 